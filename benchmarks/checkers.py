@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+"""
+Checkers that our benchmarks run visitors with.
+
+``Checker.parse_options`` stores options, selected visitors,
+the results cache, and the profiler in the class itself.
+So, benchmarks parse the default options only for the block
+they are run in, and the previous state is restored afterwards.
+"""
+
+import argparse
+import ast
+import io
+import tokenize
+from contextlib import ExitStack, contextmanager
+from typing import Iterator
+from unittest.mock import patch
+
+from wemake_python_styleguide.checker import Checker, VisitorClass
+from wemake_python_styleguide.options.config import Configuration
+from wemake_python_styleguide.types import Final
+from wemake_python_styleguide.visitors.base import BaseVisitor
+from wemake_python_styleguide.visitors.index import NodeIndex
+
+#: Class attributes of ``Checker`` that are set by ``parse_options``:
+_CHECKER_STATE: Final = ('options', 'selection', 'cache', 'profiler')
+
+
+def default_options() -> argparse.Namespace:
+    """Returns options with the default values of our plugin."""
+    return argparse.Namespace(**{
+        option.attribute_name: option.default
+        for option in Configuration.options
+    })
+
+
+@contextmanager
+def default_checker_options() -> Iterator[None]:
+    """Parses the default options for the block, then restores the class."""
+    with ExitStack() as stack:
+        for name in _CHECKER_STATE:
+            stack.enter_context(patch.object(Checker, name, None, create=True))
+        Checker.parse_options(default_options())
+        yield
+
+
+def create_checker(filename: str, source: str) -> Checker:
+    """
+    Creates checker with the prebuilt node index.
+
+    Its visitors can only be run with parsed options,
+    see :func:`default_checker_options`.
+    """
+    tree = ast.parse(source)
+    checker = Checker(
+        tree=tree,
+        file_tokens=list(
+            tokenize.generate_tokens(io.StringIO(source).readline),
+        ),
+        filename=filename,
+        lines=source.splitlines(keepends=True),
+    )
+    checker.index = NodeIndex(tree)
+    return checker
+
+
+def run_visitor(visitor_class: VisitorClass, checker: Checker) -> BaseVisitor:
+    """Runs a single visitor on the already parsed module, returns it."""
+    visitor = visitor_class.from_checker(checker)
+    visitor.run()
+    return visitor
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+"""Command line options and output that are shared by all benchmarks."""
+
+import argparse
+import sys
+
+from benchmarks.results import (
+    MIN_TIME,
+    REPEAT,
+    THRESHOLD,
+    Timings,
+    compare,
+    format_regressions,
+    load,
+    save,
+)
+
+
+def create_parser(prog: str) -> argparse.ArgumentParser:
+    """Creates parser with options shared by all benchmarks."""
+    parser = argparse.ArgumentParser(prog=prog)
+    parser.add_argument(
+        '--output',
+        help='File to write results to.',
+    )
+    parser.add_argument(
+        '--baseline',
+        help='File with results to compare with, fails on regressions.',
+    )
+    parser.add_argument('--threshold', type=float, default=THRESHOLD)
+    return parser
+
+
+def add_measure_options(parser: argparse.ArgumentParser) -> None:
+    """Adds options for benchmarks that are measured many times."""
+    parser.add_argument('--min-time', type=float, default=MIN_TIME)
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    parser.add_argument(
+        '-k',
+        '--filter',
+        default='',
+        help='Only run benchmarks with this substring in their names.',
+    )
+
+
+def report(arguments: argparse.Namespace, timings: Timings) -> int:
+    """
+    Prints and saves timings, compares them with the baseline.
+
+    Returns the exit code: ``1`` when there are regressions.
+    """
+    for name, timing in sorted(timings.items()):
+        sys.stdout.write('{0}: {1:.3f} ms\n'.format(name, timing * 1000))
+
+    if arguments.output:
+        save(arguments.output, timings)
+    if not arguments.baseline:
+        return 0
+
+    regressions = compare(
+        load(arguments.baseline),
+        timings,
+        arguments.threshold,
+    )
+    if regressions:
+        sys.stdout.write('\nRegressions:\n')
+        sys.stdout.write(format_regressions(regressions))
+    return int(bool(regressions))
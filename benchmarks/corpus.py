@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+"""
+Macro benchmark that checks a whole corpus of modules end to end.
+
+By default the corpus is the standard library of the current interpreter,
+any other directory can be passed instead:
+
+.. code:: bash
+
+    python -m benchmarks.corpus
+    python -m benchmarks.corpus your_package --flake8 --output corpus.json
+
+Modules are checked by our ``Checker`` directly in this process,
+so the numbers do not include any ``flake8`` overhead.
+Modules that can not be parsed are skipped.
+We report files and ``ast`` nodes per second,
+peak memory, and how many times each violation was found.
+
+With ``--flake8`` the same directory is also checked by ``flake8``
+in a subprocess twice: with our violations selected,
+and with only syntax errors selected.
+``flake8`` still runs our plugin in the second run,
+but all our visitors are skipped, as their violations are disabled.
+So, the second run is the overhead of ``flake8`` itself
+together with the fixed cost of our plugin, like building the node index.
+The difference between these runs is the cost of our visitors.
+
+Peak memory is the maximum resident set size measured by the system.
+For ``flake8`` it is the size of the biggest process.
+It is not measured on Windows, there's no ``resource`` module.
+
+Benchmark names look like ``corpus[in-process]``,
+timings are seconds per checked module.
+"""
+
+import argparse
+import subprocess  # noqa: S404
+import sys
+import sysconfig
+import time
+from typing import Dict, Optional, Sequence
+
+from benchmarks import cli
+from benchmarks.modules import (
+    EXCLUDED_DIRECTORIES,
+    CorpusStats,
+    check_modules,
+    find_modules,
+)
+
+
+def format_stats(stats: CorpusStats) -> str:
+    """Formats throughput, memory, and violations histogram."""
+    seconds = stats.seconds or 1
+    return ''.join([
+        'Files: {0} checked, {1} skipped\n'.format(
+            stats.files,
+            stats.skipped,
+        ),
+        'In-process: {0:.2f} s, {1:.1f} files/s, {2:.0f} nodes/s\n'.format(
+            stats.seconds,
+            stats.files / seconds,
+            stats.nodes / seconds,
+        ),
+        'Peak RSS: {0}\n'.format(peak_rss()),
+        'Violations:\n',
+    ] + [
+        '{0} {1}\n'.format(code, count)
+        for code, count in sorted(stats.codes.items())
+    ])
+
+
+def peak_rss(children: bool = False) -> str:
+    """Formats peak resident set size of this process or its children."""
+    if sys.platform == 'win32':  # pragma: no cover
+        return 'unknown'
+
+    import resource  # noqa: Z435
+
+    kilobytes = resource.getrusage(
+        resource.RUSAGE_CHILDREN if children else resource.RUSAGE_SELF,
+    ).ru_maxrss
+    if sys.platform == 'darwin':  # pragma: no cover
+        kilobytes //= 1024  # macOS reports bytes, not kilobytes
+    return '{0:.1f} MiB'.format(kilobytes / 1024)
+
+
+def run_flake8(directory: str, select: str, jobs: str) -> float:
+    """Checks the directory with ``flake8``, returns the time it took."""
+    start = time.perf_counter()
+    subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            '-m',
+            'flake8',
+            '--isolated',
+            '--exit-zero',
+            '--select={0}'.format(select),
+            '--exclude={0}'.format(','.join(EXCLUDED_DIRECTORIES)),
+            '--jobs={0}'.format(jobs),
+            directory,
+        ],
+        stdout=subprocess.DEVNULL,
+        check=True,
+    )
+    return time.perf_counter() - start
+
+
+def _run_flake8_twice(
+    arguments: argparse.Namespace,
+    files: int,
+) -> Dict[str, float]:
+    plugin_seconds = run_flake8(arguments.directory, 'Z', arguments.jobs)
+    host_seconds = run_flake8(arguments.directory, 'E9', arguments.jobs)
+    sys.stdout.write(
+        'flake8: {0:.2f} s, without our visitors: {1:.2f} s\n'.format(
+            plugin_seconds,
+            host_seconds,
+        ),
+    )
+    sys.stdout.write('flake8 peak RSS: {0}\n'.format(
+        peak_rss(children=True),
+    ))
+    return {
+        'corpus[flake8]': plugin_seconds / files,
+        'corpus[flake8-host]': host_seconds / files,
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Checks the corpus and reports the results."""
+    parser = cli.create_parser('benchmarks.corpus')
+    parser.add_argument(
+        'directory',
+        nargs='?',
+        default=sysconfig.get_paths()['stdlib'],
+        help='Directory with modules, defaults to the standard library.',
+    )
+    parser.add_argument(
+        '--flake8',
+        action='store_true',
+        help='Also check the directory with flake8.',
+    )
+    parser.add_argument('--jobs', default='auto')
+    arguments = parser.parse_args(argv)
+
+    stats = check_modules(find_modules(arguments.directory))
+    sys.stdout.write(format_stats(stats))
+    files = stats.files or 1
+
+    timings = {'corpus[in-process]': stats.seconds / files}
+    if arguments.flake8:
+        timings.update(_run_flake8_twice(arguments, files))
+    return cli.report(arguments, timings)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+
+"""
+Source code that our benchmarks are run on.
+
+There are two kinds of inputs:
+
+1. Representative ones, real modules that look like the code our users have
+2. Worst-case ones, generated modules that stress a single dimension:
+   nesting depth, function length, literal size, or number of comparisons
+
+Each generator accepts a size, so the same shapes are reused
+to measure how checks scale with the input, see :mod:`benchmarks.shapes`.
+"""
+
+import os
+from typing import Callable, Dict
+
+from wemake_python_styleguide.types import Final
+
+#: Generates source code of the given size:
+SourceGenerator = Callable[[int], str]
+
+_BENCHMARKS: Final = os.path.dirname(os.path.abspath(__file__))
+
+_ROOT: Final = os.path.dirname(_BENCHMARKS)
+
+_INDENT: Final = '    '
+
+#: Modules from this repository that are used as representative inputs:
+REPRESENTATIVE: Final = {
+    'noqa': os.path.join('tests', 'fixtures', 'noqa.py'),
+    'checker': os.path.join('wemake_python_styleguide', 'checker.py'),
+}
+
+
+def read_representative(name: str) -> str:
+    """Returns the source code of the representative module."""
+    with open(os.path.join(_ROOT, REPRESENTATIVE[name])) as module:
+        return module.read()
+
+
+def deep_nesting(depth: int) -> str:
+    """Function with ``if`` and ``for`` statements nested in each other."""
+    lines = ['def function(argument):']
+    for level in range(depth):
+        statement = 'if argument > {0}:' if level % 2 else 'for _ in {0}:'
+        lines.append(_INDENT * (level + 1) + statement.format(level))
+    lines.append(_INDENT * (depth + 1) + 'return argument')
+    return '\n'.join(lines) + '\n'
+
+
+def long_function(statements: int) -> str:
+    """Single function with lots of assignments, calls, and conditions."""
+    lines = ['def function(argument):', _INDENT + 'total = argument']
+    for index in range(statements):
+        lines.extend([
+            _INDENT + 'total = total + {0}'.format(index),
+            _INDENT + 'if total > argument:',
+            _INDENT * 2 + 'print(total, argument)',
+        ])
+    lines.append(_INDENT + 'return total')
+    return '\n'.join(lines) + '\n'
+
+
+def literal_table(entries: int) -> str:
+    """Module with a huge ``dict`` of tuples with numbers and strings."""
+    lines = ['TABLE = {']
+    for index in range(entries):
+        lines.append(_INDENT + "'key_{0}': ({0}, 'value', {0} * 2),".format(
+            index,
+        ))
+    lines.append('}')
+    return '\n'.join(lines) + '\n'
+
+
+def many_comparisons(conditions: int) -> str:
+    """Function with lots of chained comparisons and boolean operators."""
+    lines = ['def function(first, second, third):']
+    for index in range(conditions):
+        lines.extend([
+            _INDENT + 'if first < second <= {0} and (third == {0} or '.format(
+                index,
+            ) + 'first != third) and not second > third:',
+            _INDENT * 2 + 'return {0}'.format(index),
+        ])
+    return '\n'.join(lines) + '\n'
+
+
+#: Worst-case generators with sizes that take milliseconds to check:
+WORST_CASES: Final[Dict[str, SourceGenerator]] = {
+    'deep_nesting': deep_nesting,
+    'long_function': long_function,
+    'literal_table': literal_table,
+    'many_comparisons': many_comparisons,
+}
+
+#: Default sizes of the worst-case inputs:
+WORST_CASE_SIZES: Final = {
+    'deep_nesting': 40,
+    'long_function': 500,
+    'literal_table': 2000,
+    'many_comparisons': 300,
+}
+
+
+def all_inputs() -> Dict[str, str]:
+    """Returns all representative and worst-case inputs by their names."""
+    sources = {name: read_representative(name) for name in REPRESENTATIVE}
+    for name, generator in WORST_CASES.items():
+        sources[name] = generator(WORST_CASE_SIZES[name])
+    return sources
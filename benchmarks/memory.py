@@ -0,0 +1,141 @@
+# -*- coding: utf-8 -*-
+
+"""
+Memory used by each visitor on its own.
+
+Each visitor is run on large inputs: worst-case modules
+from :mod:`benchmarks.inputs` and the biggest sizes
+from :mod:`benchmarks.shapes`.
+Allocations are traced with ``tracemalloc`` and we report two sizes:
+
+1. ``peak`` is the biggest traced size while the visitor runs,
+   it includes nodes that visitors keep until ``_post_visit``
+2. ``retained`` is the size that is still allocated after the run,
+   while the visitor itself is alive
+
+The node index is built once for all visitors, so it is not a part
+of their sizes. It is measured on its own, while it is built,
+as ``visitors.index:NodeIndex[literal_table]:peak``.
+
+Sizes do not depend on the machine, so they are compared
+with the stored baseline just like timings:
+
+.. code:: bash
+
+    python -m benchmarks.memory --output memory.json
+    python -m benchmarks.memory --baseline memory.json
+
+Benchmark names look like
+``visitors.ast.complexity.jones:JonesComplexityVisitor[literal_table]:peak``.
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from typing import Callable, Dict, Optional, Sequence, Tuple
+
+from benchmarks import cli, inputs, results, shapes
+from benchmarks.checkers import default_checker_options
+from benchmarks.visitors import find_benchmarks
+from wemake_python_styleguide.types import Final
+
+_KIBIBYTE: Final = 1024
+
+
+def large_inputs() -> Dict[str, str]:
+    """Returns worst-case inputs and the biggest generated shapes."""
+    sources = {
+        name: generator(inputs.WORST_CASE_SIZES[name])
+        for name, generator in inputs.WORST_CASES.items()
+    }
+    for name, (generator, sizes) in shapes.SCALING_CASES.items():
+        sources[name] = generator(max(sizes))
+    return sources
+
+
+def measure_memory(function: Callable[[], object]) -> Tuple[int, int]:
+    """
+    Returns peak and retained sizes of a single call in bytes.
+
+    The function is called once before the measurement,
+    so lazy imports and caches are not counted.
+    Retained size is measured while the returned object is alive.
+    """
+    function()
+    gc.collect()
+
+    tracemalloc.start()
+    return _traced_sizes(function())
+
+
+def format_regressions(regressions: Sequence[results.Regression]) -> str:
+    """Formats memory regressions to be printed, the biggest ones first."""
+    return ''.join(
+        '{0}: {1:.1f} KiB -> {2:.1f} KiB (+{3:.0%})\n'.format(
+            regression.name,
+            regression.baseline / _KIBIBYTE,
+            regression.current / _KIBIBYTE,
+            regression.slowdown,
+        )
+        for regression in regressions
+    )
+
+
+def _traced_sizes(alive: object) -> Tuple[int, int]:
+    retained, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak, retained
+
+
+def _measure_all(name_filter: str) -> results.Timings:
+    sizes: results.Timings = {}
+    for name, benchmark in find_benchmarks(name_filter, large_inputs()):
+        sizes.update(zip(
+            (name + ':peak', name + ':retained'),
+            measure_memory(benchmark),
+        ))
+    return sizes
+
+
+def _report(arguments: argparse.Namespace, sizes: results.Timings) -> int:
+    for name, size in sorted(sizes.items()):
+        sys.stdout.write('{0}: {1:.1f} KiB\n'.format(name, size / _KIBIBYTE))
+
+    if arguments.output:
+        results.save(arguments.output, sizes, key='memory')
+    if not arguments.baseline:
+        return 0
+
+    regressions = results.compare(
+        results.load(arguments.baseline, key='memory'),
+        sizes,
+        arguments.threshold,
+    )
+    if regressions:
+        sys.stdout.write('\nRegressions:\n')
+        sys.stdout.write(format_regressions(regressions))
+    return int(bool(regressions))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Measures memory of all visitors and compares it with the baseline.
+
+    Returns the exit code: ``1`` when there are regressions.
+    """
+    parser = cli.create_parser('benchmarks.memory')
+    parser.add_argument(
+        '-k',
+        '--filter',
+        default='',
+        help='Only run benchmarks with this substring in their names.',
+    )
+    arguments = parser.parse_args(argv)
+    with default_checker_options():
+        sizes = _measure_all(arguments.filter)
+    return _report(arguments, sizes)
+
+
+if __name__ == '__main__':  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+"""Checking modules from disk with our checker, without ``flake8``."""
+
+import ast
+import io
+import os
+import time
+import tokenize
+from typing import Counter, List, Sequence, Tuple
+
+from benchmarks.checkers import default_checker_options
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.types import CheckResult, Final, final
+
+#: Directories that are not a part of the corpus:
+EXCLUDED_DIRECTORIES: Final = ('site-packages', '__pycache__', '.git', '.tox')
+
+_NOT_PARSED: Final = (SyntaxError, UnicodeDecodeError, ValueError)
+
+
+@final
+class CorpusStats(object):
+    """Totals of checking all modules in the corpus."""
+
+    def __init__(self) -> None:
+        """Creates empty totals."""
+        self.files = 0
+        self.skipped = 0
+        self.nodes = 0
+        self.seconds = 0.0
+        self.codes: Counter[str] = Counter()
+
+    def check(self, filename: str) -> None:
+        """Checks a single module and adds it to the totals."""
+        start = time.perf_counter()
+        try:
+            tree, violations = _check_module(filename)
+        except _NOT_PARSED:
+            self.skipped += 1
+            return
+
+        self.seconds += time.perf_counter() - start
+        self.files += 1
+        self.nodes += sum(1 for _ in ast.walk(tree))
+        self.codes.update(_code(violation) for violation in violations)
+
+
+def find_modules(directory: str) -> List[str]:
+    """Returns all python modules inside the directory."""
+    modules: List[str] = []
+    for root, directories, filenames in os.walk(directory):
+        directories[:] = [
+            name for name in directories if name not in EXCLUDED_DIRECTORIES
+        ]
+        modules.extend(
+            os.path.join(root, filename)
+            for filename in filenames
+            if filename.endswith('.py')
+        )
+    return sorted(modules)
+
+
+def check_modules(filenames: Sequence[str]) -> CorpusStats:
+    """Checks all modules with our checker and default options."""
+    stats = CorpusStats()
+    with default_checker_options():
+        for filename in filenames:
+            stats.check(filename)
+    return stats
+
+
+def _check_module(filename: str) -> Tuple[ast.AST, List[CheckResult]]:
+    with tokenize.open(filename) as module:
+        source = module.read()
+
+    tree = ast.parse(source, filename)
+    checker = Checker(
+        tree=tree,
+        file_tokens=list(
+            tokenize.generate_tokens(io.StringIO(source).readline),
+        ),
+        filename=filename,
+        lines=source.splitlines(keepends=True),
+    )
+    return tree, list(checker.run())
+
+
+def _code(violation: CheckResult) -> str:
+    return violation[2].split(' ', 1)[0]
@@ -0,0 +1,135 @@
+# -*- coding: utf-8 -*-
+
+"""
+Measuring, storing, and comparing benchmark results.
+
+Results are stored as ``json`` files, so they can be kept as baselines
+and compared with the results of the next run:
+
+.. code:: json
+
+    {
+        "python": "3.7.1",
+        "version": "0.5.0",
+        "timings": {"benchmark name": 0.00123}
+    }
+
+Each timing is the best time of a single call in seconds.
+The best time is the least affected by other processes on the machine.
+Memory benchmarks store sizes in bytes under the ``memory`` key instead.
+"""
+
+import json
+import platform
+import time
+from typing import Callable, Dict, List, NamedTuple
+
+from wemake_python_styleguide.types import Final
+from wemake_python_styleguide.version import pkg_version
+
+#: Best seconds per call of each benchmark by its name:
+Timings = Dict[str, float]
+
+#: Default minimal time of a single measurement in seconds:
+MIN_TIME: Final = 0.05
+
+#: Default number of measurements, the best one is taken:
+REPEAT: Final = 3
+
+#: Default relative slowdown that is reported as a regression:
+THRESHOLD: Final = 0.2
+
+
+class Regression(NamedTuple):
+    """Benchmark that became slower than its baseline."""
+
+    name: str
+    baseline: float
+    current: float
+
+    @property
+    def slowdown(self) -> float:
+        """Relative slowdown, ``0.5`` means 50% slower."""
+        return self.current / self.baseline - 1
+
+
+def measure(
+    function: Callable[[], object],
+    min_time: float = MIN_TIME,
+    repeat: int = REPEAT,
+) -> float:
+    """
+    Returns the best time of a single call in seconds.
+
+    The number of calls in each measurement is doubled
+    until a measurement takes at least ``min_time``.
+    """
+    number = 1
+    while True:
+        elapsed = _timed(function, number)
+        if elapsed >= min_time:
+            break
+        number *= 2
+
+    best = elapsed
+    for _ in range(repeat - 1):
+        best = min(best, _timed(function, number))
+    return best / number
+
+
+def save(path: str, timings: Timings, key: str = 'timings') -> None:
+    """Writes timings together with the environment to the ``json`` file."""
+    with open(path, 'w') as results_file:
+        json.dump({
+            'python': platform.python_version(),
+            'version': pkg_version,
+            key: timings,
+        }, results_file, indent=2, sort_keys=True)
+
+
+def load(path: str, key: str = 'timings') -> Timings:
+    """Reads timings from the ``json`` file."""
+    with open(path) as results_file:
+        return json.load(results_file)[key]
+
+
+def compare(
+    baseline: Timings,
+    current: Timings,
+    threshold: float = THRESHOLD,
+) -> List[Regression]:
+    """
+    Returns benchmarks that became slower than the threshold allows.
+
+    Benchmarks that are missing in one of the results are skipped.
+    """
+    regressions = [
+        Regression(name, baseline[name], timing)
+        for name, timing in current.items()
+        if name in baseline and timing > baseline[name] * (1 + threshold)
+    ]
+    return sorted(
+        regressions,
+        key=lambda regression: regression.slowdown,
+        reverse=True,
+    )
+
+
+def format_regressions(regressions: List[Regression]) -> str:
+    """Formats regressions to be printed, the biggest ones first."""
+    return ''.join(
+        '{0}: {1:.3f} ms -> {2:.3f} ms (+{3:.0%})\n'.format(
+            regression.name,
+            regression.baseline * 1000,
+            regression.current * 1000,
+            regression.slowdown,
+        )
+        for regression in regressions
+    )
+
+
+def _timed(function: Callable[[], object], number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        function()
+    return time.perf_counter() - start
@@ -0,0 +1,158 @@
+# -*- coding: utf-8 -*-
+
+"""
+Scaling curves of each visitor on generated worst-case modules.
+
+Each visitor is run on the same shape of several sizes,
+see ``SCALING_CASES`` in :mod:`benchmarks.shapes`.
+Then we fit ``time = c * size ** exponent`` to the measured timings
+with least squares on the logarithms of both.
+
+Linear checks have the exponent close to ``1``,
+``n log n`` ones are a little bit higher, quadratic ones are close to ``2``.
+The run fails when any exponent is higher than ``--max-exponent``:
+
+.. code:: bash
+
+    python -m benchmarks.scaling
+    python -m benchmarks.scaling -k ConditionsVisitor
+
+Curve names look like ``visitors.ast.complexity.counts:ConditionsVisitor``
+with the name of the shape in brackets.
+"""
+
+import argparse
+import math
+import sys
+from functools import partial
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from benchmarks import cli, results, shapes
+from benchmarks.checkers import (
+    create_checker,
+    default_checker_options,
+    run_visitor,
+)
+from wemake_python_styleguide.checker import Checker, VisitorClass
+from wemake_python_styleguide.types import Final
+from wemake_python_styleguide.violations import registry
+from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+
+#: Default exponent that is reported as a superlinear growth:
+MAX_EXPONENT: Final = 1.5
+
+#: Sizes and the best seconds per call on the input of each size:
+Curve = List[Tuple[int, float]]
+
+#: Checkers of the same shape by the size of the checked module:
+SizedCheckers = List[Tuple[int, Checker]]
+
+
+def growth_exponent(curve: Curve) -> float:
+    """Returns the slope of the curve on the log-log scale."""
+    sizes, timings = zip(*curve)
+    log_sizes = [math.log(size) for size in sizes]
+    log_timings = [math.log(timing) for timing in timings]
+    variance = _covariance(log_sizes, log_sizes)
+    return _covariance(log_sizes, log_timings) / variance
+
+
+def find_curves(
+    name_filter: str = '',
+) -> Iterator[Tuple[str, VisitorClass, SizedCheckers]]:
+    """Yields names, visitors, and checkers for each size of each shape."""
+    for case_name, (generator, sizes) in shapes.SCALING_CASES.items():
+        checkers = [
+            (size, create_checker(case_name + '.py', generator(size)))
+            for size in sizes
+        ]
+        yield from _applicable_curves(case_name, checkers, name_filter)
+
+
+def measure_curve(
+    visitor_class: VisitorClass,
+    checkers: SizedCheckers,
+    min_time: float = results.MIN_TIME,
+    repeat: int = results.REPEAT,
+) -> Curve:
+    """Measures the visitor on the input of each size."""
+    return [
+        (size, results.measure(
+            partial(run_visitor, visitor_class, checker),
+            min_time,
+            repeat,
+        ))
+        for size, checker in checkers
+    ]
+
+
+def _covariance(first: List[float], second: List[float]) -> float:
+    first_mean = sum(first) / len(first)
+    second_mean = sum(second) / len(second)
+    return sum(
+        (first_item - first_mean) * (second_item - second_mean)
+        for first_item, second_item in zip(first, second)
+    )
+
+
+def _applicable_curves(
+    case_name: str,
+    checkers: SizedCheckers,
+    name_filter: str,
+) -> Iterator[Tuple[str, VisitorClass, SizedCheckers]]:
+    _, smallest = checkers[0]
+    for visitor_class in Checker.visitors:
+        name = '{0}[{1}]'.format(
+            registry.visitor_path(visitor_class),
+            case_name,
+        )
+        if name_filter not in name:
+            continue
+        if issubclass(visitor_class, BaseNodeVisitor) and not (
+            visitor_class.handlers.is_applicable(smallest.index)
+        ):
+            continue
+        yield name, visitor_class, checkers
+
+
+def _measure_exponents(arguments: argparse.Namespace) -> Dict[str, float]:
+    exponents = {}
+    with default_checker_options():
+        for name, visitor_class, checkers in find_curves(arguments.filter):
+            exponents[name] = growth_exponent(measure_curve(
+                visitor_class,
+                checkers,
+                arguments.min_time,
+                arguments.repeat,
+            ))
+            sys.stdout.write('{0}: {1:.2f}\n'.format(name, exponents[name]))
+    return exponents
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Measures all scaling curves and reports the exponents.
+
+    Returns the exit code: ``1`` when some growth is superlinear.
+    """
+    parser = argparse.ArgumentParser(prog='benchmarks.scaling')
+    cli.add_measure_options(parser)
+    parser.add_argument('--max-exponent', type=float, default=MAX_EXPONENT)
+    arguments = parser.parse_args(argv)
+
+    superlinear = {
+        name: exponent
+        for name, exponent in _measure_exponents(arguments).items()
+        if exponent > arguments.max_exponent
+    }
+    if superlinear:
+        sys.stdout.write('\nSuperlinear growth:\n')
+        sys.stdout.write(''.join(
+            '{0}: {1:.2f}\n'.format(name, superlinear[name])
+            for name in superlinear
+        ))
+    return int(bool(superlinear))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    raise SystemExit(main())
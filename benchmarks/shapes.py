@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+"""
+Generated modules of shapes that are known to be hard for some checks.
+
+Each shape grows in a single dimension: nesting of functions and loops,
+number of lines, number of boolean terms, or number of literal elements.
+Each shape has sizes that we measure to find how checks scale with it.
+"""
+
+from typing import Dict, Tuple
+
+from benchmarks.inputs import SourceGenerator, literal_table
+from wemake_python_styleguide.types import Final
+
+#: Generator of the shape together with the sizes it is measured on:
+ScalingCase = Tuple[SourceGenerator, Tuple[int, ...]]
+
+_INDENT: Final = '    '
+
+
+def nested_functions(depth: int) -> str:
+    """Functions defined inside each other."""
+    lines = []
+    for level in range(depth):
+        lines.extend([
+            _INDENT * level + 'def function_{0}(argument):'.format(level),
+            _INDENT * (level + 1) + 'argument = argument + {0}'.format(level),
+        ])
+    lines.append(_INDENT * depth + 'return argument')
+    return '\n'.join(lines) + '\n'
+
+
+def nested_loops(depth: int) -> str:
+    """Loops nested in each other with ``break`` and ``else`` in each one."""
+    lines = ['def function(items):']
+    for level in range(depth):
+        lines.append(_INDENT * (level + 1) + 'for item_{0} in items:'.format(
+            level,
+        ))
+    for level in reversed(range(depth)):
+        lines.extend([
+            _INDENT * (level + 2) + 'if item_{0}:'.format(level),
+            _INDENT * (level + 3) + 'break',
+            _INDENT * (level + 1) + 'else:',
+            _INDENT * (level + 2) + 'items = item_{0}'.format(level),
+        ])
+    lines.append(_INDENT + 'return items')
+    return '\n'.join(lines) + '\n'
+
+
+def annotated_assignments(statements: int) -> str:
+    """Module with lots of annotated assignments on separate lines."""
+    lines = ['from typing import Dict, List', '']
+    for index in range(statements):
+        lines.append(
+            'value_{0}: Dict[str, List[int]] = {{"key": [{0}]}}'.format(index),
+        )
+    return '\n'.join(lines) + '\n'
+
+
+def long_condition(terms: int) -> str:
+    """Function with a single condition of many boolean terms."""
+    condition = ' and '.join(
+        '(first > {0} or second < {0})'.format(index)
+        for index in range(terms)
+    )
+    return '\n'.join([
+        'def function(first, second):',
+        _INDENT + 'if {0}:'.format(condition),
+        _INDENT * 2 + 'return first',
+        _INDENT + 'return second',
+    ]) + '\n'
+
+
+#: Shapes and sizes to measure how checks scale with the input:
+SCALING_CASES: Final[Dict[str, ScalingCase]] = {
+    # Python does not allow more than 100 levels of indentation:
+    'nested_functions': (nested_functions, (12, 24, 48, 96)),
+    'nested_loops': (nested_loops, (12, 24, 48, 96)),
+    'annotated_assignments': (annotated_assignments, (250, 500, 1000, 2000)),
+    'long_condition': (long_condition, (100, 200, 400, 800)),
+    'literal_table': (literal_table, (500, 1000, 2000, 4000)),
+}
@@ -0,0 +1,101 @@
+# -*- coding: utf-8 -*-
+
+"""
+Startup benchmark that imports our plugin in a fresh interpreter.
+
+``flake8`` imports all plugins on each run,
+even for ``flake8 --version``, so we pay for this import every time:
+
+.. code:: bash
+
+    python -m benchmarks.startup --output startup.json
+
+Import times are measured with ``python -X importtime``,
+which is only available since ``python3.7``.
+``flake8`` is imported first, as it always is.
+
+Benchmark name is ``startup[checker]``,
+timings are seconds per import in the fastest of fresh interpreters.
+Benchmark fails, when this import is slower
+than :str:`benchmarks.startup.IMPORT_BUDGET`.
+"""
+
+import subprocess  # noqa: S404
+import sys
+from datetime import timedelta
+from typing import Dict, Optional, Sequence
+
+from benchmarks import cli
+from benchmarks.results import REPEAT
+from wemake_python_styleguide.types import Final
+
+#: Module that is imported by ``flake8`` to load our plugin:
+ENTRY_POINT: Final = 'wemake_python_styleguide.checker'
+
+#: Fastest import of our plugin must not be slower than this:
+IMPORT_BUDGET: Final = timedelta(milliseconds=150)
+
+
+def import_times() -> Dict[str, int]:
+    """Imports our plugin, returns cumulative microseconds of each module."""
+    process = subprocess.run(  # noqa: S603
+        [
+            sys.executable,
+            '-X',
+            'importtime',
+            '-c',
+            _import_code(),
+        ],
+        stderr=subprocess.PIPE,
+        universal_newlines=True,
+        check=True,
+    )
+
+    times = {}
+    for line in process.stderr.splitlines()[1:]:
+        _, cumulative, module_name = line.split('|')
+        times[module_name.strip()] = int(cumulative)
+    return times
+
+
+def fastest_import(repeat: int = REPEAT) -> timedelta:
+    """Returns the fastest import of our plugin in fresh interpreters."""
+    return timedelta(microseconds=min(
+        import_times()[ENTRY_POINT]
+        for _ in range(repeat)
+    ))
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Imports our plugin several times and reports the fastest import.
+
+    Returns the exit code: ``1`` when the import is over the budget.
+    """
+    parser = cli.create_parser('benchmarks.startup')
+    parser.add_argument('--repeat', type=int, default=REPEAT)
+    arguments = parser.parse_args(argv)
+    if sys.version_info < (3, 7):  # pragma: no cover
+        parser.error('python -X importtime requires python3.7 or newer')
+
+    import_time = fastest_import(arguments.repeat)
+    exit_code = cli.report(arguments, {
+        'startup[checker]': import_time.total_seconds(),
+    })
+    if import_time > IMPORT_BUDGET:
+        sys.stdout.write('\nImport is over the budget of {0:.3f} ms\n'.format(
+            IMPORT_BUDGET.total_seconds() * 1000,
+        ))
+        return 1
+    return exit_code
+
+
+def _import_code() -> str:
+    return ';'.join(
+        'import {0}'.format(module_name)
+        for module_name in ('flake8.main.application', ENTRY_POINT)
+    )
+
+
+if __name__ == '__main__':  # pragma: no cover
+    raise SystemExit(main())
@@ -0,0 +1,106 @@
+# -*- coding: utf-8 -*-
+
+"""
+Micro-benchmarks of each visitor on its own.
+
+Each visitor from ``Checker.visitors`` is run on each input
+from :mod:`benchmarks.inputs` separately, without the shared pipelines.
+Visitors that have nothing to check in the input are skipped,
+the checker never runs them on such modules either.
+Building the node index is not a part of these measurements,
+it is measured on its own as ``visitors.index:NodeIndex[noqa]``.
+
+Run it with:
+
+.. code:: bash
+
+    python -m benchmarks.visitors --output results.json
+    python -m benchmarks.visitors --baseline results.json
+
+Benchmark names look like ``visitors.ast.keywords:WrongRaiseVisitor[noqa]``.
+"""
+
+from functools import partial
+from typing import Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+from benchmarks import cli, inputs, results
+from benchmarks.checkers import (
+    create_checker,
+    default_checker_options,
+    run_visitor,
+)
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.types import Final
+from wemake_python_styleguide.violations import registry
+from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.index import NodeIndex
+
+_INDEX_PATH: Final = 'visitors.index:NodeIndex'
+
+#: Name and function of a single benchmark:
+Benchmark = Tuple[str, Callable[[], object]]
+
+
+def find_benchmarks(
+    name_filter: str = '',
+    sources: Optional[Dict[str, str]] = None,
+) -> Iterator[Benchmark]:
+    """
+    Yields names and functions of the node index and visitor benchmarks.
+
+    They are run on all inputs by default, or on the passed sources.
+    """
+    if sources is None:
+        sources = inputs.all_inputs()
+    for input_name, source in sources.items():
+        checker = create_checker(input_name + '.py', source)
+        yield from _filter_benchmarks(
+            _input_benchmarks(input_name, checker),
+            name_filter,
+        )
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Runs all visitor benchmarks."""
+    parser = cli.create_parser('benchmarks.visitors')
+    cli.add_measure_options(parser)
+    arguments = parser.parse_args(argv)
+    with default_checker_options():
+        timings = {
+            name: results.measure(
+                benchmark,
+                arguments.min_time,
+                arguments.repeat,
+            )
+            for name, benchmark in find_benchmarks(arguments.filter)
+        }
+    return cli.report(arguments, timings)
+
+
+def _filter_benchmarks(
+    benchmarks: Iterator[Benchmark],
+    name_filter: str,
+) -> Iterator[Benchmark]:
+    for name, benchmark in benchmarks:
+        if name_filter in name:
+            yield name, benchmark
+
+
+def _input_benchmarks(input_name: str, checker: Checker) -> Iterator[Benchmark]:
+    yield (
+        '{0}[{1}]'.format(_INDEX_PATH, input_name),
+        partial(NodeIndex, checker.tree),
+    )
+    for visitor_class in Checker.visitors:
+        if issubclass(visitor_class, BaseNodeVisitor) and not (
+            visitor_class.handlers.is_applicable(checker.index)
+        ):
+            continue
+        yield (
+            '{0}[{1}]'.format(registry.visitor_path(visitor_class), input_name),
+            partial(run_visitor, visitor_class, checker),
+        )
+
+
+if __name__ == '__main__':  # pragma: no cover
+    raise SystemExit(main())
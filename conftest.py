@@ -0,0 +1,13 @@
+# -*- coding: utf-8 -*-
+
+import sys
+
+#: This module is a plugin, it has no doctests:
+collect_ignore = ['conftest.py']
+
+# There are no Unix sockets on Windows, so there's no daemon either:
+if sys.platform == 'win32':
+    collect_ignore.extend([
+        'wemake_python_styleguide/daemon',
+        'tests/test_daemon',
+    ])
@@ -7,8 +7,13 @@ from operator import itemgetter
 
 import pytest
 
-from wemake_python_styleguide import violations
 from wemake_python_styleguide.options.config import Configuration
+from wemake_python_styleguide.violations import (
+    best_practices,
+    complexity,
+    consistency,
+    naming,
+)
 from wemake_python_styleguide.violations.base import (
     ASTViolation,
     BaseViolation,
@@ -36,10 +41,10 @@ def _is_violation_class(cls) -> bool:
 
 def _load_all_violation_classes():
     modules = [
-        violations.naming,
-        violations.complexity,
-        violations.consistency,
-        violations.best_practices,
+        naming,
+        complexity,
+        consistency,
+        best_practices,
     ]
 
     classes = {}
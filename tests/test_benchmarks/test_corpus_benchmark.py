@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+from benchmarks import corpus, modules
+
+
+def test_find_modules(tmpdir):
+    """Ensures that only python modules outside excluded folders are found."""
+    tmpdir.join('module.py').write('')
+    tmpdir.join('readme.txt').write('')
+    tmpdir.mkdir('package').join('__init__.py').write('')
+    tmpdir.mkdir('__pycache__').join('cached.py').write('')
+
+    found = modules.find_modules(str(tmpdir))
+
+    assert found == [
+        str(tmpdir.join('module.py')),
+        str(tmpdir.join('package', '__init__.py')),
+    ]
+
+
+def test_check_modules(tmpdir):
+    """Ensures that violations are counted and broken modules are skipped."""
+    tmpdir.join('broken.py').write('def (')
+    tmpdir.join('module.py').write('eval(1)\neval(2)\n')
+
+    stats = modules.check_modules(modules.find_modules(str(tmpdir)))
+
+    assert stats.files == 1
+    assert stats.skipped == 1
+    assert stats.nodes > 0
+    assert stats.codes == {'Z421': 2}
+
+
+def test_main_reports_corpus(tmpdir, capsys):
+    """Ensures that throughput and violations are reported and saved."""
+    tmpdir.join('module.py').write('eval(1)\n')
+    output = tmpdir.join('corpus.json')
+
+    assert corpus.main([str(tmpdir), '--output', str(output)]) == 0
+
+    stdout = capsys.readouterr().out
+    assert 'Files: 1 checked, 0 skipped' in stdout
+    assert 'Z421 1' in stdout
+    assert list(json.loads(output.read())['timings']) == [
+        'corpus[in-process]',
+    ]
@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+import json
+from functools import partial
+
+from benchmarks import memory, results
+from benchmarks.checkers import (
+    create_checker,
+    default_checker_options,
+    run_visitor,
+)
+from wemake_python_styleguide.visitors.ast.complexity.jones import (
+    JonesComplexityVisitor,
+)
+
+
+def test_measure_memory():
+    """Ensures that retained size is never bigger than the peak one."""
+    checker = create_checker('module.py', 'first = 1\nsecond = first\n')
+    with default_checker_options():
+        peak, retained = memory.measure_memory(
+            partial(run_visitor, JonesComplexityVisitor, checker),
+        )
+
+    assert peak >= retained > 0
+
+
+def test_format_regressions():
+    """Ensures that memory regressions are formatted in kibibytes."""
+    regression = results.Regression('benchmark:peak', 1024, 1024 * 3)
+
+    assert memory.format_regressions([regression]) == (
+        'benchmark:peak: 1.0 KiB -> 3.0 KiB (+200%)\n'
+    )
+
+
+def test_main_compares_with_baseline(tmpdir, capsys):
+    """Ensures that sizes are saved and compared with the baseline."""
+    baseline = tmpdir.join('baseline.json')
+    arguments = ['-k', 'JonesComplexityVisitor[literal_table]']
+
+    assert memory.main(arguments + ['--output', str(baseline)]) == 0
+    sizes = json.loads(baseline.read())['memory']
+    name = 'visitors.ast.complexity.jones:JonesComplexityVisitor'
+    assert sorted(sizes) == [
+        name + '[literal_table]:peak',
+        name + '[literal_table]:retained',
+    ]
+
+    baseline.write(json.dumps({'memory': {
+        name: size / 2 for name, size in sizes.items()
+    }}))
+    assert memory.main(arguments + ['--baseline', str(baseline)]) == 1
+    assert 'Regressions:' in capsys.readouterr().out
+
+
+def test_main_measures_index(tmpdir):
+    """Ensures that the node index is measured on its own."""
+    output = tmpdir.join('memory.json')
+    arguments = ['-k', 'NodeIndex[literal_table]', '--output', str(output)]
+
+    assert memory.main(arguments) == 0
+    assert sorted(json.loads(output.read())['memory']) == [
+        'visitors.index:NodeIndex[literal_table]:peak',
+        'visitors.index:NodeIndex[literal_table]:retained',
+    ]
@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from benchmarks import results
+
+
+@pytest.mark.parametrize(('current', 'expected'), [
+    ({'first': 1.0, 'second': 2.0}, []),
+    ({'first': 1.1, 'second': 2.0}, []),
+    ({'first': 1.5, 'second': 2.0, 'new': 9.0}, ['first']),
+    ({'first': 1.5, 'second': 4.0}, ['second', 'first']),
+])
+def test_compare(current, expected):
+    """Ensures that only slowdowns over the threshold are regressions."""
+    regressions = results.compare({'first': 1.0, 'second': 2.0}, current)
+    names = [regression.name for regression in regressions]
+
+    assert names == expected
+
+
+def test_measure():
+    """Ensures that measured time is positive."""
+    assert results.measure(list, min_time=0, repeat=2) > 0
+
+
+def test_save_and_load(tmpdir):
+    """Ensures that saved timings can be loaded back."""
+    path = str(tmpdir.join('results.json'))
+    results.save(path, {'benchmark': 0.5})
+
+    assert results.load(path) == {'benchmark': 0.5}
+
+
+def test_save_and_load_with_key(tmpdir):
+    """Ensures that results can be stored under another key."""
+    path = str(tmpdir.join('results.json'))
+    results.save(path, {'benchmark:peak': 1024}, key='memory')
+
+    assert results.load(path, key='memory') == {'benchmark:peak': 1024}
+
+
+def test_format_regressions():
+    """Ensures that regressions are formatted in milliseconds."""
+    regression = results.Regression('benchmark', 1, 3)
+
+    assert results.format_regressions([regression]) == (
+        'benchmark: 1000.000 ms -> 3000.000 ms (+200%)\n'
+    )
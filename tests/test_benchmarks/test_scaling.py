@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+import ast
+
+import pytest
+
+from benchmarks import scaling, shapes
+
+
+@pytest.mark.parametrize('exponent', [0, 1, 1.5, 2])
+def test_growth_exponent(exponent):
+    """Ensures that the exponent of the power law is found."""
+    sizes = (10, 20, 40, 80)
+    curve = [(size, size ** exponent / 2) for size in sizes]
+
+    assert scaling.growth_exponent(curve) == pytest.approx(exponent)
+
+
+@pytest.mark.parametrize('case_name', shapes.SCALING_CASES.keys())
+def test_scaling_cases_are_valid(case_name):
+    """Ensures that generated modules of the biggest size are valid."""
+    generator, sizes = shapes.SCALING_CASES[case_name]
+
+    assert sizes == tuple(sorted(sizes))
+    assert ast.parse(generator(sizes[-1]))
+
+
+def test_main_reports_superlinear_growth(capsys):
+    """Ensures that curves over the maximum exponent fail the run."""
+    arguments = ['-k', 'WrongCommentVisitor[long_condition]']
+    arguments.extend(['--min-time', '0.001', '--repeat', '1'])
+
+    assert scaling.main(arguments + ['--max-exponent', '-10']) == 1
+    assert 'Superlinear growth:' in capsys.readouterr().out
+
+    assert scaling.main(arguments + ['--max-exponent', '10']) == 0
+    assert 'Superlinear growth:' not in capsys.readouterr().out
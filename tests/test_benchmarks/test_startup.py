@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+
+import json
+import sys
+from datetime import timedelta
+
+import pytest
+
+from benchmarks import startup
+
+importtime = pytest.mark.skipif(
+    sys.version_info < (3, 7),
+    reason='python -X importtime is not available',
+)
+
+
+@importtime
+def test_main_reports_startup(tmpdir, capsys):
+    """Ensures that import time of our plugin is reported and saved."""
+    output = tmpdir.join('startup.json')
+
+    assert startup.main(['--repeat', '1', '--output', str(output)]) == 0
+
+    assert capsys.readouterr().out.startswith('startup[checker]: ')
+    assert list(json.loads(output.read())['timings']) == ['startup[checker]']
+
+
+@importtime
+def test_main_fails_over_budget(monkeypatch, capsys):
+    """Ensures that import slower than the budget fails the benchmark."""
+    monkeypatch.setattr(startup, 'IMPORT_BUDGET', timedelta(0))
+
+    assert startup.main(['--repeat', '1']) == 1
+    assert 'over the budget' in capsys.readouterr().out
@@ -0,0 +1,48 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+from benchmarks import checkers, visitors
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.violations import registry
+
+
+def test_benchmarks_cover_all_visitors():
+    """Ensures that each visitor is benchmarked on some input."""
+    benchmarked = {
+        name.split('[')[0] for name, _ in visitors.find_benchmarks()
+    }
+
+    assert benchmarked == {'visitors.index:NodeIndex'} | {
+        registry.visitor_path(visitor_class)
+        for visitor_class in Checker.visitors
+    }
+
+
+def test_default_checker_options(monkeypatch):
+    """Ensures that the previous state of the checker is restored."""
+    monkeypatch.delattr(Checker, 'options', raising=False)
+
+    with checkers.default_checker_options():
+        options = Checker.options
+        with checkers.default_checker_options():
+            assert Checker.options is not options
+        assert Checker.options is options
+
+    assert 'options' not in Checker.__dict__
+
+
+def test_main_compares_with_baseline(tmpdir, capsys):
+    """Ensures that results are saved and compared with the baseline."""
+    baseline = tmpdir.join('baseline.json')
+    arguments = ['-k', 'WrongKeywordVisitor[noqa]', '--min-time', '0.001']
+
+    assert visitors.main(arguments + ['--output', str(baseline)]) == 0
+    timings = json.loads(baseline.read())['timings']
+    assert list(timings) == ['visitors.ast.keywords:WrongKeywordVisitor[noqa]']
+
+    baseline.write(json.dumps({'timings': {
+        name: timing / 1000 for name, timing in timings.items()
+    }}))
+    assert visitors.main(arguments + ['--baseline', str(baseline)]) == 1
+    assert 'Regressions:' in capsys.readouterr().out
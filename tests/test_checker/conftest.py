@@ -0,0 +1,40 @@
+# -*- coding: utf-8 -*-
+
+from argparse import Namespace
+
+import pytest
+from flake8 import defaults
+
+from wemake_python_styleguide.checker import Checker
+
+
+@pytest.fixture()
+def cached_options(options, tmpdir):
+    """Returns options with the cache enabled."""
+    return options(wps_cache_dir=str(tmpdir))
+
+
+@pytest.fixture()
+def cached_checker(cached_options):
+    """Enables the cache for all checkers, disables it afterwards."""
+    Checker.parse_options(cached_options)
+    yield Checker
+    Checker.cache = None
+
+
+@pytest.fixture()
+def flake8_options():
+    """Returns options in the same shape ``flake8`` parses them."""
+    def factory(**kwargs):
+        default_values = {
+            'select': list(defaults.SELECT),
+            'ignore': list(defaults.IGNORE),
+            'extend_ignore': [],
+            'extended_default_select': {'Z'},
+            'extended_default_ignore': set(),
+            'enable_extensions': [],
+            'disable_noqa': False,
+        }
+        default_values.update(kwargs)
+        return Namespace(**default_values)
+    return factory
@@ -0,0 +1,61 @@
+# -*- coding: utf-8 -*-
+
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from wemake_python_styleguide.cache import ResultsCache
+from wemake_python_styleguide.checker import Checker
+
+
+def test_cache_disabled_by_default(default_options):
+    """Ensures that cache is disabled without the directory."""
+    assert ResultsCache.from_options(default_options) is None
+
+
+def test_cache_roundtrip(cached_options):
+    """Ensures that stored results can be read back."""
+    cache = ResultsCache.from_options(cached_options)
+    key = cache.make_key('module.py', ['x = 1\n'], Checker.visitors)
+
+    assert cache.get(key) is None
+    cache.put(key, [(1, 0, 'Z001 violation')])
+    assert cache.get(key) == ([(1, 0, 'Z001 violation')], {})
+
+
+@pytest.mark.parametrize('changed', [
+    ('other.py', ['x = 1\n'], Checker.visitors),
+    ('module.py', ['x = 2\n'], Checker.visitors),
+    ('module.py', ['x = 1\n'], Checker.visitors[1:]),
+])
+def test_cache_key_changes(cached_options, changed):
+    """Ensures that any change in the inputs changes the key."""
+    cache = ResultsCache.from_options(cached_options)
+    key = cache.make_key('module.py', ['x = 1\n'], Checker.visitors)
+
+    assert cache.make_key(*changed) != key
+
+
+def test_cache_key_depends_on_options(options, tmpdir):
+    """Ensures that results with different options are not mixed."""
+    default_cache = ResultsCache(str(tmpdir), options())
+    changed_cache = ResultsCache(str(tmpdir), options(max_returns=1))
+    arguments = ('module.py', ['x = 1\n'], Checker.visitors)
+
+    assert default_cache.make_key(*arguments) != changed_cache.make_key(
+        *arguments,
+    )
+
+
+def test_cache_key_depends_on_interpreter(options, tmpdir, monkeypatch):
+    """Ensures that results of different interpreters are not mixed."""
+    arguments = ('module.py', ['x = 1\n'], Checker.visitors)
+    key = ResultsCache(str(tmpdir), options()).make_key(*arguments)
+
+    monkeypatch.setattr(sys, 'implementation', SimpleNamespace(
+        cache_tag='pypy36',
+    ))
+    other_cache = ResultsCache(str(tmpdir), options())
+
+    assert other_cache.make_key(*arguments) != key
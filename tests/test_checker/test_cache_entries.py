@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from wemake_python_styleguide.cache import ResultsCache
+
+
+def test_cache_ignores_write_errors(options, tmpdir):
+    """Ensures that cache errors do not break the checker."""
+    cache_file = tmpdir.join('file')
+    cache_file.write('')
+    cache = ResultsCache(str(cache_file), options())
+
+    key = cache.make_key('module.py', [], ())
+    cache.put(key, [])
+    assert cache.get(key) is None
+
+
+def test_cache_removes_temporary_files(cached_options, tmpdir, monkeypatch):
+    """Ensures that failed writes do not leave temporary files behind."""
+    cache = ResultsCache.from_options(cached_options)
+    key = cache.make_key('module.py', [], ())
+
+    monkeypatch.setattr(os, 'replace', MagicMock(side_effect=PermissionError))
+    cache.put(key, [])
+
+    assert tmpdir.join(key[:2]).listdir() == []
+    assert cache.get(key) is None
+
+
+@pytest.mark.parametrize('entry', [
+    '',
+    '1',
+    '[null]',
+    '[["line", 0, "Z001 violation"]]',
+    '[[1, 0]]',
+])
+def test_cache_ignores_broken_entries(cached_options, tmpdir, entry):
+    """Ensures that broken entries are treated as cache misses."""
+    cache = ResultsCache.from_options(cached_options)
+    key = cache.make_key('module.py', [], ())
+    cache.put(key, [])
+
+    tmpdir.join(key[:2], key + '.json').write(entry)
+
+    assert cache.get(key) is None
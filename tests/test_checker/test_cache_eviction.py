@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+import os
+import time
+from unittest.mock import MagicMock
+
+from wemake_python_styleguide.cache import ResultsCache
+
+
+def test_cache_evicts_least_recently_used(cached_options, tmpdir):
+    """Ensures that the oldest entries are removed over the limit."""
+    cache = ResultsCache.from_options(cached_options)
+    cache.max_entries = 1
+
+    old_key = cache.make_key('old.py', [], ())
+    new_key = cache.make_key('new.py', [], ())
+    cache.put(old_key, [])
+    cache.put(new_key, [])
+
+    cache_entry = str(tmpdir.join(old_key[:2], old_key + '.json'))
+    past = time.time() - 100
+    os.utime(cache_entry, (past, past))
+    cache.evict()
+
+    assert cache.get(old_key) is None
+    assert cache.get(new_key) == ([], {})
+
+
+def test_cache_eviction_skips_temporary_files(cached_options, tmpdir):
+    """Ensures that files written by other processes are not entries."""
+    cache = ResultsCache.from_options(cached_options)
+    cache.max_entries = 1
+    key = cache.make_key('module.py', [], ())
+    cache.put(key, [])
+
+    temporary_file = tmpdir.join(key[:2], 'entry.tmp')
+    temporary_file.write('')
+    tmpdir.join('entries').write('..')
+    cache.evict()
+
+    assert temporary_file.check()
+    assert cache.get(key) == ([], {})
+    assert tmpdir.join('entries').size() == 1
+
+
+def test_cache_eviction_races(cached_options, tmpdir, monkeypatch):
+    """Ensures that entries removed by other processes are skipped."""
+    cache = ResultsCache.from_options(cached_options)
+    cache.max_entries = 0
+    cache.put(cache.make_key('module.py', [], ()), [])
+
+    removed = MagicMock(side_effect=FileNotFoundError)
+    monkeypatch.setattr(os, 'remove', removed)
+    cache.evict()
+
+    tmpdir.join('entries').write('.')
+    monkeypatch.setattr(os, 'walk', MagicMock(return_value=[
+        (cache.directory, [], ['removed.json']),
+    ]))
+    cache.evict()
+
+
+def test_cache_counts_new_entries(cached_options, tmpdir):
+    """Ensures that only new entries are counted."""
+    cache = ResultsCache.from_options(cached_options)
+    key = cache.make_key('module.py', [], ())
+    cache.put(key, [])
+    cache.put(key, [(1, 0, 'Z001 violation')])
+    cache.put(cache.make_key('other.py', [], ()), [])
+
+    assert tmpdir.join('entries').size() == 2
+
+
+def test_cache_eviction_under_limit(cached_options, monkeypatch):
+    """Ensures that the cache directory is not walked under the limit."""
+    cache = ResultsCache.from_options(cached_options)
+    cache.put(cache.make_key('module.py', [], ()), [])
+
+    monkeypatch.setattr(os, 'walk', MagicMock(side_effect=AssertionError))
+    cache.evict()
+
+
+def test_cache_eviction_ignores_counter_errors(cached_options, tmpdir):
+    """Ensures that broken counters do not break the checker."""
+    tmpdir.mkdir('entries')
+    cache = ResultsCache.from_options(cached_options)
+    cache.max_entries = 0
+    key = cache.make_key('module.py', [], ())
+    cache.put(key, [])
+
+    cache.evict()
+
+    assert cache.get(key) is None
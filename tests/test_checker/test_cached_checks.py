@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+import ast
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.visitors import pipeline
+from wemake_python_styleguide.visitors.index import NodeIndex
+
+module_with_violations = 'def function():\n    global x\n'
+
+module_with_definitions = """
+import os
+
+def first(a, b, c, d, e, f):
+    return {0}
+
+class Second:
+    def method(self):
+        x = 0xAB
+        return lambda: x
+"""
+
+
+class _IndexRecorder(object):
+    def __init__(self) -> None:
+        self.trees = []
+
+    def __call__(self, tree):
+        self.trees.append(tree)
+        return NodeIndex(tree)
+
+
+@pytest.fixture()
+def checked_trees(monkeypatch):
+    """Records all trees that are checked by the checker."""
+    recorder = _IndexRecorder()
+    monkeypatch.setattr(pipeline, 'NodeIndex', recorder)
+    return recorder.trees
+
+
+def _run_checker(filename: str = 'module.py', source=module_with_violations):
+    checker = Checker(
+        tree=ast.parse(source),
+        file_tokens=[],
+        filename=filename,
+        lines=source.splitlines(keepends=True),
+    )
+    return sorted(violation[:3] for violation in checker.run())
+
+
+def _fail_checks(*args, **kwargs):
+    raise AssertionError('Checks must not run on a cached file')
+
+
+def test_checker_uses_cache(cached_checker, monkeypatch):
+    """Ensures that checker does not run checks for cached files."""
+    violations = _run_checker()
+    assert violations
+
+    monkeypatch.setattr(cached_checker, '_run_checks', _fail_checks)
+    assert _run_checker() == violations
+
+
+def test_incremental_checks_match_full_run(
+    cached_checker,
+    absolute_path,
+    monkeypatch,
+):
+    """Ensures that results are the same when checked by definitions."""
+    with open(absolute_path('fixtures', 'noqa.py')) as fixture:
+        source = fixture.read()
+
+    with monkeypatch.context() as patch:
+        patch.setattr(cached_checker, 'cache', None)
+        violations = _run_checker('noqa.py', source)
+    assert _run_checker('noqa.py', source) == violations
+
+
+def test_unchanged_definitions_are_cached(cached_checker, checked_trees):
+    """Ensures that only changed definitions are checked again."""
+    _run_checker(source=module_with_definitions.format('1'))
+    assert len(checked_trees) == 4
+
+    checked_trees.clear()
+    assert _run_checker(source=module_with_definitions.format('2'))
+    assert len(checked_trees) == 3
+    assert checked_trees[0].body[0].name == 'first'
+    assert all(len(tree.body) < 3 for tree in checked_trees)
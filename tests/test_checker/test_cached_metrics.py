@@ -0,0 +1,66 @@
+# -*- coding: utf-8 -*-
+
+import ast
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+
+module_with_metrics = """
+import os
+import sys
+
+def first():
+    return os.path.join(sys.argv[0], sys.argv[{0}] + sys.argv[1] * 2)
+
+def second():
+    return sys.argv
+
+x = 1
+"""
+
+
+@pytest.fixture()
+def metrics_checker(options, tmpdir):
+    """Enables the cache with low limits of module metrics."""
+    Checker.parse_options(options(
+        wps_cache_dir=str(tmpdir),
+        max_module_members=1,
+        max_imports=1,
+        max_jones_score=1,
+        max_line_complexity=5,
+    ))
+    yield Checker
+    Checker.cache = None
+
+
+def _run_checker(filename: str, source: str):
+    checker = Checker(
+        tree=ast.parse(source),
+        file_tokens=[],
+        filename=filename,
+        lines=source.splitlines(keepends=True),
+    )
+    return sorted(violation[:3] for violation in checker.run())
+
+
+@pytest.mark.parametrize(('filename', 'source'), [
+    ('module.py', module_with_metrics),
+    ('module.py', ''),
+    ('__init__.py', module_with_metrics),
+    ('__init__.py', '"""Docs."""\n'),
+])
+def test_incremental_metrics_match_full_run(
+    metrics_checker,
+    monkeypatch,
+    filename,
+    source,
+):
+    """Ensures that module metrics are merged from definition summaries."""
+    for changed in ('0', '1', '0'):
+        checked_source = source.format(changed)
+        with monkeypatch.context() as patch:
+            patch.setattr(metrics_checker, 'cache', None)
+            violations = _run_checker(filename, checked_source)
+
+        assert _run_checker(filename, checked_source) == violations
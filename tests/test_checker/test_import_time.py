@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+import subprocess
+import sys
+
+import pytest
+
+from benchmarks import startup
+
+importtime = pytest.mark.skipif(
+    sys.version_info < (3, 7),
+    reason='python -X importtime is not available',
+)
+
+
+@importtime
+def test_checker_import_time_budget():
+    """Ensures that our plugin is imported fast enough."""
+    assert startup.fastest_import() <= startup.IMPORT_BUDGET
+
+
+@importtime
+def test_checker_does_not_import_visitors():
+    """Ensures that visitors and violations are imported lazily."""
+    assert not [
+        module_name
+        for module_name in startup.import_times()
+        if module_name.startswith((
+            'wemake_python_styleguide.visitors.presets',
+            'wemake_python_styleguide.violations.naming',
+            'wemake_python_styleguide.violations.complexity',
+            'wemake_python_styleguide.violations.consistency',
+            'wemake_python_styleguide.violations.best_practices',
+        ))
+    ]
+
+
+def test_selection_imports_selected_visitors():
+    """Ensures that modules of visitors that are not selected are skipped."""
+    subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            'import sys, argparse; '
+            'from wemake_python_styleguide.checker import Checker; '
+            'Checker.parse_options(argparse.Namespace('
+            '    select=["Z100"], ignore=[], extend_ignore=[],'
+            '    extended_default_select={"Z"}, extended_default_ignore=set(),'
+            '    enable_extensions=[], disable_noqa=False,'
+            ')); '
+            'assert len(Checker.selection.for_filename("module.py")) == 1; '
+            'assert "wemake_python_styleguide.visitors.ast.keywords" '
+            '    not in sys.modules',
+        ],
+        check=True,
+    )
+
+
+def test_version_does_not_import_pkg_resources():
+    """Ensures that slow ``pkg_resources`` is not used to find our version."""
+    subprocess.run(
+        [
+            sys.executable,
+            '-c',
+            'import sys, wemake_python_styleguide.version; '
+            'assert "pkg_resources" not in sys.modules',
+        ],
+        check=True,
+    )
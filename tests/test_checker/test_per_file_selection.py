@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+from flake8 import utils
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.options.selection import VisitorsSelection
+from wemake_python_styleguide.visitors.ast.complexity.jones import (
+    JonesComplexityVisitor,
+)
+from wemake_python_styleguide.visitors.filenames.module import (
+    WrongModuleNameVisitor,
+)
+
+
+@pytest.fixture()
+def per_file_mapping(monkeypatch):
+    """Parses ``per-file-ignores`` into the given mapping."""
+    def factory(mapping):
+        monkeypatch.setattr(
+            utils,
+            'parse_files_to_codes_mapping',
+            lambda per_file_ignores: mapping,
+            raising=False,
+        )
+    return factory
+
+
+def test_per_file_mapping(flake8_options, per_file_mapping):
+    """Ensures that visitors are selected for each ``per-file-ignores``."""
+    per_file_mapping([('__init__.py', ['Z'])])
+    selection = VisitorsSelection(
+        flake8_options(per_file_ignores='__init__.py: Z'),
+    )
+
+    assert selection.for_filename('module.py') == tuple(Checker.visitors)
+    assert selection.for_filename('package/__init__.py') == ()
+
+
+def test_most_specific_per_file_pattern(flake8_options, per_file_mapping):
+    """Ensures that the most specific ``per-file-ignores`` pattern wins."""
+    codes = [
+        violation.full_code()
+        for violation in JonesComplexityVisitor.possible_violations
+    ]
+    per_file_mapping([('*.py', ['Z']), ('tests/*.py', codes)])
+    selection = VisitorsSelection(
+        flake8_options(per_file_ignores='*.py: Z tests/*.py: Z200 Z221'),
+    )
+
+    selected = selection.for_filename('tests/test_module.py')
+    assert JonesComplexityVisitor not in selected
+    assert len(selected) == len(Checker.visitors) - 1
+    assert selection.for_filename('module.py') == ()
+    assert selection.for_filename('.') == tuple(Checker.visitors)
+
+
+@pytest.mark.skipif(
+    getattr(utils, 'parse_files_to_codes_mapping', None) is None,
+    reason='per-file-ignores were added in flake8 3.7',
+)
+def test_per_file_ignores(flake8_options):
+    """Ensures that ``per-file-ignores`` are parsed by ``flake8``."""
+    selection = VisitorsSelection(
+        flake8_options(per_file_ignores='__init__.py: Z'),
+    )
+
+    assert WrongModuleNameVisitor in selection.for_filename('module.py')
+    assert selection.for_filename('package/__init__.py') == ()
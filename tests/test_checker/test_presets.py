@@ -14,6 +14,7 @@ from wemake_python_styleguide.visitors.base import (
     BaseNodeVisitor,
     BaseTokenVisitor,
     BaseVisitor,
+    SummarizedNodeVisitor,
 )
 
 
@@ -23,6 +24,7 @@ def _is_visitor_class(cls) -> bool:
         BaseNodeVisitor,
         BaseTokenVisitor,
         BaseVisitor,
+        SummarizedNodeVisitor,
     }
 
     return (
@@ -72,3 +74,21 @@ def test_all_visitors_contained_in_checker(all_visitors):
         assert visitor.__qualname__ in checker_visitors
 
     assert len(all_visitors) == len(checker_visitors)
+
+
+def test_all_visitors_declare_violations():
+    """Ensures that all visitors declare violations they can raise."""
+    for visitor in Checker.visitors:
+        assert visitor.possible_violations, visitor
+
+
+def test_all_violations_are_declared(all_violations):
+    """Ensures that all violations are declared by at least one visitor."""
+    declared = {
+        violation
+        for visitor in Checker.visitors
+        for violation in visitor.possible_violations
+    }
+
+    for violation in all_violations:
+        assert violation in declared, violation
@@ -0,0 +1,39 @@
+# -*- coding: utf-8 -*-
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.options.selection import VisitorsSelection
+from wemake_python_styleguide.visitors.ast.complexity.jones import (
+    JonesComplexityVisitor,
+)
+
+
+def test_nothing_disabled(flake8_options):
+    """Ensures that all visitors are selected by default."""
+    selection = VisitorsSelection(flake8_options())
+    assert selection.for_filename('module.py') == tuple(Checker.visitors)
+
+
+def test_options_without_select(default_options):
+    """Ensures that options not parsed by ``flake8`` select everything."""
+    selection = VisitorsSelection(default_options)
+    assert selection.for_filename('module.py') == tuple(Checker.visitors)
+
+
+def test_ignored_violations(flake8_options):
+    """Ensures that visitors with all violations ignored are skipped."""
+    codes = [
+        violation.full_code()
+        for violation in JonesComplexityVisitor.possible_violations
+    ]
+    selection = VisitorsSelection(flake8_options(ignore=codes))
+
+    selected = selection.for_filename('module.py')
+    assert JonesComplexityVisitor not in selected
+    assert len(selected) == len(Checker.visitors) - 1
+
+
+def test_partially_ignored_violations(flake8_options):
+    """Ensures that visitors with any enabled violation are kept."""
+    codes = [JonesComplexityVisitor.possible_violations[0].full_code()]
+    selection = VisitorsSelection(flake8_options(ignore=codes))
+    assert JonesComplexityVisitor in selection.for_filename('module.py')
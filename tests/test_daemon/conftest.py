@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+import pytest
+from flake8.main.application import Application
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.daemon.server import CheckerDaemon
+from wemake_python_styleguide.options.config import Configuration
+
+
+@pytest.fixture()
+def flake8_application():
+    """Returns ``flake8`` application initialized with our defaults."""
+    application = Application()
+    application.initialize(['--isolated', '--select=Z'])
+    options = application.options
+    for option in Configuration.options:  # when plugin is not installed
+        if getattr(options, option.attribute_name, None) is None:
+            setattr(options, option.attribute_name, option.default)
+    Checker.parse_options(options)
+    return application
+
+
+@pytest.fixture()
+def daemon(flake8_application, tmpdir):
+    """Runs the daemon in a background thread."""
+    socket_path = str(tmpdir.join('daemon.sock'))
+    daemon = CheckerDaemon(socket_path, flake8_application)
+    thread = threading.Thread(target=daemon.serve_forever)
+    thread.start()
+    yield daemon
+    daemon.shutdown()
+    daemon.server_close()
+    thread.join()
+    Checker.cache = None
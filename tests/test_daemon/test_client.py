@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+import io
+import os
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from wemake_python_styleguide.daemon.client import main, request
+from wemake_python_styleguide.daemon.server import CheckerDaemon
+
+module_with_violations = 'def function():\n    global x\n'
+
+
+def test_client_requests(daemon, tmpdir, capsys):
+    """Ensures that client receives results over the socket."""
+    socket_path = daemon.server_address
+    expected = daemon.check('module.py', module_with_violations)
+
+    assert request(socket_path, 'module.py', module_with_violations) == (
+        expected
+    )
+
+    module = tmpdir.join('module.py')
+    module.write(module_with_violations)
+    assert main(['--socket', socket_path, 'check', str(module)]) == 1
+    assert capsys.readouterr().out.count(os.linesep) == 1
+
+
+def test_client_receives_errors(daemon):
+    """Ensures that errors are reported to the client."""
+    with pytest.raises(RuntimeError):
+        request(daemon.server_address, 'module.py', 'def')
+
+
+def test_client_sends_absolute_paths(daemon, tmpdir, monkeypatch):
+    """Ensures that daemon reads files relative to the client."""
+    module = tmpdir.join('module.py')
+    module.write(module_with_violations)
+    monkeypatch.chdir(tmpdir)
+
+    violations = request(daemon.server_address, 'module.py')
+
+    assert violations == daemon.check(str(module))
+
+
+def test_client_checks_stdin(daemon, monkeypatch, capsys):
+    """Ensures that client sends buffers from stdin."""
+    monkeypatch.setattr(sys, 'stdin', io.StringIO(module_with_violations))
+
+    assert main([
+        '--socket',
+        daemon.server_address,
+        'check',
+        '-',
+        '--stdin-display-name=module.py',
+    ]) == 1
+    assert capsys.readouterr().out.startswith('module.py:2:5: Z420 ')
+
+
+def test_client_unknown_arguments(daemon):
+    """Ensures that client does not accept unknown arguments."""
+    with pytest.raises(SystemExit):
+        main(['--socket', daemon.server_address, 'check', '-', '--unknown'])
+
+
+def test_serve(tmpdir, monkeypatch):
+    """Ensures that daemon is stopped with keyboard interrupt."""
+    monkeypatch.setattr(
+        CheckerDaemon,
+        'serve_forever',
+        MagicMock(side_effect=KeyboardInterrupt),
+    )
+    socket_path = str(tmpdir.join('serve.sock'))
+    assert main(['--socket', socket_path, 'serve', '--isolated']) == 0
+    assert not os.path.exists(socket_path)
+
+
+def test_client_on_windows(monkeypatch):
+    """Ensures that daemon is not started without Unix sockets."""
+    monkeypatch.setattr(sys, 'platform', 'win32')
+    with pytest.raises(RuntimeError):
+        main(['check', 'module.py'])
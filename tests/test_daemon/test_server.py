@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+import json
+import socket
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.daemon.client import ENCODING
+from wemake_python_styleguide.daemon.server import CheckerDaemon
+from wemake_python_styleguide.options import defaults
+
+module_with_violations = 'def function():\n    global x\n'
+
+
+def test_daemon_checks_buffer(daemon):
+    """Ensures that daemon reports violations in flake8 format."""
+    violations = daemon.check('module.py', module_with_violations)
+
+    assert len(violations) == 1
+    assert violations[0].startswith('module.py:2:5: Z420 ')
+
+
+def test_daemon_respects_noqa(daemon):
+    """Ensures that violations with ``noqa`` comments are not reported."""
+    source = 'def function():\n    global x  # noqa: Z420\n'
+
+    assert daemon.check('module.py', source) == []
+
+
+def test_daemon_resets_statistics(daemon, flake8_application):
+    """Ensures that statistics are collected for each check separately."""
+    daemon.check('module.py', module_with_violations)
+    daemon.check('module.py', module_with_violations)
+
+    statistics = flake8_application.guide.stats.statistics_for('Z420')
+    assert next(statistics).count == 1
+
+
+def test_daemon_checks_files(daemon, tmpdir):
+    """Ensures that daemon reads files from disk."""
+    module = tmpdir.join('module.py')
+    module.write(module_with_violations)
+
+    assert daemon.check(str(module)) == daemon.check(
+        str(module),
+        module_with_violations,
+    )
+
+
+def test_daemon_reports_module_violations(daemon):
+    """Ensures that violations of the whole module are reported."""
+    violations = daemon.check(
+        'module.py',
+        'import os\n' * (defaults.MAX_IMPORTS + 1),
+    )
+
+    assert violations[0].startswith('module.py:0:1: Z201 ')
+
+
+@pytest.mark.parametrize('raw_request', [
+    b'not json',
+    b'[]',
+    json.dumps({}).encode(ENCODING),
+    json.dumps({'filename': 'missing.py'}).encode(ENCODING),
+    json.dumps({'filename': 'module.py', 'source': 1}).encode(ENCODING),
+])
+def test_daemon_answers_bad_requests(daemon, raw_request):
+    """Ensures that daemon answers with an error to bad requests."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.connect(daemon.server_address)
+        client.sendall(raw_request + b'\n')
+        response = json.loads(client.makefile('rb').readline())
+
+    assert list(response) == ['error']
+
+
+def test_daemon_reuses_parsed_options(flake8_application, tmpdir, monkeypatch):
+    """Ensures that options already parsed by flake8 are not parsed again."""
+    monkeypatch.setattr(Checker, 'parse_options', pytest.fail)
+    socket_path = str(tmpdir.join('daemon.sock'))
+
+    with CheckerDaemon(socket_path, flake8_application):
+        assert Checker.options is flake8_application.options
@@ -0,0 +1,52 @@
+# -*- coding: utf-8 -*-
+
+import os
+import socket
+import socketserver
+
+import pytest
+
+from wemake_python_styleguide.daemon.sockets import UnixSocketServer
+
+
+@pytest.fixture()
+def socket_path(tmpdir):
+    """Returns path to the socket file in a temporary directory."""
+    return str(tmpdir.join('test.sock'))
+
+
+def test_server_removes_socket(socket_path):
+    """Ensures that socket is removed, when server is closed."""
+    with UnixSocketServer(socket_path, socketserver.BaseRequestHandler):
+        assert os.path.exists(socket_path)
+
+    assert not os.path.exists(socket_path)
+
+
+def test_server_replaces_stale_socket(socket_path):
+    """Ensures that socket of a crashed server is replaced."""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as crashed:
+        crashed.bind(socket_path)
+
+    with UnixSocketServer(socket_path, socketserver.BaseRequestHandler):
+        assert os.path.exists(socket_path)
+
+
+def test_server_keeps_running_socket(socket_path):
+    """Ensures that socket of a running server is not removed."""
+    with UnixSocketServer(socket_path, socketserver.BaseRequestHandler):
+        with pytest.raises(OSError):
+            UnixSocketServer(socket_path, socketserver.BaseRequestHandler)
+
+        assert os.path.exists(socket_path)
+
+
+def test_server_keeps_other_files(socket_path):
+    """Ensures that files, which are not sockets, are not removed."""
+    with open(socket_path, 'w') as regular_file:
+        regular_file.write('')
+
+    with pytest.raises(OSError):
+        UnixSocketServer(socket_path, socketserver.BaseRequestHandler)
+
+    assert os.path.exists(socket_path)
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import io
+import multiprocessing
+import tokenize
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+
+module_with_violations = """
+def function():
+    global x
+    return 0XAB
+"""
+
+
+def _enable(options, **kwargs):
+    Checker.parse_options(options(**kwargs))
+    yield Checker.profiler
+    Checker.profiler = None
+
+
+def _run_checker(filename: str = 'module.py'):
+    checker = Checker(
+        tree=ast.parse(module_with_violations),
+        file_tokens=list(tokenize.generate_tokens(
+            io.StringIO(module_with_violations).readline,
+        )),
+        filename=filename,
+    )
+    return list(checker.run())
+
+
+def _run_in_workers(filenames):
+    context = multiprocessing.get_context('fork')
+    workers = [
+        context.Process(target=_run_checker, args=(filename,))
+        for filename in filenames
+    ]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+
+@pytest.fixture()
+def profiler(options, tmpdir):
+    """Enables profiling for the checker."""
+    yield from _enable(options, wps_profile=str(tmpdir.join('profile')))
+
+
+@pytest.fixture()
+def tracer(options, tmpdir):
+    """Enables tracing for the checker."""
+    yield from _enable(options, wps_trace=str(tmpdir.join('trace.json')))
+
+
+@pytest.fixture(scope='session')
+def run_checker():
+    """Returns function that checks a module with violations."""
+    return _run_checker
+
+
+@pytest.fixture(scope='session')
+def run_in_workers():
+    """Returns function that checks each file in its own process."""
+    return _run_in_workers
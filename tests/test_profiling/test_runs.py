@@ -0,0 +1,27 @@
+# -*- coding: utf-8 -*-
+
+import atexit
+import os
+from unittest.mock import MagicMock
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.profiling.profiler import report_current_run
+
+
+def test_profiling_reported_when_exiting(profiler, run_checker):
+    """Ensures that the current run is reported by the exit hook."""
+    run_checker()
+    report_current_run()
+
+    assert os.path.exists(profiler.path)
+
+
+def test_profiling_next_run(profiler, run_checker, options, monkeypatch):
+    """Ensures that the previous run is reported and exit hook is reused."""
+    monkeypatch.setattr(atexit, 'register', MagicMock())
+    run_checker()
+
+    Checker.parse_options(options(wps_profile=profiler.path + '.next'))
+
+    assert os.path.exists(profiler.path)
+    assert not atexit.register.called
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+
+import os
+
+from wemake_python_styleguide.profiling.profiler import Profiler
+
+
+def _read_table(profiler):
+    profiler.report()
+    with open(profiler.path) as table:
+        lines = table.read().splitlines()
+    rows = [line.split() for line in lines[1:]]
+    return lines[0], {row[0]: row for row in rows}
+
+
+def test_profiling_disabled_by_default(default_options):
+    """Ensures that profiling is disabled without the file."""
+    assert Profiler.from_options(default_options) is None
+
+
+def test_profiling_table_header(profiler, run_checker):
+    """Ensures that the table is written and the records are removed."""
+    run_checker()
+    header, _ = _read_table(profiler)
+
+    assert header.split()[:3] == ['Visitor', 'Time,', 'ms']
+    assert not os.path.exists(profiler.records_path)
+
+
+def test_profiling_table(profiler, run_checker):
+    """Ensures that each visitor is profiled."""
+    violations = run_checker()
+    _, rows = _read_table(profiler)
+
+    keywords = rows['visitors.ast.keywords:WrongKeywordVisitor']
+    assert keywords[3:6] == ['1', '1', '1']  # nodes, violations, files
+    assert keywords[6] == 'module.py'
+    assert 'Z420' in keywords[7]
+
+    numbers = rows['visitors.tokenize.primitives:WrongPrimitivesVisitor']
+    assert numbers[3:5] == ['1', '1']
+
+    assert 'visitors.filenames.module:WrongModuleNameVisitor' in rows
+    reported = sum(int(row[4]) for row in rows.values())
+    assert reported == len(violations)
+
+
+def test_profiling_across_processes(profiler, run_checker, run_in_workers):
+    """Ensures that profiles from worker processes are aggregated."""
+    run_in_workers(['first.py', 'second.py'])
+    run_checker('third.py')
+
+    _, rows = _read_table(profiler)
+    assert rows['visitors.ast.keywords:WrongKeywordVisitor'][5] == '3'
+
+
+def test_profiling_report_once(profiler, run_checker, monkeypatch):
+    """Ensures that the table is written only once, by the main process."""
+    run_checker()
+    with monkeypatch.context() as patch:
+        patch.setattr(os, 'getpid', lambda: -1)
+        profiler.report()
+    assert not os.path.exists(profiler.path)
+
+    profiler.report()
+    os.remove(profiler.path)
+
+    profiler.report()
+    assert not os.path.exists(profiler.path)
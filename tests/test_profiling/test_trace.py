@@ -0,0 +1,31 @@
+# -*- coding: utf-8 -*-
+
+import json
+
+
+def test_tracing(tracer, run_checker, run_in_workers):
+    """Ensures that the trace has spans for files, pipelines, and hooks."""
+    run_in_workers(['first.py', 'second.py'])
+    run_checker('third.py')
+    tracer.report()
+
+    assert tracer.path is None
+    with open(tracer.trace_path) as trace_file:
+        events = json.load(trace_file)['traceEvents']
+
+    lanes = [event for event in events if event['ph'] == 'M']
+    spans = [event for event in events if event['ph'] in {'B', 'E'}]
+    assert len(lanes) == 3
+    assert {event['pid'] for event in spans} == {
+        lane['pid'] for lane in lanes
+    }
+    assert {event['cat'] for event in spans} == {
+        'file', 'index', 'pipeline', 'indexed', 'finish', 'run',
+    }
+    assert sorted(
+        event['name'] for event in spans
+        if event['cat'] == 'file' and event['ph'] == 'B'
+    ) == ['first.py', 'second.py', 'third.py']
+
+    begins = [event for event in spans if event['ph'] == 'B']
+    assert len(spans) == len(begins) * 2
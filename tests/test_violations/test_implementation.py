@@ -5,14 +5,41 @@ import ast
 from wemake_python_styleguide.violations.base import ASTViolation, BaseViolation
 
 
+class _LocationViolation(ASTViolation):
+    error_template = '{0}'
+    code = 1
+
+
+class _ModuleViolation(BaseViolation):
+    error_template = '{0}'
+    code = 3
+
+
+class _TextViolation(ASTViolation):
+    error_template = 'Found {0}'
+    code = 2
+
+
 def test_visitor_returns_location():
     """Ensures that `BaseNodeVisitor` return correct violation message."""
-    visitor = ASTViolation(node=ast.parse(''), text='violation')
-    visitor.error_template = '{0}'
-    visitor.code = 1
-    assert visitor.node_items() == (0, 0, 'Z001 violation')
+    violation = _LocationViolation(node=ast.parse(''), text='violation')
+    assert violation.node_items() == (0, 0, 'Z001 violation')
 
 
 def test_checker_default_location():
     """Ensures that `BaseViolation` returns correct location."""
-    assert BaseViolation(None)._location() == (0, 0)  # noqa: Z441
+    violation = _ModuleViolation(None, text='violation')
+    assert violation.node_items() == (0, 0, 'Z003 violation')
+
+
+def test_violations_are_slotted(all_violations):
+    """Ensures that violations do not have ``__dict__``."""
+    for violation_class in all_violations:
+        violation = violation_class(node=ast.parse(''), text='text')
+        assert getattr(violation, '__dict__', None) is None, violation_class
+
+
+def test_violation_default_text():
+    """Ensures that node type is used when there's no text."""
+    violation = _TextViolation(node=ast.Pass())
+    assert violation.message() == 'Z002 Found pass'
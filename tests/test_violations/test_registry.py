@@ -0,0 +1,55 @@
+# -*- coding: utf-8 -*-
+
+import pytest
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.violations import codes, registry
+
+
+class _OtherVisitor(object):
+    """Visitor defined outside of our package."""
+
+
+def test_registry_is_up_to_date():
+    """Ensures that generated registry matches our visitors."""
+    with open(codes.__file__) as codes_file:
+        assert codes_file.read() == registry.generate(Checker.visitors), (
+            'Run `python -m wemake_python_styleguide.violations.registry`'
+        )
+
+
+def test_registry_contains_all_violations(all_violations):
+    """Ensures that all violations can be found in the registry."""
+    for violation in all_violations:
+        registered = registry.get(violation.full_code())
+
+        assert registered.load() is violation
+        assert registered in registry.match(violation.full_code()[:2])
+
+
+def test_registry_contains_visitors():
+    """Ensures that registry knows which visitors raise violations."""
+    for visitor in Checker.visitors:
+        for violation in visitor.possible_violations:
+            registered = registry.get(violation.full_code())
+            assert registry.visitor_path(visitor) in registered.visitors
+
+
+@pytest.mark.parametrize('prefix', ['Z', 'Z1', 'Z44', 'Z110'])
+def test_registry_prefix_match(prefix, all_violations):
+    """Ensures that prefix matching finds all matching codes."""
+    matched = registry.match(prefix)
+
+    assert matched
+    assert sorted(registered.code for registered in matched) == sorted(
+        violation.full_code()
+        for violation in all_violations
+        if violation.full_code().startswith(prefix)
+    )
+
+
+def test_visitor_path_outside_package():
+    """Ensures that paths of other visitors are not shortened."""
+    assert registry.visitor_path(_OtherVisitor) == (
+        '{0}:{1}'.format(__name__, _OtherVisitor.__qualname__)
+    )
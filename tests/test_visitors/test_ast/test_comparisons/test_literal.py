@@ -52,6 +52,14 @@ assert_with_message = 'assert {0} == {1}, "message"'
     ('first_name', 'second_name'),
     ('first_name', 1),
     (1, 'first_name'),
+    ('-first_name', '+1'),
+    ('first_name + 1j', '(1, *first_name)'),
+    ('[1, first_name]', '{"key": first_name, **second_name}'),
+    ('set(first_name)', '--1'),
+    ('1 + first_name', '-(1, 2)'),
+    ('2 * 2', '-"string"'),
+    ('set()', '...'),
+    ('first_name', '(1, ...)'),
 ])
 def test_non_literal(
     assert_errors,
@@ -90,6 +98,14 @@ def test_non_literal(
     ('"string1"', '"string2"'),
     ('[1, 2, 3]', '(1, 2, 3)'),
     ('{"key": 1}', '{"a", "b"}'),
+    ('-1', '+0.5'),
+    ('1 + 2j', '-1.5 - 1j'),
+    ('{None, True}', '(b"bytes", r"raw")'),
+    ('{(1, 2): [3, {4}]}', '(((1,),),)'),
+    ('{1, [2]}', '[-1j]'),
+    ('--1', '1 + 1'),
+    ('1.5 - 0.5', '1j + 1'),
+    ('(1 + 1, 2)', '[-(-1)]'),
 ])
 def test_literal(
     assert_errors,
@@ -44,6 +44,13 @@ while True and 1 == 1:
     print(1)
 """
 
+condition_with_nested_conditions = """
+if (first and second) if third or fourth else any(
+    node for node in nodes if node.first and node.second
+):
+    print(1)
+"""
+
 
 @pytest.mark.parametrize('code', [
     empty_module,
@@ -88,3 +95,28 @@ def test_module_condition_counts_violation(
     visitor.run()
 
     assert_errors(visitor, [TooManyConditionsViolation])
+
+
+@pytest.mark.parametrize(('max_conditions', 'errors'), [
+    (1, [
+        TooManyConditionsViolation,
+        TooManyConditionsViolation,
+        TooManyConditionsViolation,
+    ]),
+    (2, []),
+])
+def test_nested_condition_counts(
+    assert_errors,
+    parse_ast_tree,
+    options,
+    max_conditions,
+    errors,
+):
+    """Testing that nested conditions are not counted for outer ones."""
+    tree = parse_ast_tree(condition_with_nested_conditions)
+
+    option_values = options(max_conditions=max_conditions)
+    visitor = ConditionsVisitor(option_values, tree=tree)
+    visitor.run()
+
+    assert_errors(visitor, errors)
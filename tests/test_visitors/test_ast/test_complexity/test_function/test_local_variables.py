@@ -30,6 +30,17 @@ function_with_locals_and_params = """
     param += 3
 """
 
+function_with_nested_locals = """
+{0}def function():
+    local_variable = 1
+
+    def nested():
+        nested_variable = 2
+
+    class Nested(object):
+        attribute = 3
+"""
+
 function_with_comprehension = """
 {0}def function():
     variable1 = [node for node in parse()]
@@ -101,3 +112,20 @@ def test_locals_wrong_count(
     visitor.run()
 
     assert_errors(visitor, [TooManyLocalsViolation])
+
+
+@pytest.mark.parametrize('mode', [
+    'async ',  # coroutine
+    '',  # regular function
+])
+def test_nested_locals_count(
+    assert_errors, parse_ast_tree, options, mode,
+):
+    """Testing that locals of nested functions and classes are not counted."""
+    option_values = options(max_local_variables=1)
+    tree = parse_ast_tree(function_with_nested_locals.format(mode))
+
+    visitor = FunctionComplexityVisitor(option_values, tree=tree)
+    visitor.run()
+
+    assert_errors(visitor, [])
@@ -16,6 +16,18 @@ function_with_returns = """
     return 0
 """
 
+function_with_nested_returns = """
+{0}def function():
+    def first():
+        return 1
+
+    class Nested(object):
+        def second(self):
+            return 2
+
+    return first
+"""
+
 
 @pytest.mark.parametrize('code', [
     function_without_returns,
@@ -55,3 +67,20 @@ def test_returns_wrong_count(
     visitor.run()
 
     assert_errors(visitor, [TooManyReturnsViolation])
+
+
+@pytest.mark.parametrize('mode', [
+    'async ',  # coroutine
+    '',  # regular function
+])
+def test_nested_returns_count(
+    assert_errors, parse_ast_tree, options, mode,
+):
+    """Testing that returns of nested functions are not counted twice."""
+    tree = parse_ast_tree(function_with_nested_returns.format(mode))
+
+    option_values = options(max_returns=1)
+    visitor = FunctionComplexityVisitor(option_values, tree=tree)
+    visitor.run()
+
+    assert_errors(visitor, [])
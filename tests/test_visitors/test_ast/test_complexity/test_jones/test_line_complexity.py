@@ -96,39 +96,72 @@ def test_complex_lines(assert_errors, parse_ast_tree, code, options):
     assert_errors(visitor, [LineComplexityViolation])
 
 
-def test_same_complexity(parse_ast_tree, default_options):
-    """Ensures that complexity is counted correctly."""
-    tree_without_types = parse_ast_tree(line_simple)
-    tree_with_types = parse_ast_tree(line_with_types)
-
-    simple_visitor = JonesComplexityVisitor(
-        default_options, tree=tree_without_types,
-    )
-    typed_visitor = JonesComplexityVisitor(
-        default_options, tree=tree_with_types,
-    )
+@pytest.mark.parametrize('code', [
+    line_simple,
+    line_with_types,
+])
+def test_same_complexity(
+    assert_errors,
+    assert_error_text,
+    parse_ast_tree,
+    options,
+    code,
+):
+    """Ensures that annotations do not change the complexity."""
+    tree = parse_ast_tree(code)
 
-    simple_visitor.run()
-    typed_visitor.run()
+    option_values = options(max_line_complexity=2)
+    visitor = JonesComplexityVisitor(option_values, tree=tree)
+    visitor.run()
 
-    assert len(simple_visitor._lines) == 1  # noqa: Z441
-    assert len(simple_visitor._lines[1]) == 3  # noqa: Z441
-    assert len(typed_visitor._lines[1]) == 3  # noqa: Z441
+    assert_errors(visitor, [LineComplexityViolation])
+    assert_error_text(visitor, '3')
 
 
 @pytest.mark.parametrize('code, complexity', [
+    (line_simple, 3),
     (line_with_comprehension, 6),
     (line_with_math, 9),
 ])
-def test_exact_complexity(parse_ast_tree, default_options, code, complexity):
+def test_exact_complexity(
+    assert_errors,
+    assert_error_text,
+    parse_ast_tree,
+    options,
+    code,
+    complexity,
+):
     """Ensures that complexity is counted correctly."""
     tree = parse_ast_tree(code)
 
-    visitor = JonesComplexityVisitor(default_options, tree=tree)
+    option_values = options(max_line_complexity=complexity - 1)
+    visitor = JonesComplexityVisitor(option_values, tree=tree)
+    visitor.run()
+
+    assert_errors(visitor, [LineComplexityViolation])
+    assert_error_text(visitor, str(complexity))
+
+
+@pytest.mark.parametrize('code, complexity', [
+    (line_simple, 3),
+    (line_with_comprehension, 6),
+    (line_with_math, 9),
+])
+def test_complexity_under_limit(
+    assert_errors,
+    parse_ast_tree,
+    options,
+    code,
+    complexity,
+):
+    """Ensures that lines with the maximum complexity are allowed."""
+    tree = parse_ast_tree(code)
+
+    option_values = options(max_line_complexity=complexity)
+    visitor = JonesComplexityVisitor(option_values, tree=tree)
     visitor.run()
 
-    assert len(visitor._lines) == 1  # noqa: Z441
-    assert len(visitor._lines[1]) == complexity  # noqa: Z441
+    assert_errors(visitor, [])
 
 
 @pytest.mark.parametrize('code, number_of_lines', [
@@ -139,12 +172,13 @@ def test_exact_complexity(parse_ast_tree, default_options, code, complexity):
     (class_with_usual_and_async_function, 2),
 ])
 def test_that_some_nodes_are_ignored(
-    parse_ast_tree, default_options, code, assert_errors, number_of_lines,
+    parse_ast_tree, options, code, assert_errors, number_of_lines,
 ):
     """Ensures that complexity is counted correctly."""
     tree = parse_ast_tree(code)
 
-    visitor = JonesComplexityVisitor(default_options, tree=tree)
+    option_values = options(max_line_complexity=0)
+    visitor = JonesComplexityVisitor(option_values, tree=tree)
     visitor.run()
 
-    assert len(visitor._lines) == number_of_lines  # noqa: Z441
+    assert_errors(visitor, [LineComplexityViolation] * number_of_lines)
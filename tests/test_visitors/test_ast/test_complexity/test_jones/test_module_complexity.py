@@ -41,3 +41,24 @@ def test_module_score_error(assert_errors, parse_ast_tree, code, options):
     visitor.run()
 
     assert_errors(visitor, [JonesScoreViolation])
+
+
+@pytest.mark.parametrize(('max_jones_score', 'errors'), [
+    (6, [JonesScoreViolation]),
+    (7, []),
+])
+def test_module_score_median(
+    assert_errors,
+    parse_ast_tree,
+    options,
+    max_jones_score,
+    errors,
+):
+    """Testing that the score is the mean of two middle lines."""
+    tree = parse_ast_tree(module_with_nodes)
+
+    option_values = options(max_jones_score=max_jones_score)
+    visitor = JonesComplexityVisitor(option_values, tree=tree)
+    visitor.run()
+
+    assert_errors(visitor, errors)
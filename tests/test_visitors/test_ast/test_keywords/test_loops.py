@@ -38,17 +38,29 @@ else:
     ...
 """
 
-wrong_multiple_breaks = """
-for x in 'zzz':
-    for i in range(10):
-        if i > 1:
-            break
-    else:
+wrong_multiple_nested_for_with_break = """
+for letters in ['abc', 'zxc', 'rrd']:
+    for x in letters:
+        break
+
+    for y in letters:
+        break
+
+    while letters:
         break
 else:
     ...
 """
 
+wrong_nested_async_for_with_break = """
+async def wrapper():
+    for letters in ['abc', 'zxc', 'rrd']:
+        async for x in letters:
+            break
+    else:
+        ...
+"""
+
 # Correct:
 
 right_else_in_for_loop = """
@@ -68,15 +80,12 @@ else:
     ...
 """
 
-right_multiple_nested_for_with_break = """
-for letters in ['abc', 'zxc', 'rrd']:
-    for x in letters:
-        break
-
-    for y in letters:
-        break
-
-    while letters:
+right_break_in_nested_else = """
+for x in 'zzz':
+    for i in range(10):
+        if i > 1:
+            break
+    else:
         break
 else:
     ...
@@ -103,13 +112,18 @@ while x > 2:
     break
 """
 
+break_outside_loop = """
+break
+"""
+
 
 @pytest.mark.parametrize('code', [
     wrong_else_in_for_loop,
     wrong_nested_else_in_for_loop,
     wrong_nested_for_with_break,
     wrong_nested_while_with_break,
-    wrong_multiple_breaks,
+    wrong_multiple_nested_for_with_break,
+    wrong_nested_async_for_with_break,
 ])
 def test_wrong_else_in_for_loop(
     assert_errors,
@@ -129,10 +143,11 @@ def test_wrong_else_in_for_loop(
 @pytest.mark.parametrize('code', [
     right_else_in_for_loop,
     right_nested_break_in_for_loop,
-    right_multiple_nested_for_with_break,
     right_multiple_breaks,
+    right_break_in_nested_else,
     check_nested_if_else,
     while_with_break,
+    break_outside_loop,
 ])
 def test_correct_else_in_for_loop(
     assert_errors,
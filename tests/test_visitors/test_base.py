@@ -1,5 +1,6 @@
 # -*- coding: utf-8 -*-
 
+import ast
 from unittest.mock import MagicMock
 
 import pytest
@@ -7,8 +8,11 @@ import pytest
 from wemake_python_styleguide import constants
 from wemake_python_styleguide.visitors.base import (
     BaseFilenameVisitor,
+    BaseNodeVisitor,
     BaseVisitor,
+    SummarizedNodeVisitor,
 )
+from wemake_python_styleguide.visitors.index import NodeIndex
 
 
 def test_visitor_raises_not_implemented(default_options):
@@ -23,6 +27,15 @@ def test_base_filename_raises_not_implemented(default_options):
         BaseFilenameVisitor(default_options, filename='some.py').run()
 
 
+def test_summarized_visitor_raises_not_implemented(default_options):
+    """Ensures that `SummarizedNodeVisitor` raises `NotImplementedError`."""
+    visitor = SummarizedNodeVisitor(default_options, tree=ast.parse(''))
+    with pytest.raises(NotImplementedError):
+        visitor.run()
+    with pytest.raises(NotImplementedError):
+        visitor.merge([])
+
+
 def test_base_filename_run_do_not_call_visit(default_options):
     """Ensures that `run()` does not call `visit()` method for stdin."""
     instance = BaseFilenameVisitor(default_options, filename=constants.STDIN)
@@ -30,3 +43,23 @@ def test_base_filename_run_do_not_call_visit(default_options):
     instance.run()
 
     instance.visit_filename.assert_not_called()
+
+
+class _GlobalVisitor(BaseNodeVisitor):
+    def visit_Global(self, node) -> None:  # noqa: N802
+        self.add_violation(node)
+
+
+class _AnyNodeVisitor(BaseNodeVisitor):
+    def visit(self, node) -> None:
+        self.add_violation(node)
+
+
+def test_node_visitor_is_applicable():
+    """Ensures that visitors are not applicable without their nodes."""
+    index = NodeIndex(ast.parse('x = 1'))
+    global_index = NodeIndex(ast.parse('global x'))
+
+    assert not _GlobalVisitor.handlers.is_applicable(index)
+    assert _GlobalVisitor.handlers.is_applicable(global_index)
+    assert _AnyNodeVisitor.handlers.is_applicable(index)
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import io
+import tokenize
+
+from wemake_python_styleguide.visitors.base import (
+    BaseNodeVisitor,
+    BaseTokenVisitor,
+)
+from wemake_python_styleguide.visitors.decorators import alias
+
+
+@alias('visit_any_import', (
+    'visit_Import',
+    'visit_ImportFrom',
+))
+class _ImportVisitor(BaseNodeVisitor):
+    def visit_any_import(self, node) -> None:
+        self.add_violation(node)
+
+
+class _NumberVisitor(BaseTokenVisitor):
+    def visit_number(self, token) -> None:
+        self.add_violation(token)
+
+    def visit_unknown(self, token) -> None:
+        self.add_violation(token)
+
+
+def test_node_handlers_collected_with_aliases(default_options):
+    """Ensures that aliased handlers are collected into dispatch table."""
+    visitor = _ImportVisitor(default_options, tree=ast.parse('import os'))
+
+    assert visitor.handlers.bind(visitor, ast.Import) is not None
+    assert visitor.handlers.bind(visitor, ast.ImportFrom) is not None
+    assert visitor.handlers.bind(visitor, ast.Name) is None
+
+    visitor.run()
+    assert len(visitor.violations) == 1
+
+
+def test_token_handlers_collected(default_options):
+    """Ensures that token handlers are mapped to token types."""
+    file_tokens = tokenize.generate_tokens(io.StringIO('x = 1\n').readline)
+    visitor = _NumberVisitor(default_options, file_tokens=list(file_tokens))
+    visitor.run()
+
+    assert len(visitor.violations) == 1
+    assert visitor.violations[0].string == '1'
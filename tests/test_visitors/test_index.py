@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+import ast
+
+import pytest
+
+from wemake_python_styleguide.logics.nodes import walk_with_parents
+from wemake_python_styleguide.visitors.index import NodeIndex
+
+module_with_compares = """
+if a > 1:
+    def function():
+        return b < c == d
+"""
+
+module_with_methods = """
+class Test(object):
+    def method(self):
+        def nested(): ...
+
+    if condition:
+        @classmethod
+        def conditional(cls): ...
+
+    @staticmethod
+    def static(): ...
+
+    def late(): ...
+
+    late = staticmethod(late)
+
+    def __new__(cls): ...
+
+    value = property(late)
+
+class Meta(type):
+    def method(cls): ...
+
+def function(): ...
+"""
+
+
+def _find_function(tree: ast.AST, name: str, position: int) -> ast.AST:
+    functions = [
+        node
+        for node, _ in walk_with_parents(tree)
+        if isinstance(node, ast.FunctionDef) and node.name == name
+    ]
+    return functions[position]
+
+
+def test_index_contains_all_nodes():
+    """Ensures that index contains all nodes in visiting order."""
+    tree = ast.parse(module_with_compares)
+    index = NodeIndex(tree)
+
+    assert index.nodes == [node for node, _ in walk_with_parents(tree)]
+    assert tree is index.nodes[0]
+
+
+def test_index_by_node_type():
+    """Ensures that index returns nodes of a given type in source order."""
+    tree = ast.parse(module_with_compares)
+    index = NodeIndex(tree)
+
+    compares = index.get(ast.Compare)
+    assert [compare.lineno for compare in compares] == [2, 4]
+    assert index.get(ast.Try) == []
+
+
+def test_index_parents_and_contexts():
+    """Ensures that index links nodes to parents and contexts."""
+    tree = ast.parse(module_with_compares)
+    index = NodeIndex(tree)
+
+    condition = tree.body[0]
+    function = condition.body[0]
+    compare = function.body[0].value
+
+    assert index.get_parent(tree) is None
+    assert index.get_parent(condition) is tree
+    assert index.get_parent(function) is condition
+    assert index.get_context(function) is None
+    assert index.get_context(compare) is function
+
+
+@pytest.mark.parametrize('name, position, function_type', [
+    ('method', 0, 'method'),
+    ('nested', 0, 'function'),
+    ('conditional', 0, 'classmethod'),
+    ('static', 0, 'staticmethod'),
+    ('late', 0, 'staticmethod'),
+    ('__new__', 0, 'classmethod'),
+    ('method', 1, 'classmethod'),
+    ('function', 0, 'function'),
+])
+def test_index_function_types(name, position, function_type):
+    """Ensures that index knows function types."""
+    tree = ast.parse(module_with_methods)
+    index = NodeIndex(tree)
+
+    node = _find_function(tree, name, position)
+    assert index.get_function_type(node) == function_type
+
+
+def test_contains_any():
+    """Ensures that index tells which node types are present."""
+    index = NodeIndex(ast.parse(module_with_compares))
+
+    assert index.contains_any([ast.Lambda, ast.Compare])
+    assert not index.contains_any([ast.Lambda, ast.Global])
+    assert not index.contains_any([])
+
+
+def test_subtree_contains():
+    """Ensures that index tells which subtrees contain node types."""
+    tree = ast.parse(module_with_compares)
+    index = NodeIndex(tree)
+
+    condition = tree.body[0]
+    function = condition.body[0]
+    returned = function.body[0].value
+
+    assert index.subtrees.contains(tree, [ast.Return])
+    assert index.subtrees.contains(function, [ast.Return])
+    assert index.subtrees.contains(returned, [ast.Lambda, ast.Compare])
+    assert not index.subtrees.contains(condition.test, [ast.Return])
+    assert not index.subtrees.contains(returned, [ast.Return])
+    assert not index.subtrees.contains(tree, [ast.Yield])
@@ -0,0 +1,120 @@
+# -*- coding: utf-8 -*-
+
+import ast
+import io
+import tokenize
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.index import NodeIndex
+from wemake_python_styleguide.visitors.pipeline import (
+    NodePipeline,
+    TokenPipeline,
+)
+from wemake_python_styleguide.visitors.presets.tokens import TOKENS_PRESET
+
+module_with_violations = """
+import os
+
+def function(a, b, c, d, e, f, g):
+    def nested():
+        return lambda: 1 + 1
+    x = 0x1F
+    if x and a and b and c and d:
+        return f'{x}'
+    for item in os.listdir():
+        pass
+    else:
+        return 7.5
+"""
+
+module_with_token_violations = """
+x = u'unicode'  # noqa:
+if(x):
+    y = 1_000 + .5 + 0XFF  # type: int
+"""
+
+
+def _node_visitors():
+    return [
+        visitor_class
+        for visitor_class in Checker.visitors
+        if issubclass(visitor_class, BaseNodeVisitor)
+    ]
+
+
+def _violations(visitor):
+    return [violation.node_items() for violation in visitor.violations]
+
+
+def test_pipeline_matches_separate_runs(default_options):
+    """Ensures that pipeline finds the same violations as separate runs."""
+    tree = ast.parse(module_with_violations)
+
+    separate = []
+    for visitor_class in _node_visitors():
+        visitor = visitor_class(default_options, tree=tree)
+        visitor.run()
+        separate.append(_violations(visitor))
+
+    visitors = [
+        visitor_class(default_options, tree=tree)
+        for visitor_class in _node_visitors()
+    ]
+    NodePipeline(visitors).run(NodeIndex(tree))
+
+    assert separate == [_violations(visitor) for visitor in visitors]
+    assert any(separate)
+
+
+class _RecordingVisitor(BaseNodeVisitor):
+    def __init__(self, *args, calls, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.calls = calls
+
+    def visit_Name(self, node: ast.Name) -> None:  # noqa: N802
+        self.calls.append(('visit', id(self)))
+
+    def _post_visit(self) -> None:
+        self.calls.append(('post', id(self)))
+
+
+def test_pipeline_post_hooks_order(default_options):
+    """Ensures that post hooks are called in order after all nodes."""
+    calls = []
+    tree = ast.parse('x')
+    visitors = [
+        _RecordingVisitor(default_options, tree=tree, calls=calls),
+        _RecordingVisitor(default_options, tree=tree, calls=calls),
+    ]
+    NodePipeline(visitors).run(NodeIndex(tree))
+
+    first, second = map(id, visitors)
+    assert calls == [
+        ('visit', first),
+        ('visit', second),
+        ('post', first),
+        ('post', second),
+    ]
+
+
+def test_token_pipeline_matches_separate_runs(default_options):
+    """Ensures that token pipeline finds the same violations."""
+    file_tokens = list(tokenize.generate_tokens(
+        io.StringIO(module_with_token_violations).readline,
+    ))
+
+    separate = []
+    for visitor_class in TOKENS_PRESET:
+        visitor = visitor_class(default_options, file_tokens=file_tokens)
+        visitor.run()
+        separate.append(_violations(visitor))
+
+    visitors = [
+        visitor_class(default_options, file_tokens=file_tokens)
+        for visitor_class in TOKENS_PRESET
+    ]
+    TokenPipeline(visitors).run(file_tokens)
+
+    assert separate == [_violations(visitor) for visitor in visitors]
+    assert all(separate)
@@ -0,0 +1,256 @@
+# -*- coding: utf-8 -*-
+
+"""
+Persistent cache for the checker results.
+
+It is disabled by default. Use ``--wps-cache-dir`` option to enable it.
+
+Each file gets its own cache entry. Its key is built from:
+
+1. File name and file contents
+2. Our own configuration options, the version of this plugin,
+   and the version and implementation of the python interpreter
+3. Visitors that are selected for this file with ``select`` and ``ignore``
+
+So, any change in any of these parts invalidates the cache.
+
+When a file is changed, we still try to reuse the results
+for its unchanged top-level functions and classes,
+see :mod:`wemake_python_styleguide.incremental`.
+
+Each entry is stored in a separate file.
+Entries are written to a temporary file first and then atomically renamed.
+That's why it is safe to use the cache from several ``flake8 --jobs``
+processes at the same time: readers either see a complete entry or nothing.
+
+Cache size is bounded by :str:`wemake_python_styleguide.cache.MAX_ENTRIES`.
+When options are parsed and the number of entries is over the limit,
+least recently used entries are removed.
+Entries are counted by :mod:`wemake_python_styleguide.cache_counter`,
+so warm runs under the limit never walk the cache directory.
+
+.. currentmodule:: wemake_python_styleguide.cache
+
+.. autoclass:: ResultsCache
+   :members:
+"""
+
+import ast
+import hashlib
+import json
+import os
+import sys
+import tempfile
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple, Type
+
+from wemake_python_styleguide.cache_counter import EntriesCounter
+from wemake_python_styleguide.options.config import Configuration
+from wemake_python_styleguide.types import ConfigurationOptions, Final, final
+from wemake_python_styleguide.version import pkg_version
+from wemake_python_styleguide.visitors.base import BaseVisitor, Summaries
+
+#: Maximum number of files with cached results:
+MAX_ENTRIES: Final = 100 * 1000
+
+#: Single cached violation, flake8 format without the checker type:
+CachedResult = Tuple[int, int, str]
+
+#: Cached results of a single file or definition:
+CachedResults = List[CachedResult]
+
+#: Cached results and module metrics summaries of a file or definition:
+CachedEntry = Tuple[CachedResults, Summaries]
+
+_ENTRY_SUFFIX: Final = '.json'
+
+#: These options do not change results, so they are not a part of the key:
+_IGNORED_OPTIONS: Final = frozenset((
+    'wps_cache_dir',
+    'wps_profile',
+    'wps_trace',
+))
+
+
+def _hash(*parts: str) -> str:
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(part.encode('utf-8', 'surrogatepass'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def _entry_path(directory: str, key: str) -> str:
+    return os.path.join(directory, key[:2], key + _ENTRY_SUFFIX)
+
+
+def _read_summaries(summaries: Summaries) -> Summaries:
+    return {
+        str(visitor_name): tuple(int(metric) for metric in summary)
+        for visitor_name, summary in summaries.items()
+    }
+
+
+def _read_entry(path: str) -> CachedEntry:
+    with open(path, encoding='utf-8') as entry:
+        stored = json.load(entry)
+    return (
+        [
+            (int(line), int(column), str(text))
+            for line, column, text in stored[0]
+        ],
+        _read_summaries(stored[1]),
+    )
+
+
+def _remove_entry(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        return  # removed by another process
+
+
+def _find_entries(directory: str) -> Iterator[Tuple[float, str]]:
+    for root, _, filenames in os.walk(directory):
+        for filename in filenames:
+            if not filename.endswith(_ENTRY_SUFFIX):
+                continue  # temporary file of another process
+            path = os.path.join(root, filename)
+            try:
+                yield os.stat(path).st_mtime, path
+            except OSError:
+                continue  # removed by another process
+
+
+@final
+class ResultsCache(object):
+    """
+    Stores violations found in files inside the given directory.
+
+    All errors related to the file system are treated as cache misses,
+    so are broken entries. Cache must never break the linting itself.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        options: ConfigurationOptions,
+        max_entries: int = MAX_ENTRIES,
+    ) -> None:
+        """Creates new cache inside the given directory."""
+        self.directory = os.path.abspath(directory)
+        self.max_entries = max_entries
+        self._counter = EntriesCounter(self.directory)
+
+        option_values = {
+            option.attribute_name: getattr(
+                options, option.attribute_name, None,
+            )
+            for option in Configuration.options
+            if option.attribute_name not in _IGNORED_OPTIONS
+        }
+        self._options_hash = _hash(
+            pkg_version,
+            sys.implementation.cache_tag,
+            str(sys.version_info),
+            json.dumps(option_values, sort_keys=True),
+        )
+
+    @classmethod
+    def from_options(
+        cls,
+        options: ConfigurationOptions,
+    ) -> Optional['ResultsCache']:
+        """Creates new cache if it is enabled with ``--wps-cache-dir``."""
+        directory = getattr(options, 'wps_cache_dir', None)
+        if not directory:
+            return None
+        return cls(directory, options)
+
+    def make_key(
+        self,
+        filename: str,
+        lines: Sequence[str],
+        visitors: Iterable[Type[BaseVisitor]],
+    ) -> str:
+        """Returns the cache key for a file checked by the given visitors."""
+        return _hash(
+            self._options_hash,
+            filename,
+            ','.join(visitor.__qualname__ for visitor in visitors),
+            ''.join(lines),
+        )
+
+    def make_definition_key(
+        self,
+        definition: ast.AST,
+        visitors: Iterable[Type[BaseVisitor]],
+    ) -> str:
+        """
+        Returns the cache key for a single top-level function or class.
+
+        Node positions are a part of the key,
+        since they are a part of the reported violations.
+        """
+        return _hash(
+            self._options_hash,
+            ','.join(visitor.__qualname__ for visitor in visitors),
+            ast.dump(definition, include_attributes=True),
+        )
+
+    def get(self, key: str) -> Optional[CachedEntry]:
+        """
+        Returns cached results and summaries.
+
+        Returns ``None`` when there are no results.
+        """
+        path = _entry_path(self.directory, key)
+        try:
+            cached_entry = _read_entry(path)
+            os.utime(path)  # marks this entry as recently used
+        except (OSError, ValueError, TypeError, LookupError, AttributeError):
+            return None
+        return cached_entry
+
+    def put(
+        self,
+        key: str,
+        violations: CachedResults,
+        summaries: Optional[Summaries] = None,
+    ) -> None:
+        """Atomically stores results and summaries for the given key."""
+        path = _entry_path(self.directory, key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            is_new = not os.path.exists(path)
+            descriptor, temp_path = tempfile.mkstemp(
+                dir=os.path.dirname(path),
+                suffix='.tmp',
+            )
+        except OSError:
+            return
+
+        try:
+            with os.fdopen(descriptor, 'w', encoding='utf-8') as entry:
+                json.dump([violations, summaries or {}], entry)
+            os.replace(temp_path, path)
+        except OSError:
+            _remove_entry(temp_path)
+            return
+
+        if is_new:
+            self._counter.add()
+
+    def evict(self) -> None:
+        """
+        Removes least recently used entries over the size limit.
+
+        Does nothing, while the number of counted entries is under the limit.
+        """
+        if self._counter.count() <= self.max_entries:
+            return
+
+        entries = sorted(_find_entries(self.directory), reverse=True)
+        for _, path in entries[self.max_entries:]:
+            _remove_entry(path)
+
+        self._counter.reset(min(len(entries), self.max_entries))
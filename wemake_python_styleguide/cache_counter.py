@@ -0,0 +1,67 @@
+# -*- coding: utf-8 -*-
+
+"""
+Counter of the results cache entries.
+
+Walking the cache directory is slow: it has up to
+:str:`wemake_python_styleguide.cache.MAX_ENTRIES` entries.
+So, we count entries in a separate file instead.
+Each new entry appends a single byte to it,
+so the number of entries is the size of this file.
+Appending a single byte is atomic, so it is safe
+to do from several ``flake8 --jobs`` processes.
+
+The counter is approximate: entries removed by other tools
+are still counted. It is fixed by the next eviction.
+
+.. currentmodule:: wemake_python_styleguide.cache_counter
+
+.. autoclass:: EntriesCounter
+   :members:
+
+"""
+
+import os
+
+from wemake_python_styleguide.types import Final, final
+
+#: Name of the counter file inside the cache directory:
+COUNTER_NAME: Final = 'entries'
+
+_MARK: Final = b'.'
+
+
+@final
+class EntriesCounter(object):
+    """
+    Counts entries stored in the cache directory.
+
+    All errors related to the file system are ignored,
+    broken counter only makes eviction happen earlier or later.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """Creates new counter inside the given cache directory."""
+        self.path = os.path.join(directory, COUNTER_NAME)
+
+    def count(self) -> int:
+        """Returns the number of stored entries."""
+        try:
+            return os.stat(self.path).st_size
+        except OSError:
+            return 0  # nothing is stored yet
+
+    def add(self) -> None:
+        """Counts a single new entry."""
+        self._write(1, mode='ab')
+
+    def reset(self, entries: int) -> None:
+        """Sets the number of stored entries, after some are removed."""
+        self._write(entries, mode='wb')
+
+    def _write(self, entries: int, mode: str) -> None:
+        try:
+            with open(self.path, mode) as counter:
+                counter.write(_MARK * entries)
+        except OSError:
+            return  # the next eviction will walk the cache again
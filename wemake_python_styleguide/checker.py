@@ -56,23 +56,69 @@ Checker API
 """
 
 import ast
+import importlib
 import tokenize
-from typing import ClassVar, Generator, Sequence, Type
+from typing import ClassVar, Generator, Optional, Sequence, Tuple, Type
 
 from flake8.options.manager import OptionManager
 
-from wemake_python_styleguide import constants, types
+from wemake_python_styleguide import constants, incremental, types
 from wemake_python_styleguide import version as pkg_version
+from wemake_python_styleguide.cache import ResultsCache
 from wemake_python_styleguide.options.config import Configuration
-from wemake_python_styleguide.visitors import base
-from wemake_python_styleguide.visitors.presets import (
-    complexity,
-    general,
-    tokens,
-)
+from wemake_python_styleguide.options.selection import VisitorsSelection
+from wemake_python_styleguide.profiling.profiler import Profiler
+from wemake_python_styleguide.visitors import base, pipeline
 
 VisitorClass = Type[base.BaseVisitor]
 
+#: Presets with all our visitors, in the order they are run:
+_PRESETS: Sequence[Tuple[str, str]] = (
+    ('general', 'GENERAL_PRESET'),
+    ('complexity', 'COMPLEXITY_PRESET'),
+    ('tokens', 'TOKENS_PRESET'),
+)
+
+
+def _store_summaries(
+    visitors: Sequence[base.BaseVisitor],
+    summaries: Optional[base.Summaries],
+) -> None:
+    for visitor in visitors:
+        if isinstance(visitor, base.SummarizedNodeVisitor):
+            visitor.summaries = summaries
+
+
+@types.final
+class _LazyVisitors(object):
+    """
+    Imports visitors from presets on the first access.
+
+    Visitors import all violations, which are mostly documentation.
+    So, we do not pay for importing them until we really need them.
+    For example, ``flake8 --version`` and ``flake8 --help`` never do.
+    Regular checks do not need all visitors either,
+    only the selected ones are imported, see :class:`.VisitorsSelection`.
+    """
+
+    def __get__(
+        self,
+        instance: Optional['Checker'],
+        owner: Type['Checker'],
+    ) -> Sequence[VisitorClass]:
+        visitors = tuple(
+            visitor
+            for module_name, preset_name in _PRESETS
+            for visitor in getattr(
+                importlib.import_module(
+                    'wemake_python_styleguide.visitors.presets.' + module_name,
+                ),
+                preset_name,
+            )
+        )
+        setattr(owner, 'visitors', visitors)  # next time there's no import
+        return visitors
+
 
 @types.final
 class Checker(object):
@@ -87,6 +133,10 @@ class Checker(object):
         config: custom configuration object used to provide and parse options.
         options: option structure passed by ``flake8``.
         visitors: sequence of visitors that we run with this checker.
+        selection: visitors that can find enabled violations with these options.
+        cache: results cache, ``None`` when caching is disabled.
+        profiler: visitors profiler, ``None`` when profiling
+            and tracing are disabled.
 
     """
 
@@ -95,18 +145,23 @@ class Checker(object):
 
     config = Configuration()
     options: types.ConfigurationOptions
+    selection: VisitorsSelection
+    cache: Optional[ResultsCache] = None
+    profiler: Optional[Profiler] = None
 
-    visitors: ClassVar[Sequence[VisitorClass]] = (
-        *general.GENERAL_PRESET,
-        *complexity.COMPLEXITY_PRESET,
-        *tokens.TOKENS_PRESET,
+    _pipelined_visitors: ClassVar[Tuple[VisitorClass, ...]] = (
+        base.BaseNodeVisitor,
+        base.BaseTokenVisitor,
     )
 
+    visitors = _LazyVisitors()
+
     def __init__(
         self,
         tree: ast.AST,
         file_tokens: Sequence[tokenize.TokenInfo],
         filename: str = constants.STDIN,
+        lines: Sequence[str] = (),
     ) -> None:
         """
         Creates new checker instance.
@@ -122,6 +177,7 @@ class Checker(object):
             tree: ``ast`` parsed by ``flake8``. Differs from ``ast.parse``.
             file_tokens: ``tokenize.tokenize`` parsed file tokens.
             filename: module file name, might be empty if piping is used.
+            lines: physical lines of the module, used to cache results.
 
         See also:
             http://flake8.pycqa.org/en/latest/plugin-development/index.html
@@ -130,6 +186,11 @@ class Checker(object):
         self.tree = tree
         self.filename = filename
         self.file_tokens = file_tokens
+        self.lines = lines
+        self.profile = (
+            None if self.profiler is None
+            else self.profiler.create_profile(filename)
+        )
 
     @classmethod
     def add_options(cls, parser: OptionManager) -> None:
@@ -146,24 +207,77 @@ class Checker(object):
 
     @classmethod
     def parse_options(cls, options: types.ConfigurationOptions) -> None:
-        """Parses registered options for providing them to each visitor."""
+        """
+        Parses registered options for providing them to each visitor.
+
+        Also selects visitors that should be run with these options,
+        only their modules are imported.
+        Prepares the results cache and the profiler, when enabled.
+        """
         cls.options = options
+        cls.selection = VisitorsSelection(options)
+        cls.cache = ResultsCache.from_options(options)
+        if cls.cache is not None:
+            cls.cache.evict()
+        cls.profiler = Profiler.from_options(options)
+        if cls.profiler is not None:
+            cls.profiler.start()
+
+    def _is_applicable(self, visitor_class: VisitorClass) -> bool:
+        if issubclass(visitor_class, base.BaseNodeVisitor):
+            return visitor_class.handlers.is_applicable(self.index)
+        return True
 
     def _run_checks(
         self,
         visitors: Sequence[VisitorClass],
+        tree: ast.AST,
+        summaries: Optional[base.Summaries] = None,
     ) -> Generator[types.CheckResult, None, None]:
         """
-        Runs all passed visitors one by one.
+        Runs all passed visitors, ``ast`` based ones are run on the given tree.
+
+        All ``ast`` based visitors are run together with a single traversal,
+        that has built the index of nodes for this file.
+        Visitors that have no nodes to check in this file are skipped.
+        All ``tokenize`` based visitors are run with a single loop.
+        Other visitors are run one by one.
+        When profiling is enabled, each visitor is profiled separately.
+        When tracing is enabled, building the index is traced as well.
+
+        When summaries are passed, the tree is a part of the module.
+        Then summarized visitors store their summaries there
+        instead of checking the module metrics.
 
         Yields:
             Violations that were found by the passed visitors.
 
         """
-        for visitor_class in visitors:
-            visitor = visitor_class.from_checker(self)
-            visitor.run()
-
+        self.index = pipeline.build_index(tree, self.profile)
+        instances = [
+            visitor_class.from_checker(self)
+            for visitor_class in visitors
+            if self._is_applicable(visitor_class)
+        ]
+        _store_summaries(instances, summaries)
+
+        pipeline.NodePipeline([
+            visitor for visitor in instances
+            if isinstance(visitor, base.BaseNodeVisitor)
+        ], self.profile).run(self.index)
+
+        pipeline.TokenPipeline([
+            visitor for visitor in instances
+            if isinstance(visitor, base.BaseTokenVisitor)
+        ], self.profile).run(self.file_tokens)
+
+        for visitor in instances:
+            if not isinstance(visitor, self._pipelined_visitors):
+                pipeline.run_visitor(visitor, self.profile)
+
+        for visitor in instances:
+            if self.profile is not None:
+                self.profile.add_violations(visitor)
             for error in visitor.violations:
                 yield (*error.node_items(), type(self))
 
@@ -173,5 +287,43 @@ class Checker(object):
 
         This method is used by ``flake8`` API.
         It is executed after all configuration is parsed.
+
+        When the cache is enabled, results for unchanged files
+        are taken from the cache and no checks are run at all.
+        Results for unchanged definitions inside changed files
+        are also taken from the cache.
+
+        When profiling or tracing is enabled, the profile of this file
+        is saved after all violations are reported.
         """
-        yield from self._run_checks(self.visitors)
+        visitors = self.selection.for_filename(self.filename)
+        profiler = self.profiler
+        if profiler is None or self.profile is None:
+            yield from self._run_cached_checks(visitors)
+            return
+
+        with self.profile.span(self.filename, 'file'):
+            yield from self._run_cached_checks(visitors)
+        profiler.save(self.profile)
+
+    def _run_cached_checks(
+        self,
+        visitors: Sequence[VisitorClass],
+    ) -> Generator[types.CheckResult, None, None]:
+        if self.cache is None or not self.lines:
+            yield from self._run_checks(visitors, self.tree)
+            return
+
+        checks = incremental.IncrementalChecks(
+            self.cache,
+            self.options,
+            self._run_checks,
+        )
+        violations = checks.run(
+            self.filename,
+            self.lines,
+            self.tree,
+            visitors,
+        )
+        for line, column, text in violations:
+            yield (line, column, text, type(self))
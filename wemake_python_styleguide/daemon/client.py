@@ -0,0 +1,129 @@
+# -*- coding: utf-8 -*-
+
+"""
+Thin client of our daemon and the ``wps-daemon`` command.
+
+Start the daemon, then check files or unsaved buffers:
+
+.. code:: bash
+
+    wps-daemon serve &
+    wps-daemon check your_module.py
+    cat module.py | wps-daemon check - --stdin-display-name=module.py
+
+Violations are printed in the same format ``flake8`` uses.
+
+.. currentmodule:: wemake_python_styleguide.daemon.client
+
+.. autofunction:: request
+
+"""
+
+import argparse
+import json
+import os
+import socket
+import sys
+from contextlib import suppress
+from typing import List, Optional, Sequence
+
+from flake8.main.application import Application
+
+from wemake_python_styleguide.types import Final
+
+#: Default path to the daemon's socket, relative to the working directory:
+SOCKET_PATH: Final = '.wps-daemon.sock'
+
+#: Encoding of requests and responses:
+ENCODING: Final = 'utf-8'
+
+
+def request(
+    socket_path: str,
+    filename: str,
+    source: Optional[str] = None,
+) -> List[str]:
+    """
+    Asks the running daemon to check a file, returns formatted results.
+
+    Files are read by the daemon, which has its own working directory.
+    So, paths of files without the ``source`` are sent as absolute ones.
+    """
+    if source is None:
+        filename = os.path.abspath(filename)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+        connection.connect(socket_path)
+        payload = json.dumps({'filename': filename, 'source': source})
+        connection.sendall(payload.encode(ENCODING) + b'\n')
+        with connection.makefile('rb') as response_file:
+            response = json.loads(
+                response_file.readline().decode(ENCODING),
+            )
+
+    if 'error' in response:
+        raise RuntimeError(response['error'])
+    return response['results']
+
+
+def _serve(arguments: argparse.Namespace, flake8_argv: Sequence[str]) -> int:
+    # Server is based on Unix sockets, so it is imported on Unix only:
+    from wemake_python_styleguide.daemon import server  # noqa: Z435
+
+    application = Application()
+    application.initialize(list(flake8_argv))
+    with server.CheckerDaemon(arguments.socket, application) as daemon:
+        with suppress(KeyboardInterrupt):
+            daemon.serve_forever()
+    return 0
+
+
+def _check(arguments: argparse.Namespace) -> int:
+    has_violations = False
+    for filename in arguments.filenames:
+        source = None
+        if filename == '-':
+            source = sys.stdin.read()
+            filename = arguments.stdin_display_name
+
+        for line in request(arguments.socket, filename, source):
+            has_violations = True
+            sys.stdout.write(line + '\n')
+    return int(has_violations)
+
+
+def _create_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='wps-daemon')
+    parser.add_argument('--socket', default=SOCKET_PATH)
+    subparsers = parser.add_subparsers(dest='command')
+    subparsers.required = True
+
+    subparsers.add_parser(
+        'serve',
+        help='Start the daemon, unknown arguments are passed to flake8.',
+    )
+
+    check_parser = subparsers.add_parser('check', help='Check files.')
+    check_parser.add_argument('filenames', nargs='+')
+    check_parser.add_argument('--stdin-display-name', default='stdin')
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Entry point for the ``wps-daemon`` command.
+
+    Raises:
+        RuntimeError: on Windows, since there are no Unix sockets.
+
+    """
+    if sys.platform == 'win32':
+        raise RuntimeError('wps-daemon requires Unix sockets')
+
+    parser = _create_parser()
+    arguments, unknown = parser.parse_known_args(argv)
+    if arguments.command == 'serve':
+        return _serve(arguments, unknown)
+    if unknown:
+        message = 'unrecognized arguments: {0}'.format(' '.join(unknown))
+        parser.error(message)
+    return _check(arguments)
@@ -0,0 +1,159 @@
+# -*- coding: utf-8 -*-
+
+"""
+Long-lived daemon that keeps our checker warm between invocations.
+
+Running ``flake8`` means importing all the plugins, parsing configuration,
+and only then checking files. For editors and ``pre-commit`` hooks
+this startup time is much bigger than the time spent on checks.
+
+So, you can start a daemon once:
+
+.. code:: bash
+
+    wps-daemon serve
+
+It parses ``flake8`` configuration as usual and then listens
+on a Unix socket. Checker, its options, and its caches stay in memory.
+Socket is removed when the daemon is stopped,
+see :class:`~wemake_python_styleguide.daemon.sockets.UnixSocketServer`.
+
+Results are reported in the same format ``flake8`` uses.
+Only violations of this plugin are reported.
+``select``, ``ignore``, ``per-file-ignores``, and ``noqa`` are respected.
+
+The daemon does not watch the configuration, restart it when it is changed.
+
+.. currentmodule:: wemake_python_styleguide.daemon.server
+
+.. autoclass:: CheckerDaemon
+   :members:
+
+"""
+
+import ast
+import io
+import json
+import socket
+import tokenize
+from contextlib import redirect_stdout
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from flake8.main.application import Application
+from flake8.statistics import Statistics
+
+from wemake_python_styleguide.checker import Checker
+from wemake_python_styleguide.daemon import client, sockets
+from wemake_python_styleguide.types import CheckResult, final
+
+
+@final
+class CheckerDaemon(sockets.UnixSocketServer):
+    """
+    Serves checks over a Unix socket.
+
+    Requests are handled one by one, so no locking is required.
+    Each connection is a single JSON request and a single JSON response.
+    """
+
+    def __init__(self, socket_path: str, application: Application) -> None:
+        """
+        Starts listening on the socket.
+
+        Options are already parsed by ``flake8`` when it loads our plugin,
+        so the checker is ready to run.
+        Violations are decided on and formatted by the style guide
+        and the formatter of the already initialized ``flake8`` application.
+        """
+        self._guide = application.guide
+        self._formatter = application.formatter
+        super().__init__(socket_path)
+
+    # `typeshed` does not know that stream servers always pass sockets:
+    def finish_request(  # type: ignore
+        self,
+        request: socket.socket,
+        client_address: object,
+    ) -> None:
+        """
+        Answers a single request, errors are sent as responses too.
+
+        Any error of a single request must not stop the daemon.
+        """
+        with request.makefile('rb') as request_file:
+            raw_request = request_file.readline()
+
+        response: Dict[str, object]
+        try:
+            response = {'results': self._check_request(raw_request)}
+        except Exception as exc:
+            response = {'error': str(exc)}
+        request.sendall(json.dumps(response).encode(client.ENCODING) + b'\n')
+
+    def check(self, filename: str, source: Optional[str] = None) -> List[str]:
+        """
+        Checks a file and returns ``flake8`` formatted violations.
+
+        When ``source`` is passed, it is checked instead of the file contents.
+        That's how unsaved editor buffers are checked.
+        Statistics of the style guide are collected for this check only.
+        """
+        lines = _read_source(filename, source).splitlines(keepends=True)
+        checker = _create_checker(filename, lines)
+
+        # Formatter writes to the stdout, when it has no output file:
+        self._guide.stats = Statistics()
+        self._formatter.output_fd = None
+        output = io.StringIO()
+        with redirect_stdout(output):
+            for violation in sorted(checker.run(), key=_position):
+                self._handle_error(filename, lines, violation)
+        return output.getvalue().splitlines()
+
+    def _check_request(self, raw_request: bytes) -> List[str]:
+        parsed_request = json.loads(raw_request.decode(client.ENCODING))
+        return self.check(
+            parsed_request['filename'],
+            parsed_request.get('source'),
+        )
+
+    def _handle_error(
+        self,
+        filename: str,
+        lines: Sequence[str],
+        violation: CheckResult,
+    ) -> None:
+        line, column = _position(violation)
+        code, message = violation[2].split(' ', 1)
+        self._guide.handle_error(
+            code, filename, line, column, message, _physical_line(lines, line),
+        )
+
+
+def _read_source(filename: str, source: Optional[str]) -> str:
+    if source is not None:
+        return source
+    with tokenize.open(filename) as source_file:
+        return source_file.read()
+
+
+def _create_checker(filename: str, lines: Sequence[str]) -> Checker:
+    source = ''.join(lines)
+    return Checker(
+        tree=ast.parse(source, filename),
+        file_tokens=list(
+            tokenize.generate_tokens(io.StringIO(source).readline),
+        ),
+        filename=filename,
+        lines=lines,
+    )
+
+
+def _position(violation: CheckResult) -> Tuple[int, int]:
+    return violation[0], violation[1]
+
+
+def _physical_line(lines: Sequence[str], line: int) -> str:
+    if 0 < line <= len(lines):
+        return lines[line - 1]
+    return ''  # violations of the whole module are reported on line zero
@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+"""
+Unix socket server, which owns its socket file.
+
+Socket file is removed when the server is closed.
+Socket file of a crashed server is replaced, when nobody listens on it.
+Socket file of a running server is never touched, binding fails instead.
+
+There are no Unix sockets on Windows, so there's no daemon either.
+
+.. currentmodule:: wemake_python_styleguide.daemon.sockets
+
+.. autoclass:: UnixSocketServer
+   :members:
+
+"""
+
+import os
+import socket
+import socketserver
+import stat
+from typing import Type
+
+
+class UnixSocketServer(socketserver.UnixStreamServer):
+    """Binds to a Unix socket and removes it when closed."""
+
+    _is_bound = False
+
+    def __init__(
+        self,
+        socket_path: str,
+        handler_class: Type[socketserver.BaseRequestHandler] = (
+            socketserver.BaseRequestHandler
+        ),
+    ) -> None:
+        """
+        Binds to the socket and starts listening.
+
+        Servers that answer requests themselves need no handler class.
+        """
+        self.socket_path = socket_path
+        # `typeshed` expects `(host, port)` addresses for all stream servers:
+        super().__init__(socket_path, handler_class)  # type: ignore
+
+    def server_bind(self) -> None:
+        """Replaces the socket of a crashed server and binds to it."""
+        if _is_stale_socket(self.socket_path):
+            os.remove(self.socket_path)
+        super().server_bind()
+        self._is_bound = True
+
+    def server_close(self) -> None:
+        """Stops listening and removes the socket, if it was created."""
+        super().server_close()
+        if self._is_bound:
+            self._is_bound = False
+            os.remove(self.socket_path)
+
+
+def _is_stale_socket(socket_path: str) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(socket_path)
+        except ConnectionRefusedError:
+            return stat.S_ISSOCK(os.lstat(socket_path).st_mode)
+        except OSError:
+            return False  # there's no socket, other errors are for binding
+    return False  # another server is listening, binding fails as usual
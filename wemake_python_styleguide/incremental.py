@@ -0,0 +1,232 @@
+# -*- coding: utf-8 -*-
+
+"""
+Incremental checks reuse cached results of unchanged code.
+
+When a file is changed, we still try to reuse the results
+for its unchanged top-level functions and classes.
+Visitors marked as ``is_definition_local`` are run only on the definitions
+that have changed or moved, the rest of the results are taken from the cache.
+
+Module-level metrics, like the Jones score and the number of module members
+or imports, are checked by :class:`.SummarizedNodeVisitor` subclasses.
+They are run on changed definitions too. Their summaries are cached
+together with the results of each definition,
+and module metrics are checked on the summaries of all definitions.
+So, the tree of the whole module is not indexed for a changed file.
+
+Other visitors are run on the whole module.
+These are ``tokenize`` based visitors and visitors of file names,
+they do not need the tree.
+
+.. currentmodule:: wemake_python_styleguide.incremental
+
+.. autoclass:: IncrementalChecks
+   :members:
+
+"""
+
+import ast
+from typing import (
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from wemake_python_styleguide.cache import (
+    CachedResult,
+    CachedResults,
+    ResultsCache,
+)
+from wemake_python_styleguide.types import (
+    CheckResult,
+    ConfigurationOptions,
+    Final,
+    final,
+)
+from wemake_python_styleguide.visitors.base import (
+    BaseNodeVisitor,
+    BaseVisitor,
+    Summaries,
+    SummarizedNodeVisitor,
+)
+
+VisitorClasses = Sequence[Type[BaseVisitor]]
+
+#: Runs the given visitors on the given part of the module, like checker:
+RunChecks = Callable[
+    [VisitorClasses, ast.AST, Optional[Summaries]],
+    Iterable[CheckResult],
+]
+
+#: Top-level definitions that are checked and cached separately:
+_DEFINITIONS: Final = (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)
+
+
+def _split_visitors(
+    visitors: VisitorClasses,
+) -> Tuple[VisitorClasses, VisitorClasses]:
+    """Returns visitors that are run on module parts, and all the others."""
+    part_visitors = [
+        visitor_class
+        for visitor_class in visitors
+        if issubclass(visitor_class, SummarizedNodeVisitor) or (
+            issubclass(visitor_class, BaseNodeVisitor) and
+            visitor_class.is_definition_local
+        )
+    ]
+    return part_visitors, [
+        visitor_class
+        for visitor_class in visitors
+        if visitor_class not in part_visitors
+    ]
+
+
+def _new_module(body: List[ast.stmt]) -> ast.Module:
+    return ast.Module(body=body, type_ignores=[])
+
+
+def _needs_tree(visitors: VisitorClasses) -> bool:
+    return any(
+        issubclass(visitor_class, BaseNodeVisitor)
+        for visitor_class in visitors
+    )
+
+
+@final
+class IncrementalChecks(object):
+    """
+    Runs checks of a single file, reusing the cached results.
+
+    Results for unchanged files are taken from the cache,
+    no checks are run at all.
+
+    Visitors that are local to definitions and summarized visitors
+    are run on each changed top-level function and class separately,
+    and on the rest of the module. Then summarized visitors check
+    module metrics merged from the summaries of all these parts.
+    Other visitors are run on the whole module.
+    """
+
+    def __init__(
+        self,
+        cache: ResultsCache,
+        options: ConfigurationOptions,
+        run_checks: RunChecks,
+    ) -> None:
+        """Creates new checks that store their results in the cache."""
+        self.cache = cache
+        self.options = options
+        self._run_checks = run_checks
+
+    def run(
+        self,
+        filename: str,
+        lines: Sequence[str],
+        tree: ast.AST,
+        visitors: VisitorClasses,
+    ) -> CachedResults:
+        """Returns cached or freshly found results of the whole file."""
+        key = self.cache.make_key(filename, lines, visitors)
+        cached_entry = self.cache.get(key)
+        if cached_entry is not None:
+            return cached_entry[0]
+
+        violations = list(self._check_module(filename, tree, visitors))
+        self.cache.put(key, violations)
+        return violations
+
+    def _check_module(
+        self,
+        filename: str,
+        tree: ast.AST,
+        visitors: VisitorClasses,
+    ) -> Iterator[CachedResult]:
+        part_visitors, module_visitors = _split_visitors(visitors)
+        summaries: List[Summaries] = [{}]
+
+        rest = []
+        for statement in getattr(tree, 'body', []):
+            if isinstance(statement, _DEFINITIONS):
+                yield from self._check_definition(
+                    statement,
+                    part_visitors,
+                    summaries,
+                )
+            else:
+                rest.append(statement)
+
+        yield from self._check_tree(
+            _new_module(rest),
+            part_visitors,
+            summaries[0],
+        )
+        yield from self._merge(filename, part_visitors, summaries)
+        yield from self._check_tree(
+            tree if _needs_tree(module_visitors) else _new_module([]),
+            module_visitors,
+        )
+
+    def _check_definition(
+        self,
+        definition: ast.stmt,
+        visitors: VisitorClasses,
+        summaries: List[Summaries],
+    ) -> CachedResults:
+        key = self.cache.make_definition_key(definition, visitors)
+        cached_entry = self.cache.get(key)
+        if cached_entry is not None:
+            summaries.append(cached_entry[1])
+            return cached_entry[0]
+
+        definition_summaries: Summaries = {}
+        violations = list(self._check_tree(
+            _new_module([definition]),
+            visitors,
+            definition_summaries,
+        ))
+        self.cache.put(key, violations, definition_summaries)
+        summaries.append(definition_summaries)
+        return violations
+
+    def _merge(
+        self,
+        filename: str,
+        visitors: VisitorClasses,
+        summaries: Sequence[Summaries],
+    ) -> Iterator[CachedResult]:
+        for visitor_class in visitors:
+            if not issubclass(visitor_class, SummarizedNodeVisitor):
+                continue
+
+            visitor_name = visitor_class.__qualname__
+            visitor = visitor_class(
+                self.options,
+                tree=_new_module([]),
+                filename=filename,
+            )
+            visitor.merge([
+                part_summaries[visitor_name]
+                for part_summaries in summaries
+                if visitor_name in part_summaries
+            ])
+            for violation in visitor.violations:
+                yield violation.node_items()
+
+    def _check_tree(
+        self,
+        tree: ast.AST,
+        visitors: VisitorClasses,
+        summaries: Optional[Summaries] = None,
+    ) -> Iterator[CachedResult]:
+        for line, column, text, _ in self._run_checks(
+            visitors,
+            tree,
+            summaries,
+        ):
+            yield (line, column, text)
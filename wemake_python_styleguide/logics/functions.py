@@ -1,10 +1,27 @@
 # -*- coding: utf-8 -*-
 
-from ast import Call
-from typing import Iterable, Optional
+import ast
+from typing import Dict, Iterable, Optional
 
+from wemake_python_styleguide.types import AnyFunctionDef
 
-def given_function_called(node: Call, to_check: Iterable[str]) -> str:
+#: Statements that may contain methods inside the class body.
+_METHOD_CONTAINER_NODES = (ast.If, ast.While, ast.For, ast.With, ast.Try)
+
+#: Decorators that change the type of the method.
+_METHOD_DECORATORS = {
+    'classmethod': 'classmethod',
+    'staticmethod': 'staticmethod',
+}
+
+#: Methods that are implicitly treated as class methods.
+_IMPLICIT_CLASSMETHODS = frozenset((
+    '__new__',
+    '__init_subclass__',
+))
+
+
+def given_function_called(node: ast.Call, to_check: Iterable[str]) -> str:
     """
     Returns function name if it is called and contained in the `to_check`.
 
@@ -49,3 +66,76 @@ def is_method(function_type: Optional[str]) -> bool:
 
     """
     return function_type in ['method', 'classmethod']
+
+
+def _get_late_decorations(node: ast.ClassDef) -> Dict[str, str]:
+    """Finds old style decorators like ``method = staticmethod(method)``."""
+    late_decorations = {}
+    for statement in node.body:
+        if not isinstance(statement, ast.Assign):
+            continue
+
+        call = statement.value
+        if not isinstance(call, ast.Call) or len(call.args) != 1:
+            continue
+
+        decorator = getattr(call.func, 'id', None)
+        method = getattr(call.args[0], 'id', None)
+        if decorator in _METHOD_DECORATORS and method is not None:
+            late_decorations[method] = _METHOD_DECORATORS[decorator]
+    return late_decorations
+
+
+def _get_method_type(
+    node: AnyFunctionDef,
+    is_metaclass: bool,
+    late_decorations: Dict[str, str],
+) -> str:
+    if node.name in late_decorations:
+        return late_decorations[node.name]
+
+    for decorator in node.decorator_list:
+        decorator_name = getattr(decorator, 'id', None)
+        if decorator_name in _METHOD_DECORATORS:
+            return _METHOD_DECORATORS[decorator_name]
+
+    if node.name in _IMPLICIT_CLASSMETHODS or is_metaclass:
+        return 'classmethod'
+    return 'method'
+
+
+def get_methods_types(node: ast.ClassDef) -> Dict[ast.AST, str]:
+    """
+    Returns types of all methods defined in a class body.
+
+    Types are the same ones ``pep8-naming`` uses:
+    ``method``, ``classmethod``, and ``staticmethod``.
+
+    >>> import ast
+    >>> module = ast.parse('''
+    ... class Test(object):
+    ...     def method(self): ...
+    ...     @staticmethod
+    ...     def static(): ...
+    ... ''')
+    >>> types = get_methods_types(module.body[0])
+    >>> sorted((method.name, kind) for method, kind in types.items())
+    [('method', 'method'), ('static', 'staticmethod')]
+
+    """
+    late_decorations = _get_late_decorations(node)
+    is_metaclass = any(
+        getattr(base, 'id', None) == 'type' for base in node.bases
+    )
+
+    methods_types: Dict[ast.AST, str] = {}
+    to_check = list(ast.iter_child_nodes(node))
+    while to_check:
+        method = to_check.pop()
+        if isinstance(method, _METHOD_CONTAINER_NODES):
+            to_check.extend(ast.iter_child_nodes(method))
+        elif isinstance(method, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            methods_types[method] = _get_method_type(
+                method, is_metaclass, late_decorations,
+            )
+    return methods_types
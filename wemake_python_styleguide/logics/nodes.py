@@ -1,27 +1,138 @@
 # -*- coding: utf-8 -*-
 
 import ast
-from typing import Tuple, Type
+from typing import Iterator, List, Optional, Sequence, Tuple, Type
+
+from wemake_python_styleguide.types import Final
+
+#: Node and its parent, module has no parent.
+NodeWithParent = Tuple[ast.AST, Optional[ast.AST]]
+
+#: Missing from ``typeshed`` for ``python3.6``, this node exists since 3.8.
+_CONSTANT_NODE: Type[ast.AST] = getattr(ast, 'Constant')
+
+#: These nodes are literals, they are ``Constant`` since 3.8.
+_CONSTANT_NODES: Final = frozenset((
+    _CONSTANT_NODE,
+    ast.Num,
+    ast.Str,
+    ast.Bytes,
+    ast.NameConstant,
+))
 
 
 def is_literal(node: ast.AST) -> bool:
     """
     Checks for nodes that contains only constants.
 
-    If the node contains only literals it will be evaluated.
-    When node relies on some other names, it won't be evaluated.
+    Nothing is evaluated: node is checked only by types of its parts.
+    Literals are numbers, strings, bytes, ``True``, ``False``, and ``None``.
+    Numbers can have signs and can be added or subtracted,
+    like ``-1``, ``--1``, ``1 + 1``, or ``-1 + 2j``.
+    Tuples, lists, sets, and dicts of literals are literals too,
+    unless they unpack something.
+    Everything else is not a literal: names, calls like ``set()``,
+    ``...``, and any other operations like ``2 * 2`` or ``-'a'``.
+    So, results are the same as of ``ast.literal_eval`` on ``python3.6``.
+
+    >>> import ast
+    >>> is_literal(ast.parse('(1, -2.5, {"a": {None}}, b"")').body[0].value)
+    True
+    >>> is_literal(ast.parse('(1 + 1, --1, 1.5 - 0.5j)').body[0].value)
+    True
+    >>> is_literal(ast.parse('set()').body[0].value)
+    False
+    >>> is_literal(ast.parse('[1, *other]').body[0].value)
+    False
+    >>> is_literal(ast.parse('2 * 2').body[0].value)
+    False
+
+    """
+    to_check = [node]
+    while to_check:
+        parts = _literal_parts(to_check.pop())
+        if parts is None:
+            return False
+        to_check.extend(
+            part for part in parts if not _is_constant(part)
+        )
+    return True
+
+
+def _literal_parts(node: ast.AST) -> Optional[Sequence[ast.AST]]:
+    """Returns parts of a literal to check, ``None`` for non-literals."""
+    if isinstance(node, (ast.Tuple, ast.List, ast.Set)):
+        return node.elts
+    if isinstance(node, ast.Dict):
+        if any(key is None for key in node.keys):
+            return None  # dict unpacking: `{**other}`
+        return node.keys + node.values
+    if _is_constant(node) or _is_number_operation(node):
+        return []
+    return None
+
+
+def _is_constant(node: ast.AST) -> bool:
+    """Checks for constants, ``Ellipsis`` is also a ``Constant`` since 3.8."""
+    return (
+        type(node) in _CONSTANT_NODES and
+        getattr(node, 'value', None) is not Ellipsis
+    )
+
+
+def _is_number(node: ast.AST) -> bool:
+    """Checks for numbers, ``True`` and ``False`` are numbers too."""
+    return isinstance(node, ast.Num) or (
+        isinstance(node, ast.NameConstant) and node.value is not None
+    )
+
+
+def _is_number_operation(node: ast.AST) -> bool:
+    """Checks for signed numbers and sums of numbers like ``-1 + 2j``."""
+    to_check = [node]
+    while to_check:
+        part = to_check.pop()
+        if not _is_number(part):
+            operands = _number_operands(part)
+            if operands is None:
+                return False
+            to_check.extend(operands)
+    return True
+
+
+def _number_operands(node: ast.AST) -> Optional[Sequence[ast.AST]]:
+    """Returns operands of signs and sums, ``None`` for other nodes."""
+    if isinstance(node, ast.UnaryOp):
+        is_sign = isinstance(node.op, (ast.UAdd, ast.USub))
+        return [node.operand] if is_sign else None
+    if isinstance(node, ast.BinOp):
+        is_sum = isinstance(node.op, (ast.Add, ast.Sub))
+        return [node.left, node.right] if is_sum else None
+    return None
+
+
+def walk_with_parents(tree: ast.AST) -> Iterator[NodeWithParent]:
+    """
+    Yields all nodes with their parents.
+
+    Nodes are yielded in the same order as ``ast.NodeVisitor`` visits them.
+    Unlike ``ast.walk`` this is a depth-first pre-order traversal.
+    It does not use recursion, so it works fine with deeply nested trees.
+
+    >>> import ast
+    >>> module = ast.parse('x = y')
+    >>> [
+    ...     (type(node).__name__, type(parent).__name__)
+    ...     for node, parent in walk_with_parents(module)
+    ... ][:3]
+    [('Module', 'NoneType'), ('Assign', 'Module'), ('Name', 'Assign')]
+
     """
-    try:
-        ast.literal_eval(node)
-    except ValueError:
-        return False
-    else:
-        return True
-
-
-def is_contained(node: ast.AST, to_check: Tuple[Type[ast.AST], ...]) -> bool:
-    """Checks whether node does contain given subnode types."""
-    for child in ast.walk(node):
-        if isinstance(child, to_check):
-            return True
-    return False
+    to_visit: List[NodeWithParent] = [(tree, None)]
+    while to_visit:
+        node, parent = to_visit.pop()
+        yield node, parent
+        to_visit.extend(
+            (child, node)
+            for child in reversed(list(ast.iter_child_nodes(node)))
+        )
@@ -17,12 +17,17 @@ class _Option(object):
     """Represents ``flake8`` option object."""
 
     long_option_name: str
-    default: int  # noqa: E704
+    default: Optional[Union[str, int]]  # noqa: E704
     help: str
     type: Optional[str] = 'int'  # noqa: A003
     parse_from_config: bool = True
     action: str = 'store'
 
+    @property
+    def attribute_name(self) -> str:
+        """Returns the name of this option in the parsed options."""
+        return self.long_option_name[2:].replace('-', '_')
+
 
 @final
 class Configuration(object):
@@ -88,6 +93,18 @@ class Configuration(object):
       definition, defaults to
       :str:`wemake_python_styleguide.options.defaults.MAX_BASE_CLASSES`
 
+    Options for performance:
+
+    - ``wps-cache-dir`` - directory to store results of unchanged files in,
+      caching is disabled by default, defaults to
+      :str:`wemake_python_styleguide.options.defaults.CACHE_DIR`
+    - ``wps-profile`` - file to write time, nodes, and violations
+      of each visitor to, profiling is disabled by default, defaults to
+      :str:`wemake_python_styleguide.options.defaults.PROFILE`
+    - ``wps-trace`` - file to write the Chrome trace of the run to,
+      tracing is disabled by default, defaults to
+      :str:`wemake_python_styleguide.options.defaults.TRACE`
+
     All options are configurable via ``flake8`` CLI:
 
     Example::
@@ -202,6 +219,29 @@ class Configuration(object):
             action='store_true',
             type=None,
         ),
+
+        # Performance:
+
+        _Option(
+            '--wps-cache-dir',
+            defaults.CACHE_DIR,
+            'Directory to cache results in, caching is disabled by default.',
+            type='string',
+        ),
+
+        _Option(
+            '--wps-profile',
+            defaults.PROFILE,
+            'File to write visitors profile to, disabled by default.',
+            type='string',
+        ),
+
+        _Option(
+            '--wps-trace',
+            defaults.TRACE,
+            'File to write Chrome trace of the run to, disabled by default.',
+            type='string',
+        ),
     ]
 
     def register_options(self, parser: OptionManager) -> None:
@@ -65,3 +65,15 @@ MAX_CONDITIONS: Final = 4
 
 #: Maximum number of base classes:
 MAX_BASE_CLASSES: Final = 3
+
+
+# Performance
+
+#: Directory to cache results in, ``None`` disables the cache:
+CACHE_DIR: Final = None
+
+#: File to write visitors profiling table to, ``None`` disables profiling:
+PROFILE: Final = None
+
+#: File to write the Chrome trace of the run to, ``None`` disables tracing:
+TRACE: Final = None
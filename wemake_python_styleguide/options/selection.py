@@ -0,0 +1,146 @@
+# -*- coding: utf-8 -*-
+
+"""
+Finds visitors that are worth running with the given ``flake8`` options.
+
+``flake8`` filters out disabled violations only after all checks are done.
+But, when all violations of a visitor are disabled with
+``select``, ``ignore``, ``extend-ignore``, or ``per-file-ignores``
+there's no need to run this visitor at all.
+
+We use ``flake8`` own decision engine to find out what is disabled.
+So, the result is always the same as without the selection.
+Each violation code is only checked once,
+then we use the violations registry to find visitors that raise it.
+Only modules of the selected visitors are imported.
+
+``per-file-ignores`` are only respected with ``flake8`` 3.7 and newer,
+older versions do not have this option at all.
+"""
+
+import copy
+import fnmatch
+import os
+from typing import Dict, List, Sequence, Tuple, Type
+
+from flake8 import utils
+from flake8.style_guide import Decision, DecisionEngine
+
+from wemake_python_styleguide.types import ConfigurationOptions, final
+from wemake_python_styleguide.violations import registry
+from wemake_python_styleguide.visitors.base import BaseVisitor
+
+VisitorClasses = Tuple[Type[BaseVisitor], ...]
+
+_NOT_PARSED = object()
+
+
+def _select_visitors(
+    options: ConfigurationOptions,
+    visitor_paths: Sequence[str],
+) -> Tuple[str, ...]:
+    engine = DecisionEngine(options)
+    enabled_visitors = {
+        visitor_path
+        for violation in registry.match('Z')
+        if engine.decision_for(violation.code) == Decision.Selected
+        for visitor_path in violation.visitors
+    }
+    return tuple(
+        visitor_path for visitor_path in visitor_paths
+        if visitor_path in enabled_visitors
+    )
+
+
+def _with_ignored(
+    options: ConfigurationOptions,
+    codes: Sequence[str],
+) -> ConfigurationOptions:
+    file_options = copy.copy(options)
+    extend_ignore = getattr(options, 'extend_ignore', None) or ()
+    setattr(file_options, 'extend_ignore', [*extend_ignore, *codes])
+    return file_options
+
+
+def _matches_filename(filename: str, pattern: str) -> bool:
+    """
+    Matches file name against ``per-file-ignores`` pattern.
+
+    That's what ``flake8.utils.matches_filename`` does,
+    it is not available before ``flake8`` 3.7.
+    """
+    basename = os.path.basename(filename)
+    if basename not in {'.', '..'} and fnmatch.fnmatch(basename, pattern):
+        return True
+    return fnmatch.fnmatch(os.path.abspath(filename), pattern)
+
+
+@final
+class VisitorsSelection(object):
+    """
+    Contains visitors that can report at least one enabled violation.
+
+    Selection is done once, when options are parsed.
+    Visitors are found by their paths in the registry,
+    only the selected ones are imported.
+    Then we only match file names against ``per-file-ignores`` patterns.
+    """
+
+    def __init__(self, options: ConfigurationOptions) -> None:
+        """Selects visitors for all files and for ``per-file-ignores``."""
+        self._per_file: List[Tuple[str, VisitorClasses]] = []
+
+        selected = registry.visitor_paths()
+        if getattr(options, 'select', _NOT_PARSED) is not _NOT_PARSED:
+            selected = _select_visitors(options, selected)
+        # Otherwise, options were not parsed by `flake8`, nothing is disabled.
+
+        self._visitors: Dict[str, Type[BaseVisitor]] = {
+            visitor_path: registry.load_visitor(visitor_path)
+            for visitor_path in selected
+        }
+        self._default = tuple(self._visitors.values())
+        self._select_per_file(options, selected)
+
+    def for_filename(self, filename: str) -> VisitorClasses:
+        """
+        Returns visitors that should be run for the given file.
+
+        The most specific matching ``per-file-ignores`` pattern wins,
+        that's how ``flake8`` does it.
+        """
+        return self._match_per_file(filename)
+
+    def _select_per_file(
+        self,
+        options: ConfigurationOptions,
+        visitor_paths: Sequence[str],
+    ) -> None:
+        # There's no such option before `flake8` 3.7:
+        per_file_ignores = getattr(options, 'per_file_ignores', None)
+        if not per_file_ignores:
+            return
+
+        mapping = utils.parse_files_to_codes_mapping(per_file_ignores)
+        for filename, codes in mapping:
+            file_options = _with_ignored(options, codes)
+            self._per_file.append((
+                utils.normalize_path(filename),
+                tuple(
+                    self._visitors[visitor_path]
+                    for visitor_path in _select_visitors(
+                        file_options,
+                        visitor_paths,
+                    )
+                ),
+            ))
+
+    def _match_per_file(self, filename: str) -> VisitorClasses:
+        selected_pattern = ''
+        selected = self._default
+        for pattern, visitors in self._per_file:
+            is_more_specific = len(pattern) > len(selected_pattern)
+            if is_more_specific and _matches_filename(filename, pattern):
+                selected_pattern = pattern
+                selected = visitors
+        return selected
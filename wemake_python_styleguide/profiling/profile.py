@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+
+"""
+Profile of all visitors on a single checked file.
+
+.. currentmodule:: wemake_python_styleguide.profiling.profile
+
+.. autoclass:: FileProfile
+   :members:
+
+.. autofunction:: span
+
+"""
+
+import os
+import time
+from typing import (
+    Callable,
+    ContextManager,
+    Dict,
+    List,
+    Optional,
+    TypeVar,
+    Union,
+)
+
+from wemake_python_styleguide.profiling.records import TraceEvent, VisitorStats
+from wemake_python_styleguide.types import Final, final
+from wemake_python_styleguide.violations import registry
+from wemake_python_styleguide.visitors.base import (
+    BaseVisitor,
+    BoundHandler,
+    TokenHandler,
+)
+
+#: Handler of nodes or tokens, it is wrapped as it is:
+_AnyHandler = TypeVar('_AnyHandler', BoundHandler, TokenHandler)
+
+_MICROSECONDS: Final = 1000 * 1000
+
+
+@final
+class _ProfiledHandler(object):
+    """Handler that also counts visited nodes or tokens and time."""
+
+    def __init__(
+        self,
+        node_handler: Union[BoundHandler, TokenHandler],
+        stats: VisitorStats,
+    ) -> None:
+        self._node_handler = node_handler
+        self._stats = stats
+
+    def __call__(self, node) -> None:
+        start = time.perf_counter()
+        self._node_handler(node)
+        self._stats.seconds += time.perf_counter() - start
+        self._stats.nodes += 1
+
+
+@final
+class _ProfiledHook(object):
+    """Hook that also counts time and is traced."""
+
+    def __init__(
+        self,
+        hook: Callable[[], None],
+        stats: VisitorStats,
+        span_context: ContextManager[None],
+    ) -> None:
+        self._hook = hook
+        self._stats = stats
+        self._span = span_context
+
+    def __call__(self) -> None:
+        with self._span:
+            start = time.perf_counter()
+            self._hook()
+            self._stats.seconds += time.perf_counter() - start
+
+
+@final
+class _Span(object):
+    """Adds begin and end events around the block."""
+
+    def __init__(self, events: List[TraceEvent], name: str, category: str):
+        self._events = events
+        self._name = name
+        self._category = category
+
+    def __enter__(self) -> None:
+        self._add_event('B')
+
+    def __exit__(self, *exc_info) -> None:
+        self._add_event('E')
+
+    def _add_event(self, phase: str) -> None:
+        pid = os.getpid()
+        self._events.append({
+            'name': self._name,
+            'cat': self._category,
+            'ph': phase,
+            'ts': time.perf_counter() * _MICROSECONDS,
+            'pid': pid,
+            'tid': pid,
+        })
+
+
+@final
+class _NoSpan(object):
+    """Does nothing, used when there's nothing to trace."""
+
+    def __enter__(self) -> None:
+        """Enters the block."""
+
+    def __exit__(self, *exc_info) -> None:
+        """Leaves the block."""
+
+
+_NO_SPAN: Final = _NoSpan()
+
+
+@final
+class FileProfile(object):
+    """
+    Collects statistics and trace events of all visitors on a single file.
+
+    Statistics are collected when profiling is enabled,
+    events are collected when tracing is enabled.
+    """
+
+    def __init__(
+        self,
+        filename: str,
+        with_stats: bool = True,
+        with_events: bool = False,
+    ) -> None:
+        """Creates empty profile for the given file."""
+        self.filename = filename
+        self.visitors: Dict[str, VisitorStats] = {}
+        self.events: List[TraceEvent] = []
+        self._with_stats = with_stats
+        self._with_events = with_events
+
+    def wrap_handler(
+        self,
+        visitor: BaseVisitor,
+        node_handler: _AnyHandler,
+    ) -> _AnyHandler:
+        """
+        Returns handler that also counts visited nodes or tokens and time.
+
+        Handlers are not traced, there are way too many calls.
+        """
+        if not self._with_stats:
+            return node_handler
+        return _ProfiledHandler(node_handler, self._stats_for(visitor))
+
+    def wrap_hook(
+        self,
+        visitor: BaseVisitor,
+        hook: Callable[[], None],
+    ) -> Callable[[], None]:
+        """Returns hook, like ``run()`` or ``finish()``, that counts time."""
+        return _ProfiledHook(
+            hook,
+            self._stats_for(visitor),
+            self.span(type(visitor).__qualname__, hook.__name__),
+        )
+
+    def add_violations(self, visitor: BaseVisitor) -> None:
+        """Counts violations found by the visitor."""
+        self._stats_for(visitor).violations += len(visitor.violations)
+
+    def span(self, name: str, category: str) -> ContextManager[None]:
+        """Adds begin and end events around the block, when tracing."""
+        if not self._with_events:
+            return _NO_SPAN
+        return _Span(self.events, name, category)
+
+    def _stats_for(self, visitor: BaseVisitor) -> VisitorStats:
+        if not self._with_stats:
+            return VisitorStats()  # nobody is interested in these numbers
+        return self.visitors.setdefault(
+            registry.visitor_path(type(visitor)),
+            VisitorStats(),
+        )
+
+
+def span(
+    profile: Optional[FileProfile],
+    name: str,
+    category: str,
+) -> ContextManager[None]:
+    """Traces the block, when profile is passed and tracing is enabled."""
+    if profile is None:
+        return _NO_SPAN
+    return profile.span(name, category)
@@ -0,0 +1,193 @@
+# -*- coding: utf-8 -*-
+
+"""
+Profiling and tracing of our visitors.
+
+Both are disabled by default.
+
+Profiling
+---------
+
+Use ``--wps-profile`` option to find out which visitors are slow:
+
+.. code:: bash
+
+    flake8 --wps-profile=profile.txt your_package
+
+For each visitor on each checked file we record:
+
+1. Wall time spent in its handlers and hooks
+2. Number of nodes and tokens it has visited
+3. Number of violations it has found
+
+Visitors still share a single traversal,
+so the numbers are the same as in the regular runs.
+The time of the traversal itself is not attributed to any visitor.
+When the run is finished, the table with the slowest visitors first
+is written to ``profile.txt``.
+
+Tracing
+-------
+
+Use ``--wps-trace`` option to see how the time is spent over the run:
+
+.. code:: bash
+
+    flake8 --wps-trace=trace.json your_package
+
+It writes begin and end events in the Chrome trace format for each file,
+for building the node index, for pipelines, for each visitor
+that is run on its own, and for each post hook.
+Open the trace in ``chrome://tracing`` or `Perfetto <https://ui.perfetto.dev>`_.
+Each process gets its own lane. So, you can see files that are
+disproportionately expensive and how long the workers are idle.
+
+Worker processes
+----------------
+
+``flake8 --jobs`` runs checks in several worker processes.
+So, each worker appends the profile of each file
+to a shared records file, like ``profile.txt.records``.
+Records are aggregated by the main process when the run is finished.
+Then the records file is removed.
+
+Files that are taken from the ``--wps-cache-dir`` cache are not checked,
+so they are not profiled. Disable the cache to profile all files.
+
+.. currentmodule:: wemake_python_styleguide.profiling.profiler
+
+.. autoclass:: Profiler
+   :members:
+
+.. autofunction:: report_current_run
+
+"""
+
+import atexit
+import json
+import os
+from typing import List, Optional
+
+from wemake_python_styleguide.profiling.profile import FileProfile
+from wemake_python_styleguide.profiling.records import ProfileRecord
+from wemake_python_styleguide.profiling.reports import (
+    format_table,
+    format_trace,
+)
+from wemake_python_styleguide.types import ConfigurationOptions, Final, final
+
+_RECORDS_SUFFIX: Final = '.records'
+
+#: Profiler of the current run, it is reported when the process exits.
+#: Exit hook is registered once, when the first profiler is started:
+_current_run: List['Profiler'] = []
+
+
+def _optional_abspath(path: Optional[str]) -> Optional[str]:
+    return os.path.abspath(path) if path else None
+
+
+@final
+class Profiler(object):
+    """
+    Collects profiles of all checked files and writes the final reports.
+
+    Profiles are saved by the process that checked the file,
+    reports are written by the process that has created the profiler.
+    """
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        trace_path: Optional[str] = None,
+    ) -> None:
+        """
+        Creates new profiler.
+
+        The table is written to ``path``, the trace to ``trace_path``.
+        At least one of them should be passed.
+        """
+        self.path = _optional_abspath(path)
+        self.trace_path = _optional_abspath(trace_path)
+        self.records_path = '{0}{1}'.format(
+            self.path or self.trace_path,
+            _RECORDS_SUFFIX,
+        )
+        self._pid = os.getpid()
+
+    @classmethod
+    def from_options(
+        cls,
+        options: ConfigurationOptions,
+    ) -> Optional['Profiler']:
+        """Creates new profiler with ``--wps-profile`` or ``--wps-trace``."""
+        path = getattr(options, 'wps_profile', None)
+        trace_path = getattr(options, 'wps_trace', None)
+        if not path and not trace_path:
+            return None
+        return cls(path, trace_path)
+
+    def start(self) -> None:
+        """
+        Removes records of the previous run, reports when exiting.
+
+        The previous profiler of this process is reported right away,
+        its run is finished when options are parsed again.
+        """
+        if not _current_run:
+            atexit.register(report_current_run)
+        for previous_profiler in _current_run:
+            previous_profiler.report()
+        _current_run[:] = [self]
+        open(self.records_path, 'w').close()
+
+    def create_profile(self, filename: str) -> FileProfile:
+        """Creates new profile for the file that is going to be checked."""
+        return FileProfile(
+            filename,
+            with_stats=self.path is not None,
+            with_events=self.trace_path is not None,
+        )
+
+    def save(self, profile: FileProfile) -> None:
+        """
+        Appends the file profile to the records.
+
+        Each record is written with a single ``write`` call
+        to a file opened in the append mode.
+        So, records from different processes are never mixed.
+        """
+        record = ProfileRecord(
+            filename=profile.filename,
+            visitors=profile.visitors,
+            events=profile.events,
+        ).to_json() + '\n'
+        with open(self.records_path, 'ab', buffering=0) as records_file:
+            records_file.write(record.encode('utf-8'))
+
+    def report(self) -> None:
+        """Aggregates all saved records and writes the reports."""
+        if os.getpid() != self._pid:
+            return  # only the main process writes the reports
+
+        try:
+            with open(self.records_path, encoding='utf-8') as records_file:
+                records = [
+                    ProfileRecord.from_json(line) for line in records_file
+                ]
+        except FileNotFoundError:
+            return  # already reported by another profiler with this path
+
+        if self.path is not None:
+            with open(self.path, 'w', encoding='utf-8') as table:
+                table.write(format_table(records))
+        if self.trace_path is not None:
+            with open(self.trace_path, 'w', encoding='utf-8') as trace:
+                json.dump(format_trace(records, self._pid), trace)
+        os.remove(self.records_path)
+
+
+def report_current_run() -> None:
+    """Reports the profiler of the current run, called when exiting."""
+    for profiler in _current_run:
+        profiler.report()
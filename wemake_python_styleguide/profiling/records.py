@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+
+"""
+Records of checked files, as they are saved by each process.
+
+.. currentmodule:: wemake_python_styleguide.profiling.records
+
+.. autoclass:: VisitorStats
+   :members:
+
+.. autoclass:: ProfileRecord
+   :members:
+
+"""
+
+import json
+from typing import Dict, List, NamedTuple
+
+from wemake_python_styleguide.types import final
+
+#: Single event in the Chrome trace format:
+TraceEvent = Dict[str, object]
+
+
+@final
+class VisitorStats(object):
+    """
+    Statistics of a single visitor on a single file.
+
+    Time is counted in ``seconds``, ``nodes`` include visited tokens,
+    ``violations`` are all violations found by the visitor.
+    """
+
+    __slots__ = ('seconds', 'nodes', 'violations')
+
+    def __init__(
+        self,
+        seconds: float = 0.0,
+        nodes: int = 0,
+        violations: int = 0,
+    ) -> None:
+        """Creates statistics, they are empty by default."""
+        self.seconds = seconds
+        self.nodes = nodes
+        self.violations = violations
+
+    def as_json(self) -> Dict[str, float]:
+        """Returns statistics as they are saved to the records."""
+        return {
+            'seconds': self.seconds,
+            'nodes': self.nodes,
+            'violations': self.violations,
+        }
+
+
+class ProfileRecord(NamedTuple):
+    """Profile of a single file, as it is saved to the records."""
+
+    #: Checked file name.
+    filename: str
+
+    #: Statistics of each visitor by its path, when profiling.
+    visitors: Dict[str, VisitorStats]
+
+    #: Trace events of this file, when tracing.
+    events: List[TraceEvent]
+
+    @classmethod
+    def from_json(cls, line: str) -> 'ProfileRecord':
+        """Reads the record saved by :meth:`to_json`."""
+        record = json.loads(line)
+        return cls(
+            filename=record['filename'],
+            visitors={
+                visitor_path: VisitorStats(**stats)
+                for visitor_path, stats in record['visitors'].items()
+            },
+            events=record['events'],
+        )
+
+    def to_json(self) -> str:
+        """Returns the record as a single line of JSON."""
+        return json.dumps({
+            'filename': self.filename,
+            'visitors': {
+                visitor_path: stats.as_json()
+                for visitor_path, stats in self.visitors.items()
+            },
+            'events': self.events,
+        })
@@ -0,0 +1,122 @@
+# -*- coding: utf-8 -*-
+
+"""Reports that are built from the saved profiles of all checked files."""
+
+from collections import defaultdict
+from typing import DefaultDict, Dict, Iterable, List, Sequence, Tuple
+
+from wemake_python_styleguide.profiling.records import (
+    ProfileRecord,
+    TraceEvent,
+    VisitorStats,
+)
+from wemake_python_styleguide.types import Final, final
+from wemake_python_styleguide.violations import registry
+
+_COLUMNS: Final = (
+    'Visitor',
+    'Time, ms',
+    'Share',
+    'Nodes',
+    'Violations',
+    'Files',
+    'Slowest file',
+    'Codes',
+)
+
+
+@final
+class _Row(object):
+    """Aggregated statistics of a single visitor."""
+
+    def __init__(self) -> None:
+        self.seconds = 0.0
+        self.nodes = 0
+        self.violations = 0
+        self.files = 0
+        self.slowest: Tuple[float, str] = (0.0, '')
+
+    def add(self, filename: str, stats: VisitorStats) -> None:
+        self.seconds += stats.seconds
+        self.nodes += stats.nodes
+        self.violations += stats.violations
+        self.files += 1
+        self.slowest = max(self.slowest, (stats.seconds, filename))
+
+
+def _aggregate(records: Iterable[ProfileRecord]) -> Dict[str, _Row]:
+    rows: DefaultDict[str, _Row] = defaultdict(_Row)
+    for record in records:
+        for visitor_path, stats in record.visitors.items():
+            rows[visitor_path].add(record.filename, stats)
+    return rows
+
+
+def _visitor_codes() -> Dict[str, str]:
+    codes: DefaultDict[str, List[str]] = defaultdict(list)
+    for violation in registry.match('Z'):
+        for visitor_path in violation.visitors:
+            codes[visitor_path].append(violation.code)
+    return {
+        visitor_path: ','.join(visitor_codes)
+        for visitor_path, visitor_codes in codes.items()
+    }
+
+
+def _table_lines(rows: Dict[str, _Row]) -> List[Sequence[str]]:
+    total = sum(row.seconds for row in rows.values()) or 1
+    codes = _visitor_codes()
+    lines: List[Sequence[str]] = [_COLUMNS]
+    for visitor_path, row in sorted(
+        rows.items(), key=lambda item: item[1].seconds, reverse=True,
+    ):
+        lines.append((
+            visitor_path,
+            '{0:.3f}'.format(row.seconds * 1000),
+            '{0:.1%}'.format(row.seconds / total),
+            str(row.nodes),
+            str(row.violations),
+            str(row.files),
+            row.slowest[1],
+            codes.get(visitor_path, ''),
+        ))
+    return lines
+
+
+def format_table(records: Iterable[ProfileRecord]) -> str:
+    """Returns the table with the slowest visitors first."""
+    lines = _table_lines(_aggregate(records))
+    widths = [max(map(len, column)) for column in zip(*lines)]
+    return ''.join(
+        '  '.join(
+            cell.ljust(width) for cell, width in zip(line, widths)
+        ).rstrip() + '\n'
+        for line in lines
+    )
+
+
+def format_trace(
+    records: Iterable[ProfileRecord],
+    main_pid: int,
+) -> Dict[str, object]:
+    """Returns the trace with a separate lane for each process."""
+    all_events: List[TraceEvent] = [
+        event for record in records for event in record.events
+    ]
+    lanes = {
+        event['pid']: 'flake8' if main_pid == event['pid'] else 'worker'
+        for event in all_events
+    }
+    return {
+        'traceEvents': [
+            {
+                'name': 'process_name',
+                'ph': 'M',
+                'pid': pid,
+                'tid': pid,
+                'args': {'name': '{0} {1}'.format(lane, pid)},
+            }
+            for pid, lane in sorted(lanes.items())
+        ] + all_events,
+        'displayTimeUnit': 'ms',
+    }
@@ -15,7 +15,7 @@ If any of the following statements is true, move the type to this file:
 """
 
 import ast
-from typing import Tuple, Type, Union
+from typing import Optional, Tuple, Type, Union
 
 from typing_extensions import Final, Protocol, final  # noqa: F401
 
@@ -69,3 +69,8 @@ class ConfigurationOptions(Protocol):
     max_imports: int
     max_conditions: int
     max_base_classes: int
+
+    # Performance:
+    wps_cache_dir: Optional[str]
+    wps_profile: Optional[str]
+    wps_trace: Optional[str]
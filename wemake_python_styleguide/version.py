@@ -1,13 +1,22 @@
 # -*- coding: utf-8 -*-
 
-import pkg_resources
+try:
+    from importlib import metadata as importlib_metadata  # noqa: Z435
+except ImportError:  # pragma: no cover
+    import importlib_metadata  # type: ignore  # noqa: Z435
 
 
 def _get_version(dist_name: str) -> str:  # pragma: no cover
-    """Fetches distribution name. Contains a fix for Sphinx."""
+    """
+    Fetches distribution name. Contains a fix for Sphinx.
+
+    We do not use ``pkg_resources``: it is really slow to import
+    and we pay this price on each ``flake8`` run.
+    ``importlib_metadata`` backport is used on ``python`` before ``3.8``.
+    """
     try:
-        return pkg_resources.get_distribution(dist_name).version
-    except pkg_resources.DistributionNotFound:
+        return importlib_metadata.version(dist_name)
+    except importlib_metadata.PackageNotFoundError:
         return ''  # readthedocs can not install `poetry` projects
 
 
@@ -34,7 +34,7 @@ Violations API
 
 import ast
 import tokenize
-from typing import ClassVar, Optional, Tuple, Union
+from typing import ClassVar, Dict, Optional, Tuple, Union
 
 from wemake_python_styleguide.types import final
 
@@ -46,7 +46,26 @@ ErrorNode = Union[
 ]
 
 
-class BaseViolation(object):
+class _ViolationMeta(type):
+    """
+    Makes all violations compact slotted records.
+
+    We create a lot of violations in some files.
+    So, we do not want each of them to have its own ``__dict__``.
+    Subclasses do not have to define ``__slots__`` themselves.
+    """
+
+    def __new__(
+        cls,
+        name: str,
+        bases: Tuple[type, ...],
+        namespace: Dict[str, object],
+    ) -> type:
+        namespace.setdefault('__slots__', ())
+        return super().__new__(cls, name, bases, namespace)
+
+
+class BaseViolation(object, metaclass=_ViolationMeta):
     """
     Abstract base class for all style violations.
 
@@ -55,6 +74,9 @@ class BaseViolation(object):
 
     Each subclass must define ``error_template`` and ``code`` fields.
 
+    Violations are stored as compact records: node and optional text.
+    Full message is only formatted when ``flake8`` asks for it.
+
     Attributes:
         error_template: message that will be shown to user after formatting.
         code: violation unique number. Used to identify the violation.
@@ -62,10 +84,23 @@ class BaseViolation(object):
 
     """
 
+    __slots__ = ('_node', '_text')
+
     error_template: ClassVar[str]
     code: ClassVar[int]
     should_use_text: ClassVar[bool] = True
 
+    _message_template: ClassVar[str]
+
+    def __init_subclass__(cls) -> None:
+        """Prepends the full code to the template once per violation class."""
+        super().__init_subclass__()
+        error_template = getattr(cls, 'error_template', None)
+        if getattr(cls, 'code', None) is not None and error_template:
+            cls._message_template = '{0} {1}'.format(
+                cls.full_code(), error_template,
+            )
+
     def __init__(self, node: ErrorNode, text: str = None) -> None:
         """
         Creates new instance of abstract violation.
@@ -76,21 +111,18 @@ class BaseViolation(object):
 
         """
         self._node = node
-
-        if text is None:
-            self._text = node.__class__.__name__.lower()
-        else:
-            self._text = text
+        self._text = text
 
     @final
-    def _full_code(self) -> str:
+    @classmethod
+    def full_code(cls) -> str:
         """
         Returns fully formatted code.
 
         Adds violation letter to the numbers.
         Also ensures that codes like ``3`` will be represented as ``Z003``.
         """
-        return 'Z' + str(self.code).zfill(3)
+        return 'Z' + str(cls.code).zfill(3)
 
     def _location(self) -> Tuple[int, int]:
         """
@@ -106,12 +138,15 @@ class BaseViolation(object):
         Returns error's formatted message with code and reason.
 
         Conditionally formats the ``error_template`` if it is required.
+        When no text is passed, the node type name is used instead.
         """
-        if self.should_use_text:
-            message = self.error_template.format(self._text)
-        else:
-            message = self.error_template
-        return '{0} {1}'.format(self._full_code(), message)
+        if not self.should_use_text:
+            return self._message_template
+
+        text = self._text
+        if text is None:
+            text = self._node.__class__.__name__.lower()
+        return self._message_template.format(text)
 
     @final
     def node_items(self) -> Tuple[int, int, str]:
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+
+"""
+Generated registry data, do not edit it by hand.
+
+Run ``python -m wemake_python_styleguide.violations.registry``
+to regenerate it.
+"""
+
+from typing import Tuple
+
+#: Paths of visitors, see ``registry.visitor_path()``:
+VisitorPaths = Tuple[str, ...]
+
+#: Code, class name, module, and visitors of a violation:
+ViolationData = Tuple[str, str, str, VisitorPaths]
+
+VIOLATIONS: Tuple[ViolationData, ...] = (
+    ('Z100', 'WrongModuleNameViolation', 'naming', (
+        'visitors.filenames.module:WrongModuleNameVisitor',
+    )),
+    ('Z101', 'WrongModuleMagicNameViolation', 'naming', (
+        'visitors.filenames.module:WrongModuleNameVisitor',
+    )),
+    ('Z102', 'WrongModuleNamePatternViolation', 'naming', (
+        'visitors.filenames.module:WrongModuleNameVisitor',
+    )),
+    ('Z110', 'WrongVariableNameViolation', 'naming', (
+        'visitors.ast.naming:WrongNameVisitor',
+    )),
+    ('Z111', 'TooShortNameViolation', 'naming', (
+        'visitors.ast.naming:WrongNameVisitor',
+        'visitors.filenames.module:WrongModuleNameVisitor',
+    )),
+    ('Z112', 'PrivateNameViolation', 'naming', (
+        'visitors.ast.naming:WrongNameVisitor',
+        'visitors.filenames.module:WrongModuleNameVisitor',
+    )),
+    ('Z113', 'SameAliasImportViolation', 'naming', (
+        'visitors.ast.imports:WrongImportVisitor',
+    )),
+    ('Z114', 'UnderscoredNumberNameViolation', 'naming', (
+        'visitors.ast.naming:WrongNameVisitor',
+        'visitors.filenames.module:WrongModuleNameVisitor',
+    )),
+    ('Z115', 'UpperCaseAttributeViolation', 'naming', (
+        'visitors.ast.naming:WrongNameVisitor',
+    )),
+    ('Z116', 'ConsecutiveUnderscoresInNameViolation', 'naming', (
+        'visitors.ast.naming:WrongNameVisitor',
+        'visitors.filenames.module:WrongModuleNameVisitor',
+    )),
+    ('Z200', 'JonesScoreViolation', 'complexity', (
+        'visitors.ast.complexity.jones:JonesComplexityVisitor',
+    )),
+    ('Z201', 'TooManyImportsViolation', 'complexity', (
+        'visitors.ast.complexity.counts:ImportMembersVisitor',
+    )),
+    ('Z202', 'TooManyModuleMembersViolation', 'complexity', (
+        'visitors.ast.complexity.counts:ModuleMembersVisitor',
+    )),
+    ('Z210', 'TooManyLocalsViolation', 'complexity', (
+        'visitors.ast.complexity.function:FunctionComplexityVisitor',
+    )),
+    ('Z211', 'TooManyArgumentsViolation', 'complexity', (
+        'visitors.ast.complexity.function:FunctionComplexityVisitor',
+    )),
+    ('Z212', 'TooManyReturnsViolation', 'complexity', (
+        'visitors.ast.complexity.function:FunctionComplexityVisitor',
+    )),
+    ('Z213', 'TooManyExpressionsViolation', 'complexity', (
+        'visitors.ast.complexity.function:FunctionComplexityVisitor',
+    )),
+    ('Z214', 'TooManyMethodsViolation', 'complexity', (
+        'visitors.ast.complexity.counts:MethodMembersVisitor',
+    )),
+    ('Z220', 'TooDeepNestingViolation', 'complexity', (
+        'visitors.ast.complexity.offset:OffsetVisitor',
+    )),
+    ('Z221', 'LineComplexityViolation', 'complexity', (
+        'visitors.ast.complexity.jones:JonesComplexityVisitor',
+    )),
+    ('Z222', 'TooManyConditionsViolation', 'complexity', (
+        'visitors.ast.complexity.counts:ConditionsVisitor',
+    )),
+    ('Z223', 'TooManyElifsViolation', 'complexity', (
+        'visitors.ast.complexity.function:FunctionComplexityVisitor',
+    )),
+    ('Z224', 'TooManyForsInComprehensionViolation', 'complexity', (
+        'visitors.ast.keywords:WrongListComprehensionVisitor',
+    )),
+    ('Z225', 'TooManyBaseClassesViolation', 'complexity', (
+        'visitors.ast.classes:WrongClassVisitor',
+    )),
+    ('Z300', 'LocalFolderImportViolation', 'consistency', (
+        'visitors.ast.imports:WrongImportVisitor',
+    )),
+    ('Z301', 'DottedRawImportViolation', 'consistency', (
+        'visitors.ast.imports:WrongImportVisitor',
+    )),
+    ('Z302', 'UnicodeStringViolation', 'consistency', (
+        'visitors.tokenize.primitives:WrongPrimitivesVisitor',
+    )),
+    ('Z303', 'UnderscoredNumberViolation', 'consistency', (
+        'visitors.tokenize.primitives:WrongPrimitivesVisitor',
+    )),
+    ('Z304', 'PartialFloatViolation', 'consistency', (
+        'visitors.tokenize.primitives:WrongPrimitivesVisitor',
+    )),
+    ('Z305', 'FormattedStringViolation', 'consistency', (
+        'visitors.ast.builtins:WrongStringVisitor',
+    )),
+    ('Z306', 'RequiredBaseClassViolation', 'consistency', (
+        'visitors.ast.classes:WrongClassVisitor',
+    )),
+    ('Z307', 'MultipleIfsInComprehensionViolation', 'consistency', (
+        'visitors.ast.keywords:WrongListComprehensionVisitor',
+    )),
+    ('Z308', 'ConstantComparisonViolation', 'consistency', (
+        'visitors.ast.comparisons:ComparisonSanityVisitor',
+    )),
+    ('Z309', 'ComparisonOrderViolation', 'consistency', (
+        'visitors.ast.comparisons:WrongComparisionOrderVisitor',
+    )),
+    ('Z310', 'BadNumberSuffixViolation', 'consistency', (
+        'visitors.tokenize.primitives:WrongPrimitivesVisitor',
+    )),
+    ('Z311', 'MultipleInComparisonViolation', 'consistency', (
+        'visitors.ast.comparisons:ComparisonSanityVisitor',
+    )),
+    ('Z312', 'RedundantComparisonViolation', 'consistency', (
+        'visitors.ast.comparisons:ComparisonSanityVisitor',
+    )),
+    ('Z313', 'MissingSpaceBetweenKeywordAndParenViolation', 'consistency', (
+        'visitors.tokenize.keywords:WrongKeywordTokenVisitor',
+    )),
+    ('Z314', 'WrongConditionalViolation', 'consistency', (
+        'visitors.ast.comparisons:WrongConditionalVisitor',
+    )),
+    ('Z315', 'ObjectInBaseClassesListViolation', 'consistency', (
+        'visitors.ast.classes:WrongClassVisitor',
+    )),
+    ('Z400', 'WrongMagicCommentViolation', 'best_practices', (
+        'visitors.tokenize.comments:WrongCommentVisitor',
+    )),
+    ('Z401', 'WrongDocCommentViolation', 'best_practices', (
+        'visitors.tokenize.comments:WrongCommentVisitor',
+    )),
+    ('Z410', 'WrongModuleMetadataViolation', 'best_practices', (
+        'visitors.ast.naming:WrongModuleMetadataVisitor',
+    )),
+    ('Z411', 'EmptyModuleViolation', 'best_practices', (
+        'visitors.ast.modules:EmptyModuleContentsVisitor',
+    )),
+    ('Z412', 'InitModuleHasLogicViolation', 'best_practices', (
+        'visitors.ast.modules:EmptyModuleContentsVisitor',
+    )),
+    ('Z420', 'WrongKeywordViolation', 'best_practices', (
+        'visitors.ast.keywords:WrongKeywordVisitor',
+    )),
+    ('Z421', 'WrongFunctionCallViolation', 'best_practices', (
+        'visitors.ast.functions:WrongFunctionCallVisitor',
+    )),
+    ('Z422', 'FutureImportViolation', 'best_practices', (
+        'visitors.ast.imports:WrongImportVisitor',
+    )),
+    ('Z423', 'RaiseNotImplementedViolation', 'best_practices', (
+        'visitors.ast.keywords:WrongRaiseVisitor',
+    )),
+    ('Z424', 'BaseExceptionViolation', 'best_practices', (
+        'visitors.ast.keywords:WrongExceptionTypeVisitor',
+    )),
+    ('Z430', 'NestedFunctionViolation', 'best_practices', (
+        'visitors.ast.complexity.nested:NestedComplexityVisitor',
+    )),
+    ('Z431', 'NestedClassViolation', 'best_practices', (
+        'visitors.ast.complexity.nested:NestedComplexityVisitor',
+    )),
+    ('Z432', 'MagicNumberViolation', 'best_practices', (
+        'visitors.ast.builtins:MagicNumberVisitor',
+    )),
+    ('Z433', 'StaticMethodViolation', 'best_practices', (
+        'visitors.ast.classes:WrongClassVisitor',
+    )),
+    ('Z434', 'BadMagicMethodViolation', 'best_practices', (
+        'visitors.ast.classes:WrongClassVisitor',
+    )),
+    ('Z435', 'NestedImportViolation', 'best_practices', (
+        'visitors.ast.imports:WrongImportVisitor',
+    )),
+    ('Z436', 'RedundantForElseViolation', 'best_practices', (
+        'visitors.ast.keywords:WrongForElseVisitor',
+    )),
+    ('Z437', 'RedundantFinallyViolation', 'best_practices', (
+        'visitors.ast.keywords:WrongTryFinallyVisitor',
+    )),
+    ('Z438', 'ReassigningVariableToItselfViolation', 'best_practices', (
+        'visitors.ast.naming:WrongVariableAssignmentVisitor',
+    )),
+    ('Z439', 'YieldInsideInitViolation', 'best_practices', (
+        'visitors.ast.classes:WrongClassVisitor',
+    )),
+    ('Z440', 'ProtectedModuleViolation', 'best_practices', (
+        'visitors.ast.imports:WrongImportVisitor',
+    )),
+    ('Z441', 'ProtectedAttributeViolation', 'best_practices', (
+        'visitors.ast.attributes:WrongAttributeVisitor',
+    )),
+)
+
+VISITORS: VisitorPaths = (
+    'visitors.ast.keywords:WrongRaiseVisitor',
+    'visitors.ast.keywords:WrongKeywordVisitor',
+    'visitors.ast.keywords:WrongListComprehensionVisitor',
+    'visitors.ast.keywords:WrongForElseVisitor',
+    'visitors.ast.keywords:WrongTryFinallyVisitor',
+    'visitors.ast.keywords:WrongExceptionTypeVisitor',
+    'visitors.ast.attributes:WrongAttributeVisitor',
+    'visitors.ast.functions:WrongFunctionCallVisitor',
+    'visitors.ast.imports:WrongImportVisitor',
+    'visitors.ast.naming:WrongNameVisitor',
+    'visitors.ast.naming:WrongModuleMetadataVisitor',
+    'visitors.ast.naming:WrongVariableAssignmentVisitor',
+    'visitors.ast.builtins:MagicNumberVisitor',
+    'visitors.ast.builtins:WrongStringVisitor',
+    'visitors.ast.comparisons:WrongConditionalVisitor',
+    'visitors.ast.comparisons:ComparisonSanityVisitor',
+    'visitors.ast.comparisons:WrongComparisionOrderVisitor',
+    'visitors.ast.classes:WrongClassVisitor',
+    'visitors.filenames.module:WrongModuleNameVisitor',
+    'visitors.ast.modules:EmptyModuleContentsVisitor',
+    'visitors.ast.complexity.function:FunctionComplexityVisitor',
+    'visitors.ast.complexity.jones:JonesComplexityVisitor',
+    'visitors.ast.complexity.nested:NestedComplexityVisitor',
+    'visitors.ast.complexity.offset:OffsetVisitor',
+    'visitors.ast.complexity.counts:ImportMembersVisitor',
+    'visitors.ast.complexity.counts:ModuleMembersVisitor',
+    'visitors.ast.complexity.counts:MethodMembersVisitor',
+    'visitors.ast.complexity.counts:ConditionsVisitor',
+    'visitors.tokenize.comments:WrongCommentVisitor',
+    'visitors.tokenize.keywords:WrongKeywordTokenVisitor',
+    'visitors.tokenize.primitives:WrongPrimitivesVisitor',
+)
@@ -0,0 +1,243 @@
+# -*- coding: utf-8 -*-
+
+"""
+Registry of all our violations.
+
+It maps each violation code to its class and to the visitors
+that can raise it. It also knows all our visitors in the order they are run.
+Registry is cheap to import:
+it does not import any violations or visitors,
+they are only imported when they are really needed.
+
+The data itself lives in :mod:`wemake_python_styleguide.violations.codes`.
+It is generated from the ``possible_violations`` of our visitors.
+Do not edit it by hand, regenerate it instead:
+
+.. code:: bash
+
+    python -m wemake_python_styleguide.violations.registry
+
+We have a test that ensures that this data is up-to-date.
+
+.. currentmodule:: wemake_python_styleguide.violations.registry
+
+.. autoclass:: ViolationInfo
+   :members:
+
+.. autofunction:: get
+
+.. autofunction:: match
+
+.. autofunction:: visitor_path
+
+.. autofunction:: visitor_paths
+
+.. autofunction:: load_visitor
+
+"""
+
+import importlib
+import os
+from collections import defaultdict
+from typing import (
+    DefaultDict,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Type,
+)
+
+from wemake_python_styleguide.types import Final
+from wemake_python_styleguide.violations.base import BaseViolation
+from wemake_python_styleguide.violations.codes import (
+    VIOLATIONS,
+    VISITORS,
+    VisitorPaths,
+)
+from wemake_python_styleguide.visitors.base import BaseVisitor
+
+_PACKAGE: Final = 'wemake_python_styleguide.'
+_VIOLATIONS_PACKAGE: Final = _PACKAGE + 'violations.'
+
+
+class ViolationInfo(NamedTuple):
+    """Everything we know about a violation without importing it."""
+
+    #: Formatted violation code, like ``Z110``.
+    code: str
+
+    #: Violation class name inside its module.
+    class_name: str
+
+    #: Module with the violation inside ``violations`` package.
+    module: str
+
+    #: Visitors that can raise this violation, see :func:`visitor_path`.
+    visitors: VisitorPaths
+
+    def load(self) -> Type[BaseViolation]:
+        """Imports and returns the violation class."""
+        module = importlib.import_module(_VIOLATIONS_PACKAGE + self.module)
+        return getattr(module, self.class_name)
+
+
+def _prefixes(code: str) -> Iterator[str]:
+    for prefix_length in range(1, len(code) + 1):
+        yield code[:prefix_length]
+
+
+def _index_by_prefix(
+    violations: Iterable[ViolationInfo],
+) -> Dict[str, Tuple[ViolationInfo, ...]]:
+    by_prefix: DefaultDict[str, List[ViolationInfo]] = defaultdict(list)
+    for violation in violations:
+        for prefix in _prefixes(violation.code):
+            by_prefix[prefix].append(violation)
+    return {
+        prefix: tuple(matched) for prefix, matched in by_prefix.items()
+    }
+
+
+_ALL: Final = tuple(
+    ViolationInfo(
+        code=code,
+        class_name=class_name,
+        module=module,
+        visitors=visitors,
+    )
+    for code, class_name, module, visitors in VIOLATIONS
+)
+
+_BY_CODE: Final = {violation.code: violation for violation in _ALL}
+
+_BY_PREFIX: Final = _index_by_prefix(_ALL)
+
+
+def get(code: str) -> Optional[ViolationInfo]:
+    """
+    Returns information about the violation with the given code.
+
+    >>> get('Z110').class_name
+    'WrongVariableNameViolation'
+
+    >>> get('Z999') is None
+    True
+
+    """
+    return _BY_CODE.get(code)
+
+
+def match(prefix: str) -> Tuple[ViolationInfo, ...]:
+    """
+    Returns all violations with codes starting with the given prefix.
+
+    That's how ``select`` and ``ignore`` options work.
+
+    >>> all(info.code.startswith('Z44') for info in match('Z44'))
+    True
+
+    >>> match('E501')
+    ()
+
+    """
+    return _BY_PREFIX.get(prefix, ())
+
+
+def visitor_path(visitor: Type[BaseVisitor]) -> str:
+    """
+    Returns the path of the visitor class that is used in the registry.
+
+    >>> from wemake_python_styleguide.visitors.ast import keywords
+    >>> visitor_path(keywords.WrongRaiseVisitor)
+    'visitors.ast.keywords:WrongRaiseVisitor'
+
+    """
+    module = visitor.__module__
+    if module.startswith(_PACKAGE):
+        module = module[len(_PACKAGE):]
+    return '{0}:{1}'.format(module, visitor.__qualname__)
+
+
+def visitor_paths() -> VisitorPaths:
+    """
+    Returns paths of all our visitors in the order they are run.
+
+    >>> visitor_paths()[0]
+    'visitors.ast.keywords:WrongRaiseVisitor'
+
+    """
+    return VISITORS
+
+
+def load_visitor(path: str) -> Type[BaseVisitor]:
+    """
+    Imports and returns the visitor class by its path.
+
+    Only the module of this visitor and its violations are imported.
+
+    >>> load_visitor('visitors.ast.keywords:WrongRaiseVisitor').__name__
+    'WrongRaiseVisitor'
+
+    """
+    module_name, class_name = path.split(':')
+    module = importlib.import_module(_PACKAGE + module_name)
+    return getattr(module, class_name)
+
+
+def generate(visitors: Iterable[Type[BaseVisitor]]) -> str:
+    """Generates the source code of the registry data module."""
+    violations: DefaultDict[Type[BaseViolation], List[str]] = defaultdict(
+        list,
+    )
+    paths = []
+    for visitor in visitors:
+        paths.append(visitor_path(visitor))
+        for violation in visitor.possible_violations:
+            violations[violation].append(visitor_path(visitor))
+
+    lines = [
+        '# -*- coding: utf-8 -*-',
+        '',
+        '"""',
+        'Generated registry data, do not edit it by hand.',
+        '',
+        'Run ``python -m wemake_python_styleguide.violations.registry``',
+        'to regenerate it.',
+        '"""',
+        '',
+        'from typing import Tuple',
+        '',
+        '#: Paths of visitors, see ``registry.visitor_path()``:',
+        'VisitorPaths = Tuple[str, ...]',
+        '',
+        '#: Code, class name, module, and visitors of a violation:',
+        'ViolationData = Tuple[str, str, str, VisitorPaths]',
+        '',
+        'VIOLATIONS: Tuple[ViolationData, ...] = (',
+    ]
+    for violation in sorted(violations, key=lambda cls: cls.code):
+        lines.append("    ('{0}', '{1}', '{2}', (".format(
+            violation.full_code(),
+            violation.__qualname__,
+            violation.__module__[len(_VIOLATIONS_PACKAGE):],
+        ))
+        lines.extend(
+            "        '{0}',".format(path) for path in violations[violation]
+        )
+        lines.append('    )),')
+    lines.extend([')', '', 'VISITORS: VisitorPaths = ('])
+    lines.extend("    '{0}',".format(path) for path in paths)
+    lines.append(')')
+    return '\n'.join(lines) + '\n'
+
+
+if __name__ == '__main__':  # pragma: no cover
+    from wemake_python_styleguide.checker import Checker  # noqa: Z435
+
+    codes_path = os.path.join(os.path.dirname(__file__), 'codes.py')
+    with open(codes_path, 'w') as codes:
+        codes.write(generate(Checker.visitors))
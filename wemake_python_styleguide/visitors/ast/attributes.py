@@ -8,13 +8,21 @@ from wemake_python_styleguide.types import final
 from wemake_python_styleguide.violations.best_practices import (
     ProtectedAttributeViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import (
+    BaseNodeVisitor,
+    ViolationClasses,
+)
 
 
 @final
 class WrongAttributeVisitor(BaseNodeVisitor):
     """Ensures that attributes are used correctly."""
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        ProtectedAttributeViolation,
+    )
+    is_definition_local: ClassVar[bool] = True
+
     _allowed_to_use_protected: ClassVar[FrozenSet[str]] = frozenset((
         'self',
         'cls',
@@ -11,13 +11,21 @@ from wemake_python_styleguide.violations.best_practices import (
 from wemake_python_styleguide.violations.consistency import (
     FormattedStringViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import (
+    BaseNodeVisitor,
+    ViolationClasses,
+)
 
 
 @final
 class WrongStringVisitor(BaseNodeVisitor):
     """Restricts to use ``f`` strings."""
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        FormattedStringViolation,
+    )
+    is_definition_local: ClassVar[bool] = True
+
     def visit_JoinedStr(self, node: ast.JoinedStr) -> None:
         """
         Restricts to use ``f`` strings.
@@ -34,6 +42,11 @@ class WrongStringVisitor(BaseNodeVisitor):
 class MagicNumberVisitor(BaseNodeVisitor):
     """Checks magic numbers used in the code."""
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        MagicNumberViolation,
+    )
+    is_definition_local: ClassVar[bool] = True
+
     _allowed_parents: ClassVar[AnyNodes] = (
         ast.Assign,
 
@@ -53,7 +66,7 @@ class MagicNumberVisitor(BaseNodeVisitor):
         ast.UnaryOp,
     )
 
-    def _get_real_parent(self, node: Optional[ast.AST]) -> Optional[ast.AST]:
+    def _get_real_parent(self, node: ast.AST) -> Optional[ast.AST]:
         """
         Returns real number's parent.
 
@@ -63,8 +76,8 @@ class MagicNumberVisitor(BaseNodeVisitor):
           so ``1`` has ``UnaryOp`` as parent, but should return ``Assign``
 
         """
-        parent = getattr(node, 'parent', None)
-        if isinstance(parent, self._proxy_parents):
+        parent = self.index.get_parent(node)
+        if parent is not None and isinstance(parent, self._proxy_parents):
             return self._get_real_parent(parent)
         return parent
 
@@ -4,7 +4,6 @@ import ast
 from typing import ClassVar, FrozenSet
 
 from wemake_python_styleguide import constants, types
-from wemake_python_styleguide.logics.nodes import is_contained
 from wemake_python_styleguide.violations.best_practices import (
     BadMagicMethodViolation,
     StaticMethodViolation,
@@ -17,7 +16,10 @@ from wemake_python_styleguide.violations.consistency import (
     ObjectInBaseClassesListViolation,
     RequiredBaseClassViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import (
+    BaseNodeVisitor,
+    ViolationClasses,
+)
 from wemake_python_styleguide.visitors.decorators import alias
 
 
@@ -33,6 +35,16 @@ class WrongClassVisitor(BaseNodeVisitor):
     Here we check for stylistic issues and design patterns.
     """
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        RequiredBaseClassViolation,
+        ObjectInBaseClassesListViolation,
+        TooManyBaseClassesViolation,
+        StaticMethodViolation,
+        BadMagicMethodViolation,
+        YieldInsideInitViolation,
+    )
+    is_definition_local: ClassVar[bool] = True
+
     _staticmethod_names: ClassVar[FrozenSet[str]] = frozenset((
         'staticmethod',
     ))
@@ -72,9 +84,10 @@ class WrongClassVisitor(BaseNodeVisitor):
             )
 
     def _check_method_contents(self, node: types.AnyFunctionDef) -> None:
-        if node.name == constants.INIT:
-            if is_contained(node, self._not_appropriate_for_init):
-                self.add_violation(YieldInsideInitViolation(node))
+        if node.name != constants.INIT:
+            return
+        if self.index.subtrees.contains(node, self._not_appropriate_for_init):
+            self.add_violation(YieldInsideInitViolation(node))
 
     def visit_ClassDef(self, node: ast.ClassDef) -> None:
         """
@@ -13,7 +13,10 @@ from wemake_python_styleguide.violations.consistency import (
     RedundantComparisonViolation,
     WrongConditionalViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import (
+    BaseNodeVisitor,
+    ViolationClasses,
+)
 from wemake_python_styleguide.visitors.decorators import alias
 
 
@@ -21,6 +24,13 @@ from wemake_python_styleguide.visitors.decorators import alias
 class ComparisonSanityVisitor(BaseNodeVisitor):
     """Restricts the comparison of literals."""
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        ConstantComparisonViolation,
+        MultipleInComparisonViolation,
+        RedundantComparisonViolation,
+    )
+    is_definition_local: ClassVar[bool] = True
+
     def _has_multiple_in_comparisons(self, node: ast.Compare) -> bool:
         count = 0
         for op in node.ops:
@@ -69,6 +79,11 @@ class ComparisonSanityVisitor(BaseNodeVisitor):
 class WrongComparisionOrderVisitor(BaseNodeVisitor):
     """Restricts comparision where argument doesn't come first."""
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        ComparisonOrderViolation,
+    )
+    is_definition_local: ClassVar[bool] = True
+
     _allowed_left_nodes: ClassVar[AnyNodes] = (
         ast.Name,
         ast.Call,
@@ -149,6 +164,11 @@ class WrongComparisionOrderVisitor(BaseNodeVisitor):
 class WrongConditionalVisitor(BaseNodeVisitor):
     """Finds wrong conditional arguments."""
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        WrongConditionalViolation,
+    )
+    is_definition_local: ClassVar[bool] = True
+
     _forbidden_nodes: ClassVar[AnyNodes] = (
         ast.List,
         ast.Set,
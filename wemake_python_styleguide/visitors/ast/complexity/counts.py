@@ -2,7 +2,7 @@
 
 import ast
 from collections import defaultdict
-from typing import DefaultDict, Union
+from typing import ClassVar, DefaultDict, NamedTuple, Sequence, Union
 
 from wemake_python_styleguide.logics.functions import is_method
 from wemake_python_styleguide.types import AnyFunctionDef, AnyImport, final
@@ -12,22 +12,37 @@ from wemake_python_styleguide.violations.complexity import (
     TooManyMethodsViolation,
     TooManyModuleMembersViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import (
+    BaseNodeVisitor,
+    SummarizedNodeVisitor,
+    Summary,
+    ViolationClasses,
+)
 from wemake_python_styleguide.visitors.decorators import alias
 
 ConditionNodes = Union[ast.If, ast.While, ast.IfExp]
 ModuleMembers = Union[ast.AsyncFunctionDef, ast.FunctionDef, ast.ClassDef]
 
 
+class _Count(NamedTuple):
+    """Summary of a module part, when a single kind of nodes is counted."""
+
+    nodes: int
+
+
 @final
 @alias('visit_module_members', (
     'visit_ClassDef',
     'visit_AsyncFunctionDef',
     'visit_FunctionDef',
 ))
-class ModuleMembersVisitor(BaseNodeVisitor):
+class ModuleMembersVisitor(SummarizedNodeVisitor):
     """Counts classes and functions in a module."""
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        TooManyModuleMembersViolation,
+    )
+
     def __init__(self, *args, **kwargs) -> None:
         """Creates a counter for tracked metrics."""
         super().__init__(*args, **kwargs)
@@ -35,14 +50,22 @@ class ModuleMembersVisitor(BaseNodeVisitor):
 
     def _check_members_count(self, node: ModuleMembers) -> None:
         """This method increases the number of module members."""
-        parent = getattr(node, 'parent', None)
-        is_real_method = is_method(getattr(node, 'function_type', None))
+        parent = self.index.get_parent(node)
+        is_real_method = is_method(self.index.get_function_type(node))
 
         if isinstance(parent, ast.Module) and not is_real_method:
             self._public_items_count += 1
 
-    def _post_visit(self) -> None:
-        if self._public_items_count > self.options.max_module_members:
+    def summarize(self) -> Summary:
+        """Returns the number of module members in the visited part."""
+        return _Count(self._public_items_count)
+
+    def merge(self, summaries: Sequence[Summary]) -> None:
+        """Checks the number of members in the whole module."""
+        members_count = sum(
+            _Count(*summary).nodes for summary in summaries
+        )
+        if members_count > self.options.max_module_members:
             self.add_violation(TooManyModuleMembersViolation())
 
     def visit_module_members(self, node: ModuleMembers) -> None:
@@ -62,18 +85,30 @@ class ModuleMembersVisitor(BaseNodeVisitor):
     'visit_ImportFrom',
     'visit_Import',
 ))
-class ImportMembersVisitor(BaseNodeVisitor):
+class ImportMembersVisitor(SummarizedNodeVisitor):
     """Counts imports in a module."""
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        TooManyImportsViolation,
+    )
+
     def __init__(self, *args, **kwargs) -> None:
         """Creates a counter for tracked metrics."""
         super().__init__(*args, **kwargs)
         self._imports_count = 0
 
-    def _post_visit(self) -> None:
-        if self._imports_count > self.options.max_imports:
+    def summarize(self) -> Summary:
+        """Returns the number of imports in the visited part."""
+        return _Count(self._imports_count)
+
+    def merge(self, summaries: Sequence[Summary]) -> None:
+        """Checks the number of imports in the whole module."""
+        imports_count = sum(
+            _Count(*summary).nodes for summary in summaries
+        )
+        if imports_count > self.options.max_imports:
             self.add_violation(
-                TooManyImportsViolation(text=str(self._imports_count)),
+                TooManyImportsViolation(text=str(imports_count)),
             )
 
     def visit_any_import(self, node: AnyImport) -> None:
@@ -96,13 +131,18 @@ class ImportMembersVisitor(BaseNodeVisitor):
 class MethodMembersVisitor(BaseNodeVisitor):
     """Counts methods in a single class."""
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        TooManyMethodsViolation,
+    )
+    is_definition_local: ClassVar[bool] = True
+
     def __init__(self, *args, **kwargs) -> None:
         """Creates a counter for tracked methods in different classes."""
         super().__init__(*args, **kwargs)
         self._methods: DefaultDict[ast.ClassDef, int] = defaultdict(int)
 
     def _check_method(self, node: AnyFunctionDef) -> None:
-        parent = getattr(node, 'parent', None)
+        parent = self.index.get_parent(node)
         if isinstance(parent, ast.ClassDef):
             self._methods[parent] += 1
 
@@ -134,22 +174,44 @@ class MethodMembersVisitor(BaseNodeVisitor):
 class ConditionsVisitor(BaseNodeVisitor):
     """Checks ``if`` and ``while`` statements for condition counts."""
 
-    def __init__(self, *args, **kwargs) -> None:
-        """Creates a counter for tracked conditions."""
-        super().__init__(*args, **kwargs)
-        self._conditions: DefaultDict[ast.AST, int] = defaultdict(int)
+    possible_violations: ClassVar[ViolationClasses] = (
+        TooManyConditionsViolation,
+    )
+    is_definition_local: ClassVar[bool] = True
 
-    def _check_conditions(self, node: ast.AST) -> None:
-        for condition in ast.walk(node):
-            if isinstance(condition, (ast.And, ast.Or)):
-                self._conditions[node] += 1
+    def _is_nested_condition(self, parent: ast.AST, node: ast.AST) -> bool:
+        if isinstance(parent, ast.IfExp):
+            return node is parent.test
+        if isinstance(parent, ast.comprehension):
+            return bool(parent.ifs) and node is parent.ifs[0]
+        return False
 
-    def _post_visit(self) -> None:
-        for node, count in self._conditions.items():
-            if count > self.options.max_conditions - 1:
-                self.add_violation(
-                    TooManyConditionsViolation(node, text=str(count)),
-                )
+    def _count_conditions(self, node: ast.AST) -> int:
+        """
+        Counts boolean operations in a single condition.
+
+        Nested conditions are skipped, they are counted by their own nodes.
+        So, each node is counted only once for the closest condition.
+        """
+        count = 0
+        to_visit = [node]
+        while to_visit:
+            sub_node = to_visit.pop()
+            if isinstance(sub_node, ast.BoolOp):
+                count += 1
+            to_visit.extend(
+                child
+                for child in ast.iter_child_nodes(sub_node)
+                if not self._is_nested_condition(sub_node, child)
+            )
+        return count
+
+    def _check_conditions(self, node: ast.AST) -> None:
+        count = self._count_conditions(node)
+        if count > self.options.max_conditions - 1:
+            self.add_violation(
+                TooManyConditionsViolation(node, text=str(count)),
+            )
 
     def visit_comprehension(self, node: ast.comprehension) -> None:
         """
@@ -2,7 +2,7 @@
 
 import ast
 from collections import defaultdict
-from typing import ClassVar, DefaultDict, List
+from typing import ClassVar, DefaultDict, Set
 
 from wemake_python_styleguide.constants import UNUSED_VARIABLE
 from wemake_python_styleguide.logics.functions import is_method
@@ -19,8 +19,12 @@ from wemake_python_styleguide.violations.complexity import (
     TooManyLocalsViolation,
     TooManyReturnsViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import (
+    BaseNodeVisitor,
+    ViolationClasses,
+)
 from wemake_python_styleguide.visitors.decorators import alias
+from wemake_python_styleguide.visitors.index import NodeIndex
 
 FunctionCounter = DefaultDict[AnyFunctionDef, int]
 FunctionCounterWithLambda = DefaultDict[AnyFunctionDefAndLambda, int]
@@ -34,14 +38,15 @@ class _ComplexityCounter(object):
         ast.comprehension,
     )
 
-    def __init__(self) -> None:
+    def __init__(self, index: NodeIndex) -> None:
+        self.index = index
         self.arguments: FunctionCounterWithLambda = defaultdict(int)
         self.elifs: FunctionCounter = defaultdict(int)
         self.returns: FunctionCounter = defaultdict(int)
         self.expressions: FunctionCounter = defaultdict(int)
         self.variables: DefaultDict[
-            AnyFunctionDef, List[str],
-        ] = defaultdict(list)
+            AnyFunctionDef, Set[str],
+        ] = defaultdict(set)
 
     def _update_variables(
         self,
@@ -54,16 +59,14 @@ class _ComplexityCounter(object):
         What is treated as a local variable?
         Check ``TooManyLocalsViolation`` documentation.
         """
-        function_variables = self.variables[function]
-        if variable.id not in function_variables:
-            if variable.id == UNUSED_VARIABLE:
-                return
+        if variable.id == UNUSED_VARIABLE:
+            return
 
-            parent = getattr(variable, 'parent', None)
-            if isinstance(parent, self._not_contain_locals):
-                return
+        parent = self.index.get_parent(variable)
+        if isinstance(parent, self._not_contain_locals):
+            return
 
-            function_variables.append(variable.id)
+        self.variables[function].add(variable.id)
 
     def _update_elifs(self, node: AnyFunctionDef, sub_node: ast.If) -> None:
         has_elif = any(
@@ -90,7 +93,7 @@ class _ComplexityCounter(object):
         """Checks the number of the arguments in a function."""
         counter = 0
         has_extra_arg = 0
-        if is_method(getattr(node, 'function_type', None)):
+        if is_method(self.index.get_function_type(node)):
             has_extra_arg = 1
 
         counter += len(node.args.args) + len(node.args.kwonlyargs)
@@ -101,21 +104,31 @@ class _ComplexityCounter(object):
 
         self.arguments[node] = counter - has_extra_arg
 
-    def check_function_complexity(self, node: AnyFunctionDef) -> None:
+    def check_function_complexity(self, sub_node: ast.AST) -> None:
         """
-        In this function we iterate all the internal body's node.
+        In this function we check a single internal node of a function.
 
-        We check different complexity metrics based on these internals.
+        Each node is counted only for the closest function that contains it,
+        so nested functions and classes are not counted for outer functions.
+        The closest function is taken from the index,
+        so each node is checked once no matter how deep it is nested.
         """
-        for body_item in node.body:
-            for sub_node in ast.walk(body_item):
-                self._check_sub_node(node, sub_node)
+        function = self.index.get_context(sub_node)
+        if isinstance(function, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            self._check_sub_node(function, sub_node)
 
 
 @final
 @alias('visit_any_function', (
     'visit_AsyncFunctionDef',
     'visit_FunctionDef',
+    'visit_Lambda',
+))
+@alias('visit_function_internals', (
+    'visit_Name',
+    'visit_Return',
+    'visit_Expr',
+    'visit_If',
 ))
 class FunctionComplexityVisitor(BaseNodeVisitor):
     """
@@ -131,10 +144,19 @@ class FunctionComplexityVisitor(BaseNodeVisitor):
 
     """
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        TooManyArgumentsViolation,
+        TooManyReturnsViolation,
+        TooManyExpressionsViolation,
+        TooManyLocalsViolation,
+        TooManyElifsViolation,
+    )
+    is_definition_local: ClassVar[bool] = True
+
     def __init__(self, *args, **kwargs) -> None:
         """Creates a counter for tracked metrics."""
         super().__init__(*args, **kwargs)
-        self._counter = _ComplexityCounter()
+        self._counter = _ComplexityCounter(self.index)
 
     def _check_possible_switch(self) -> None:
         for node, elifs in self._counter.elifs.items():
@@ -172,29 +194,27 @@ class FunctionComplexityVisitor(BaseNodeVisitor):
         self._check_function_internals()
         self._check_possible_switch()
 
-    def visit_any_function(self, node: AnyFunctionDef) -> None:
+    def visit_any_function(self, node: AnyFunctionDefAndLambda) -> None:
         """
-        Checks function's internal complexity.
+        Checks arguments of functions and lambdas.
 
         Raises:
-            TooManyExpressionsViolation
-            TooManyReturnsViolation
-            TooManyLocalsViolation
             TooManyArgumentsViolation
-            TooManyElifsViolation
 
         """
         self._counter.check_arguments_count(node)
-        self._counter.check_function_complexity(node)
         self.generic_visit(node)
 
-    def visit_Lambda(self, node: ast.Lambda) -> None:
+    def visit_function_internals(self, node: ast.AST) -> None:
         """
-        Checks lambda function's internal complexity.
+        Checks function's internal complexity.
 
         Raises:
-            TooManyArgumentsViolation
+            TooManyExpressionsViolation
+            TooManyReturnsViolation
+            TooManyLocalsViolation
+            TooManyElifsViolation
 
         """
-        self._counter.check_arguments_count(node)
+        self._counter.check_function_complexity(node)
         self.generic_visit(node)
@@ -10,20 +10,25 @@ Original project is licensed under MIT.
 """
 
 import ast
-from collections import defaultdict
-from statistics import median
-from typing import DefaultDict, List
+from array import array
+from bisect import bisect_right
+from itertools import accumulate, chain
+from typing import ClassVar, Dict, Sequence, Set
 
 from wemake_python_styleguide.types import final
 from wemake_python_styleguide.violations.complexity import (
     JonesScoreViolation,
     LineComplexityViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import (
+    SummarizedNodeVisitor,
+    Summary,
+    ViolationClasses,
+)
 
 
 @final
-class JonesComplexityVisitor(BaseNodeVisitor):
+class JonesComplexityVisitor(SummarizedNodeVisitor):
     """
     This visitor is used to find complex lines in the code.
 
@@ -34,8 +39,17 @@ class JonesComplexityVisitor(BaseNodeVisitor):
     Some nodes are ignored because there's no sense in analyzing them.
     Some nodes like type annotations are not affecting line complexity,
     so we do not count them.
+
+    We only store the number of nodes on each line and the first node
+    of each line to report violations, not all the nodes.
+    Summary of each module part is the number of nodes on its lines.
     """
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        LineComplexityViolation,
+        JonesScoreViolation,
+    )
+
     _ignored_nodes = (
         ast.FunctionDef,
         ast.ClassDef,
@@ -45,33 +59,49 @@ class JonesComplexityVisitor(BaseNodeVisitor):
     def __init__(self, *args, **kwargs) -> None:
         """Initializes line number counter."""
         super().__init__(*args, **kwargs)
-        self._lines: DefaultDict[int, List[ast.AST]] = defaultdict(list)
-        self._to_ignore: List[ast.AST] = []
+        self._lines = array('I')
+        self._first_nodes: Dict[int, ast.AST] = {}
+        self._to_ignore: Set[ast.AST] = set()
 
-    def _post_visit(self) -> None:
+    def summarize(self) -> Summary:
         """
-        Triggers after the whole module was processed.
+        Triggers after the whole module part was processed.
 
         Checks each line for its complexity, compares it to the tresshold.
-        We also calculate the final Jones score for the whole module.
+        Returns the number of nodes on each line with nodes.
         """
-        for line_nodes in self._lines.values():
-            complexity = len(line_nodes)
+        for line_number, node in self._first_nodes.items():
+            complexity = self._lines[line_number]
             if complexity > self.options.max_line_complexity:
                 self.add_violation(LineComplexityViolation(
-                    line_nodes[0], text=str(complexity),
+                    node, text=str(complexity),
                 ))
+        return tuple(complexity for complexity in self._lines if complexity)
 
-        node_counts = [len(nodes) for nodes in self._lines.values()]
-        total_count = median(node_counts) if node_counts else 0
+    def merge(self, summaries: Sequence[Summary]) -> None:
+        """Calculates the final Jones score for the whole module."""
+        line_counts = list(chain.from_iterable(summaries))
+        total_count = _median(line_counts, len(line_counts))
         if total_count > self.options.max_jones_score:
             self.add_violation(JonesScoreViolation())
 
     def _maybe_ignore_child(self, node: ast.AST) -> bool:
         if isinstance(node, ast.AnnAssign):
-            self._to_ignore.append(node.annotation)
+            self._to_ignore.add(node.annotation)
+
+        if node in self._to_ignore:
+            self._to_ignore.remove(node)
+            return True
+        return False
+
+    def _count(self, node: ast.AST, line_number: int) -> None:
+        missing = line_number + 1 - len(self._lines)
+        if missing > 0:
+            self._lines.extend([0] * missing)
 
-        return node in self._to_ignore
+        if not self._lines[line_number]:
+            self._first_nodes[line_number] = node
+        self._lines[line_number] += 1
 
     def visit(self, node: ast.AST) -> None:
         """
@@ -88,6 +118,28 @@ class JonesComplexityVisitor(BaseNodeVisitor):
         is_ignored = isinstance(node, self._ignored_nodes)
         if line_number is not None and not is_ignored:
             if not self._maybe_ignore_child(node):
-                self._lines[line_number].append(node)
+                self._count(node, line_number)
 
         self.generic_visit(node)
+
+
+def _median(line_counts: Sequence[int], lines: int) -> float:
+    """
+    Returns the median of non-zero counts, ``0`` when there are none.
+
+    Counts are small numbers, so we count how many lines have each count
+    and select the middle ones from these numbers without sorting.
+    """
+    if not lines:
+        return 0
+
+    histogram = [0] * (max(line_counts) + 1)
+    for count in line_counts:
+        histogram[count] += 1
+    histogram[0] = 0  # lines without nodes are not counted
+
+    # Number of lines with this count or less, it is sorted by definition:
+    cumulative = list(accumulate(histogram))
+    lower = bisect_right(cumulative, (lines - 1) // 2)
+    upper = bisect_right(cumulative, lines // 2)
+    return (lower + upper) / 2
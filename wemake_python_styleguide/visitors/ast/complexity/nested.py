@@ -12,7 +12,10 @@ from wemake_python_styleguide.violations.best_practices import (
     NestedClassViolation,
     NestedFunctionViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import (
+    BaseNodeVisitor,
+    ViolationClasses,
+)
 from wemake_python_styleguide.visitors.decorators import alias
 
 
@@ -31,20 +34,26 @@ class NestedComplexityVisitor(BaseNodeVisitor):
     We allow to nest function inside classes, that's called methods.
     """
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        NestedClassViolation,
+        NestedFunctionViolation,
+    )
+    is_definition_local: ClassVar[bool] = True
+
     _function_nodes: ClassVar[AnyNodes] = (
         ast.FunctionDef,
         ast.AsyncFunctionDef,
     )
 
     def _check_nested_function(self, node: AnyFunctionDef) -> None:
-        parent = getattr(node, 'parent', None)
+        parent = self.index.get_parent(node)
         is_inside_function = isinstance(parent, self._function_nodes)
 
         if is_inside_function and node.name not in NESTED_FUNCTIONS_WHITELIST:
             self.add_violation(NestedFunctionViolation(node, text=node.name))
 
     def _check_nested_classes(self, node: ast.ClassDef) -> None:
-        parent = getattr(node, 'parent', None)
+        parent = self.index.get_parent(node)
         is_inside_class = isinstance(parent, ast.ClassDef)
         is_inside_function = isinstance(parent, self._function_nodes)
 
@@ -54,7 +63,7 @@ class NestedComplexityVisitor(BaseNodeVisitor):
             self.add_violation(NestedClassViolation(node, text=node.name))
 
     def _check_nested_lambdas(self, node: ast.Lambda) -> None:
-        parent = getattr(node, 'parent', None)
+        parent = self.index.get_parent(node)
         if isinstance(parent, ast.Lambda):
             self.add_violation(NestedFunctionViolation(node))
 
@@ -1,13 +1,16 @@
 # -*- coding: utf-8 -*-
 
 import ast
-from typing import Union
+from typing import ClassVar, Union
 
 from wemake_python_styleguide.types import final
 from wemake_python_styleguide.violations.complexity import (
     TooDeepNestingViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import (
+    BaseNodeVisitor,
+    ViolationClasses,
+)
 from wemake_python_styleguide.visitors.decorators import alias
 
 AsyncNodes = Union[ast.AsyncFunctionDef, ast.AsyncFor, ast.AsyncWith]
@@ -39,6 +42,11 @@ AsyncNodes = Union[ast.AsyncFunctionDef, ast.AsyncFor, ast.AsyncWith]
 class OffsetVisitor(BaseNodeVisitor):
     """Checks offset values for several nodes."""
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        TooDeepNestingViolation,
+    )
+    is_definition_local: ClassVar[bool] = True
+
     def _check_offset(self, node: ast.AST, error: int = 0) -> None:
         offset = getattr(node, 'col_offset', 0) - error
         if offset > self.options.max_offset_blocks * 4:
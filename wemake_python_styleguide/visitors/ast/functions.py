@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import ast
+from typing import ClassVar
 
 from wemake_python_styleguide.constants import FUNCTIONS_BLACKLIST
 from wemake_python_styleguide.logics.functions import given_function_called
@@ -8,7 +9,10 @@ from wemake_python_styleguide.types import final
 from wemake_python_styleguide.violations.best_practices import (
     WrongFunctionCallViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import (
+    BaseNodeVisitor,
+    ViolationClasses,
+)
 
 
 @final
@@ -19,6 +23,11 @@ class WrongFunctionCallVisitor(BaseNodeVisitor):
     All these functions are defined in ``FUNCTIONS_BLACKLIST``.
     """
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        WrongFunctionCallViolation,
+    )
+    is_definition_local: ClassVar[bool] = True
+
     def visit_Call(self, node: ast.Call) -> None:
         """
         Used to find ``FUNCTIONS_BLACKLIST`` calls.
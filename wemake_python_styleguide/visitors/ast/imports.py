@@ -2,7 +2,7 @@
 
 import ast
 from itertools import chain
-from typing import Callable
+from typing import Callable, ClassVar, Optional
 
 from wemake_python_styleguide.constants import FUTURE_IMPORTS_WHITELIST
 from wemake_python_styleguide.logics import imports
@@ -19,7 +19,10 @@ from wemake_python_styleguide.violations.consistency import (
     LocalFolderImportViolation,
 )
 from wemake_python_styleguide.violations.naming import SameAliasImportViolation
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import (
+    BaseNodeVisitor,
+    ViolationClasses,
+)
 
 ErrorCallback = Callable[[BaseViolation], None]
 
@@ -31,9 +34,12 @@ class _ImportsChecker(object):
     def __init__(self, error_callback: ErrorCallback) -> None:
         self.error_callback = error_callback
 
-    def check_nested_import(self, node: AnyImport) -> None:
+    def check_nested_import(
+        self,
+        node: AnyImport,
+        parent: Optional[ast.AST],
+    ) -> None:
         text = imports.get_error_text(node)
-        parent = getattr(node, 'parent', None)
         if parent is not None and not isinstance(parent, ast.Module):
             self.error_callback(NestedImportViolation(node, text=text))
 
@@ -80,6 +86,16 @@ class _ImportsChecker(object):
 class WrongImportVisitor(BaseNodeVisitor):
     """Responsible for finding wrong imports."""
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        FutureImportViolation,
+        NestedImportViolation,
+        ProtectedModuleViolation,
+        DottedRawImportViolation,
+        LocalFolderImportViolation,
+        SameAliasImportViolation,
+    )
+    is_definition_local: ClassVar[bool] = True
+
     def __init__(self, *args, **kwargs) -> None:
         """Creates a checker for tracked violations."""
         super().__init__(*args, **kwargs)
@@ -95,7 +111,10 @@ class WrongImportVisitor(BaseNodeVisitor):
             NestedImportViolation
 
         """
-        self._checker.check_nested_import(node)
+        self._checker.check_nested_import(
+            node,
+            self.index.get_parent(node),
+        )
         self._checker.check_dotted_raw_import(node)
         self._checker.check_alias(node)
         self._checker.check_protected_import(node)
@@ -113,7 +132,10 @@ class WrongImportVisitor(BaseNodeVisitor):
 
         """
         self._checker.check_local_import(node)
-        self._checker.check_nested_import(node)
+        self._checker.check_nested_import(
+            node,
+            self.index.get_parent(node),
+        )
         self._checker.check_future_import(node)
         self._checker.check_alias(node)
         self._checker.check_protected_import(node)
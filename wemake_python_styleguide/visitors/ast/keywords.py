@@ -2,9 +2,9 @@
 
 import ast
 from collections import defaultdict
-from typing import ClassVar, DefaultDict, Optional, Union
+from typing import ClassVar, DefaultDict, List, Optional, Set, Union
 
-from wemake_python_styleguide.types import AnyNodes, final
+from wemake_python_styleguide.types import final
 from wemake_python_styleguide.violations.best_practices import (
     BaseExceptionViolation,
     RaiseNotImplementedViolation,
@@ -18,9 +18,14 @@ from wemake_python_styleguide.violations.complexity import (
 from wemake_python_styleguide.violations.consistency import (
     MultipleIfsInComprehensionViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import (
+    BaseNodeVisitor,
+    ViolationClasses,
+)
+from wemake_python_styleguide.visitors.decorators import alias
 
-AnyLoop = Union[ast.For, ast.While]
+ForbiddenKeywords = Union[ast.Pass, ast.Delete, ast.Global, ast.Nonlocal]
+AnyLoop = Union[ast.For, ast.AsyncFor, ast.While]
 
 
 @final
@@ -30,8 +35,7 @@ class _ComprehensionComplexityCounter(object):
     def __init__(self) -> None:
         self.fors: DefaultDict[ast.ListComp, int] = defaultdict(int)
 
-    def check_fors(self, node: ast.comprehension) -> None:
-        parent = getattr(node, 'parent', node)
+    def check_fors(self, parent: Optional[ast.AST]) -> None:
         if isinstance(parent, ast.ListComp):
             self.fors[parent] = len(parent.generators)
 
@@ -40,6 +44,11 @@ class _ComprehensionComplexityCounter(object):
 class WrongRaiseVisitor(BaseNodeVisitor):
     """Finds wrong ``raise`` keywords."""
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        RaiseNotImplementedViolation,
+    )
+    is_definition_local: ClassVar[bool] = True
+
     def _check_exception_type(self, node: ast.Raise) -> None:
         exception = getattr(node, 'exc', None)
         if exception is None:
@@ -66,21 +75,21 @@ class WrongRaiseVisitor(BaseNodeVisitor):
 
 
 @final
+@alias('visit_forbidden_keyword', (
+    'visit_Pass',
+    'visit_Delete',
+    'visit_Global',
+    'visit_Nonlocal',
+))
 class WrongKeywordVisitor(BaseNodeVisitor):
     """Finds wrong keywords."""
 
-    _forbidden_keywords: ClassVar[AnyNodes] = (
-        ast.Pass,
-        ast.Delete,
-        ast.Global,
-        ast.Nonlocal,
+    possible_violations: ClassVar[ViolationClasses] = (
+        WrongKeywordViolation,
     )
+    is_definition_local: ClassVar[bool] = True
 
-    def _check_keyword(self, node: ast.AST) -> None:
-        if isinstance(node, self._forbidden_keywords):
-            self.add_violation(WrongKeywordViolation(node))
-
-    def visit(self, node: ast.AST) -> None:
+    def visit_forbidden_keyword(self, node: ForbiddenKeywords) -> None:
         """
         Used to find wrong keywords.
 
@@ -88,7 +97,7 @@ class WrongKeywordVisitor(BaseNodeVisitor):
             WrongKeywordViolation
 
         """
-        self._check_keyword(node)
+        self.add_violation(WrongKeywordViolation(node))
         self.generic_visit(node)
 
 
@@ -96,6 +105,12 @@ class WrongKeywordVisitor(BaseNodeVisitor):
 class WrongListComprehensionVisitor(BaseNodeVisitor):
     """Checks list comprehensions."""
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        MultipleIfsInComprehensionViolation,
+        TooManyForsInComprehensionViolation,
+    )
+    is_definition_local: ClassVar[bool] = True
+
     def __init__(self, *args, **kwargs) -> None:
         """Creates a counter for tracked metrics."""
         super().__init__(*args, **kwargs)
@@ -105,7 +120,7 @@ class WrongListComprehensionVisitor(BaseNodeVisitor):
         if len(node.ifs) > 1:
             # We are trying to fix line number in the report,
             # since `comprehension` does not have this property.
-            parent = getattr(node, 'parent', node)
+            parent = self.index.get_parent(node) or node
             self.add_violation(MultipleIfsInComprehensionViolation(parent))
 
     def _check_fors(self) -> None:
@@ -126,7 +141,7 @@ class WrongListComprehensionVisitor(BaseNodeVisitor):
 
         """
         self._check_ifs(node)
-        self._counter.check_fors(node)
+        self._counter.check_fors(self.index.get_parent(node))
         self.generic_visit(node)
 
 
@@ -134,42 +149,62 @@ class WrongListComprehensionVisitor(BaseNodeVisitor):
 class WrongForElseVisitor(BaseNodeVisitor):
     """Responsible for restricting `else` in `for` loops without `break`."""
 
-    def _does_loop_contain_node(
-        self,
-        loop: Optional[AnyLoop],
-        to_check: ast.Break,
-    ) -> bool:
-        if loop is None:
-            return False
-
-        for inner_node in ast.walk(loop):
-            if to_check is inner_node:
-                return True
-        return False
-
-    def _has_break(self, node: ast.For) -> bool:
-        closest_loop = None
-
-        for subnode in ast.walk(node):
-            if isinstance(subnode, (ast.For, ast.While)):
-                if subnode is not node:
-                    closest_loop = subnode
-
-            if isinstance(subnode, ast.Break):
-                is_nested_break = self._does_loop_contain_node(
-                    closest_loop, subnode,
-                )
-                if not is_nested_break:
-                    return True
-        return False
-
-    def _check_for_needs_else(self, node: ast.For) -> None:
-        if node.orelse and not self._has_break(node):
-            self.add_violation(RedundantForElseViolation(node=node))
+    possible_violations: ClassVar[ViolationClasses] = (
+        RedundantForElseViolation,
+    )
+    is_definition_local: ClassVar[bool] = True
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Creates storages for loops with `else` and loops with `break`."""
+        super().__init__(*args, **kwargs)
+        self._loops_with_else: List[ast.For] = []
+        self._loops_with_break: Set[AnyLoop] = set()
+
+    def _post_visit(self) -> None:
+        for node in self._loops_with_else:
+            if node not in self._loops_with_break:
+                self.add_violation(RedundantForElseViolation(node=node))
+
+    def _find_loop(self, node: ast.Break) -> Optional[AnyLoop]:
+        child: ast.AST = node
+        parent = self.index.get_parent(node)
+        while parent is not None:
+            if isinstance(parent, (ast.For, ast.AsyncFor, ast.While)) and (
+                child not in parent.orelse
+            ):
+                return parent
+            child, parent = parent, self.index.get_parent(parent)
+        return None
 
     def visit_For(self, node: ast.For) -> None:
-        """Used for find `else` block in `for` loops without `break`."""
-        self._check_for_needs_else(node)
+        """
+        Used for find `else` block in `for` loops without `break`.
+
+        Raises:
+            RedundantForElseViolation
+
+        """
+        if node.orelse:
+            self._loops_with_else.append(node)
+        self.generic_visit(node)
+
+    def visit_Break(self, node: ast.Break) -> None:
+        """
+        Marks the loop that `break` belongs to as the one with `break`.
+
+        It is the closest loop that contains `break` in its body.
+        When `break` is inside the `else` block of a loop,
+        it belongs to the outer loop.
+        Each `break` only goes up to its own loop,
+        so nested loops are never walked again.
+
+        Raises:
+            RedundantForElseViolation
+
+        """
+        loop = self._find_loop(node)
+        if loop is not None:
+            self._loops_with_break.add(loop)
         self.generic_visit(node)
 
 
@@ -177,6 +212,11 @@ class WrongForElseVisitor(BaseNodeVisitor):
 class WrongTryFinallyVisitor(BaseNodeVisitor):
     """Responsible for restricting finally in try blocks without except."""
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        RedundantFinallyViolation,
+    )
+    is_definition_local: ClassVar[bool] = True
+
     def _check_for_needs_except(self, node: ast.Try) -> None:
         if node.finalbody and not node.handlers:
             self.add_violation(RedundantFinallyViolation(node=node))
@@ -191,6 +231,11 @@ class WrongTryFinallyVisitor(BaseNodeVisitor):
 class WrongExceptionTypeVisitor(BaseNodeVisitor):
     """Finds usage of incorrect ``except`` exception types."""
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        BaseExceptionViolation,
+    )
+    is_definition_local: ClassVar[bool] = True
+
     _base_exception: ClassVar[str] = 'BaseException'
 
     def _check_exception_type(self, node: ast.ExceptHandler) -> None:
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import ast
+from typing import ClassVar, List, NamedTuple, Sequence
 
 from wemake_python_styleguide.constants import INIT
 from wemake_python_styleguide.logics.filenames import get_stem
@@ -9,13 +10,43 @@ from wemake_python_styleguide.violations.best_practices import (
     EmptyModuleViolation,
     InitModuleHasLogicViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import (
+    SummarizedNodeVisitor,
+    Summary,
+    ViolationClasses,
+)
+
+
+class _ModuleContents(NamedTuple):
+    """
+    Summary of a module part, parts are ordered by their first lines.
+
+    Only the first statement of a part can be its docstring.
+    """
+
+    first_line: int
+    statements: int
+    docstrings: int
 
 
 @final
-class EmptyModuleContentsVisitor(BaseNodeVisitor):
+class EmptyModuleContentsVisitor(SummarizedNodeVisitor):
     """Restricts to have empty modules."""
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        EmptyModuleViolation,
+        InitModuleHasLogicViolation,
+    )
+
+    def __init__(self, *args, **kwargs) -> None:
+        """Creates an empty summary of the module contents."""
+        super().__init__(*args, **kwargs)
+        self._summary = _ModuleContents(
+            first_line=0,
+            statements=0,
+            docstrings=0,
+        )
+
     def _is_init(self) -> bool:
         return get_stem(self.filename) == INIT
 
@@ -30,27 +61,22 @@ class EmptyModuleContentsVisitor(BaseNodeVisitor):
             return False
         return isinstance(node.value, ast.Str)
 
-    def _check_module_contents(self, node: ast.Module) -> None:
-        if self._is_init():
-            return
-        if not node.body:
-            self.add_violation(EmptyModuleViolation(node))
-
-    def _check_init_contents(self, node: ast.Module) -> None:
-        if not self._is_init() or not node.body:
-            return
-
-        if not self.options.i_control_code:
+    def _check_init_contents(
+        self,
+        statements: int,
+        parts: List[_ModuleContents],
+    ) -> None:
+        if not statements or not self.options.i_control_code:
             return
 
-        if len(node.body) > 1:
-            self.add_violation(InitModuleHasLogicViolation(node))
-            return
+        if statements > 1 or not parts[0].docstrings:
+            self.add_violation(InitModuleHasLogicViolation(self.tree))
 
-        if not self._is_doc_string(node.body[0]):
-            self.add_violation(InitModuleHasLogicViolation(node))
+    def summarize(self) -> Summary:
+        """Returns the summary of the visited module contents."""
+        return self._summary
 
-    def visit_Module(self, node: ast.Module) -> None:
+    def merge(self, summaries: Sequence[Summary]) -> None:
         """
         Checks that module has something other than module definition.
 
@@ -64,6 +90,27 @@ class EmptyModuleContentsVisitor(BaseNodeVisitor):
             InitModuleHasLogicViolation
 
         """
-        self._check_init_contents(node)
-        self._check_module_contents(node)
+        module_parts = [_ModuleContents(*summary) for summary in summaries]
+        parts = sorted(part for part in module_parts if part.statements)
+        statements = sum(part.statements for part in parts)
+        if self._is_init():
+            self._check_init_contents(statements, parts)
+        elif not statements:
+            self.add_violation(EmptyModuleViolation(self.tree))
+
+    def visit_Module(self, node: ast.Module) -> None:
+        """
+        Counts module statements, they are checked by ``merge()``.
+
+        Raises:
+            EmptyModuleViolation
+            InitModuleHasLogicViolation
+
+        """
+        if node.body:
+            self._summary = _ModuleContents(
+                first_line=node.body[0].lineno,
+                statements=len(node.body),
+                docstrings=int(self._is_doc_string(node.body[0])),
+            )
         self.generic_visit(node)
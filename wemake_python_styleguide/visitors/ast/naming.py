@@ -1,7 +1,7 @@
 # -*- coding: utf-8 -*-
 
 import ast
-from typing import List, Tuple, Union
+from typing import ClassVar, List, Tuple, Union
 
 from wemake_python_styleguide.constants import (
     MODULE_METADATA_VARIABLES_BLACKLIST,
@@ -21,7 +21,10 @@ from wemake_python_styleguide.violations.naming import (
     UpperCaseAttributeViolation,
     WrongVariableNameViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseNodeVisitor
+from wemake_python_styleguide.visitors.base import (
+    BaseNodeVisitor,
+    ViolationClasses,
+)
 from wemake_python_styleguide.visitors.decorators import alias
 
 VariableDef = Union[ast.Name, ast.Attribute, ast.ExceptHandler]
@@ -46,6 +49,16 @@ AssignTargetsNameList = List[Union[str, Tuple[str]]]
 class WrongNameVisitor(BaseNodeVisitor):
     """Performs checks based on variable names."""
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        WrongVariableNameViolation,
+        TooShortNameViolation,
+        PrivateNameViolation,
+        UnderscoredNumberNameViolation,
+        ConsecutiveUnderscoresInNameViolation,
+        UpperCaseAttributeViolation,
+    )
+    is_definition_local: ClassVar[bool] = True
+
     def _check_name(self, node: ast.AST, name: str) -> None:
 
         if logical.is_wrong_name(name, VARIABLE_NAMES_BLACKLIST):
@@ -155,8 +168,13 @@ class WrongNameVisitor(BaseNodeVisitor):
 class WrongModuleMetadataVisitor(BaseNodeVisitor):
     """Finds wrong metadata information of a module."""
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        WrongModuleMetadataViolation,
+    )
+    is_definition_local: ClassVar[bool] = True
+
     def _check_metadata(self, node: ast.Assign) -> None:
-        node_parent = getattr(node, 'parent', None)
+        node_parent = self.index.get_parent(node)
         if not isinstance(node_parent, ast.Module):
             return
 
@@ -183,6 +201,11 @@ class WrongModuleMetadataVisitor(BaseNodeVisitor):
 class WrongVariableAssignmentVisitor(BaseNodeVisitor):
     """Finds wrong variables assignments."""
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        ReassigningVariableToItselfViolation,
+    )
+    is_definition_local: ClassVar[bool] = True
+
     def _create_target_names(
         self,
         target: AssignTargets,
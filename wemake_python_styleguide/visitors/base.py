@@ -19,6 +19,7 @@ Available base classes
    :nosignatures:
 
    BaseNodeVisitor
+   SummarizedNodeVisitor
    BaseFilenameVisitor
    BaseTokenVisitor
 
@@ -32,25 +33,90 @@ Visitors API
 
 import ast
 import tokenize
-from typing import List, Sequence, Type
+from types import MethodType
+from typing import (
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
 
 from wemake_python_styleguide import constants
 from wemake_python_styleguide.logics.filenames import get_stem
 from wemake_python_styleguide.types import ConfigurationOptions, final
 from wemake_python_styleguide.violations.base import BaseViolation
+from wemake_python_styleguide.visitors.index import NodeIndex
+
+#: Violation classes that can be raised by a visitor.
+ViolationClasses = Tuple[Type[BaseViolation], ...]
+
+#: Module metrics found in a part of the module, see SummarizedNodeVisitor.
+Summary = Tuple[int, ...]
+
+#: Summaries of a single module part by visitor class names.
+Summaries = Dict[str, Summary]
+
+#: Handler function defined in a visitor class, accepts visitor and node.
+Handler = Callable[['BaseNodeVisitor', ast.AST], None]
+
+#: Handler method bound to a visitor instance, accepts a single node.
+BoundHandler = Callable[[ast.AST], None]
+
+#: Handler function defined in a visitor class, accepts visitor and token.
+TokenClassHandler = Callable[['BaseTokenVisitor', tokenize.TokenInfo], None]
+
+#: Handler method bound to a visitor instance, accepts a single token.
+TokenHandler = Callable[[tokenize.TokenInfo], None]
+
+#: Handlers can be named after these nodes, they are ``Constant`` in 3.8+.
+_LEGACY_CONSTANT_NODES = ('Num', 'Str', 'Bytes', 'NameConstant', 'Ellipsis')
+
+#: Node type of all constants, it is missing in ``typeshed`` for now.
+_CONSTANT_NODE: Type[ast.AST] = getattr(ast, 'Constant')
+
+#: Lower-cased token names mapped to their token types.
+_TOKEN_TYPES: Dict[str, int] = {
+    token_name.lower(): token_type
+    for token_type, token_name in tokenize.tok_name.items()
+}
+
+
+def _find_handler_names(cls: type) -> FrozenSet[str]:
+    """
+    Finds names of all ``visit_`` methods of a class, including inherited.
+
+    Returns them without the ``visit_`` prefix.
+    """
+    return frozenset(
+        attribute[len('visit_'):]
+        for klass in cls.__mro__
+        for attribute in klass.__dict__
+        if attribute.startswith('visit_')
+    )
 
 
 class BaseVisitor(object):
     """
     Abstract base class for different types of visitors.
 
+    Each subclass should define ``possible_violations`` field.
+
     Attributes:
         options: contains the options objects passed and parsed by ``flake8``.
         filename: filename passed by ``flake8``, each visitor has a file name.
         violations: list of violations for the specific visitor.
+        possible_violations: all violation classes this visitor can raise.
+            Visitor is not run when all of them are disabled.
 
     """
 
+    possible_violations: ClassVar[ViolationClasses] = ()
+
     def __init__(
         self,
         options: ConfigurationOptions,
@@ -61,6 +127,21 @@ class BaseVisitor(object):
         self.filename = filename
         self.violations: List[BaseViolation] = []
 
+    def __init_subclass__(cls) -> None:
+        """Collects handlers of each new visitor class."""
+        super().__init_subclass__()
+        cls.collect_handlers()
+
+    @classmethod
+    def collect_handlers(cls) -> None:
+        """
+        Collects handler methods of a visitor class into a dispatch table.
+
+        It is called once when the class is created.
+        And once again when new handlers are added with ``alias``.
+        By default does nothing.
+        """
+
     @classmethod
     def from_checker(cls: Type['BaseVisitor'], checker) -> 'BaseVisitor':
         """
@@ -91,6 +172,75 @@ class BaseVisitor(object):
         raise NotImplementedError('Should be defined in a subclass')
 
 
+@final
+class NodeHandlers(object):
+    """
+    Dispatch table of a single ``ast`` based visitor class.
+
+    Maps node types to ``visit_`` methods with the same names,
+    so finding a handler for a node is a single ``dict`` lookup.
+    Visitors that redefine ``visit()`` itself handle all node types.
+    """
+
+    def __init__(self, visitor_class: Type['BaseNodeVisitor']) -> None:
+        """Collects handlers of the given visitor class."""
+        names = _find_handler_names(visitor_class)
+        handlers: Dict[Type[ast.AST], Handler] = {}
+        for name in names:
+            node_type = getattr(ast, name, None)
+            if isinstance(node_type, type) and issubclass(node_type, ast.AST):
+                handlers[node_type] = getattr(visitor_class, 'visit_' + name)
+
+        if names.isdisjoint(_LEGACY_CONSTANT_NODES):
+            # Inherited ``visit_Constant`` only calls legacy handlers:
+            handlers.pop(_CONSTANT_NODE, None)
+        self._handlers = handlers
+
+        self._visit: Optional[Handler] = None
+        if visitor_class.visit is not ast.NodeVisitor.visit:
+            self._visit = visitor_class.visit
+
+    @property
+    def node_types(self) -> Optional[FrozenSet[Type[ast.AST]]]:
+        """
+        Returns node types this visitor class has handlers for.
+
+        Returns ``None`` for visitors that redefine ``visit()`` itself,
+        since they handle all node types.
+        """
+        if self._visit is not None:
+            return None
+        return frozenset(self._handlers)
+
+    def get(self, node_type: Type[ast.AST]) -> Optional[Handler]:
+        """Returns handler for the given node type, if there's any."""
+        if self._visit is not None:
+            return self._visit
+        return self._handlers.get(node_type)
+
+    def bind(
+        self,
+        visitor: 'BaseNodeVisitor',
+        node_type: Type[ast.AST],
+    ) -> Optional[BoundHandler]:
+        """Returns handler for the given node type bound to the visitor."""
+        node_handler = self.get(node_type)
+        if node_handler is None:
+            return None
+        return MethodType(node_handler, visitor)
+
+    def is_applicable(self, index: NodeIndex) -> bool:
+        """
+        Tells whether this visitor can find anything in the indexed tree.
+
+        Visitors only report nodes they have handlers for.
+        So, when there are no nodes of these types in the tree,
+        there's no need to create this visitor and run it at all.
+        """
+        node_types = self.node_types
+        return node_types is None or index.contains_any(node_types)
+
+
 class BaseNodeVisitor(ast.NodeVisitor, BaseVisitor):
     """
     Allows to store violations while traversing node tree.
@@ -98,20 +248,49 @@ class BaseNodeVisitor(ast.NodeVisitor, BaseVisitor):
     This class should be used as a base class for all ``ast`` based checkers.
     Method ``visit()`` is defined in ``NodeVisitor`` class.
 
+    Handlers are called for each node in the depth-first order,
+    the same one ``ast.NodeVisitor`` uses. But recursion is not performed
+    by ``generic_visit()``, it is performed by ``run()`` instead.
+    That's how several visitors can share a single tree traversal,
+    see :class:`wemake_python_styleguide.visitors.pipeline.NodePipeline`.
+
+    Handlers are collected into a dispatch table once per class,
+    see :class:`.NodeHandlers`.
+
     Attributes:
         tree: ``ast`` tree to be checked.
+        index: index of the tree nodes, it also links nodes to their parents.
+        handlers: dispatch table of this visitor class.
+        is_definition_local: whether violations inside each top-level
+            function or class depend only on this definition itself.
+            Results of such visitors are cached per definition.
 
     """
 
+    is_definition_local: ClassVar[bool] = False
+
+    handlers: ClassVar[NodeHandlers]
+
     def __init__(
         self,
         options: ConfigurationOptions,
         tree: ast.AST,
+        index: Optional[NodeIndex] = None,
         **kwargs,
     ) -> None:
-        """Creates new ``ast`` based instance."""
+        """
+        Creates new ``ast`` based instance.
+
+        Index is built for the tree, when it is not passed explicitly.
+        """
         super().__init__(options, **kwargs)
         self.tree = tree
+        self.index = NodeIndex(tree) if index is None else index
+
+    @classmethod
+    def collect_handlers(cls) -> None:
+        """Maps node types to ``visit_`` methods with the same names."""
+        cls.handlers = NodeHandlers(cls)
 
     @final
     @classmethod
@@ -124,6 +303,7 @@ class BaseNodeVisitor(ast.NodeVisitor, BaseVisitor):
             options=checker.options,
             filename=checker.filename,
             tree=checker.tree,
+            index=checker.index,
         )
 
     def _post_visit(self) -> None:
@@ -134,12 +314,79 @@ class BaseNodeVisitor(ast.NodeVisitor, BaseVisitor):
         By default does nothing.
         """
 
+    def generic_visit(self, node: ast.AST) -> None:
+        """
+        Does nothing, since all nodes are visited by ``run()``.
+
+        We still call it at the end of each handler,
+        so visitors look like regular ``ast.NodeVisitor`` subclasses.
+        """
+
     @final
-    def run(self) -> None:
-        """Recursively visits all ``ast`` nodes. Then executes post hook."""
-        self.visit(self.tree)
+    def finish(self) -> None:
+        """Executes post hook, when all nodes have been visited."""
         self._post_visit()
 
+    @final
+    def run(self) -> None:
+        """Visits all ``ast`` nodes one by one. Then executes post hook."""
+        for node in self.index.nodes:
+            node_handler = self.handlers.get(node.__class__)
+            if node_handler is not None:
+                node_handler(self, node)
+        self.finish()
+
+
+class SummarizedNodeVisitor(BaseNodeVisitor):
+    """
+    Checks module-level metrics, like the number of module members.
+
+    Handlers of these visitors only collect metrics of the visited nodes.
+    Then ``summarize()`` returns them as a small tuple of numbers,
+    usually a ``NamedTuple``, and ``merge()`` checks metrics of the whole
+    module combined from the summaries of all its parts.
+    Summaries are read back from the cache as plain tuples,
+    so ``merge()`` creates its ``NamedTuple`` from them again.
+
+    When the whole module is visited, there's only a single part.
+    When incremental checks are used, each top-level function and class
+    is a separate part. Their summaries are cached together with
+    their violations, so unchanged definitions are not visited again,
+    see :mod:`wemake_python_styleguide.incremental`.
+
+    Attributes:
+        summaries: when it is set, summary of the visited part is stored
+            there by the visitor class name and nothing is merged.
+
+    """
+
+    summaries: Optional[Summaries] = None
+
+    def summarize(self) -> Summary:
+        """
+        Returns metrics of the visited part of the module.
+
+        Violations that depend only on this part are reported here.
+        This method should be defined in all subclasses.
+        """
+        raise NotImplementedError('Should be defined in a subclass')
+
+    def merge(self, summaries: Sequence[Summary]) -> None:
+        """
+        Checks metrics of the whole module combined from its parts.
+
+        This method should be defined in all subclasses.
+        """
+        raise NotImplementedError('Should be defined in a subclass')
+
+    @final
+    def _post_visit(self) -> None:
+        summary = self.summarize()
+        if self.summaries is None:
+            self.merge([summary])
+        else:
+            self.summaries[type(self).__qualname__] = summary
+
 
 class BaseFilenameVisitor(BaseVisitor):
     """
@@ -181,6 +428,8 @@ class BaseTokenVisitor(BaseVisitor):
 
     """
 
+    _token_handlers: ClassVar[Dict[int, TokenClassHandler]] = {}
+
     def __init__(
         self,
         options: ConfigurationOptions,
@@ -191,6 +440,16 @@ class BaseTokenVisitor(BaseVisitor):
         super().__init__(options, **kwargs)
         self.file_tokens = file_tokens
 
+    @classmethod
+    def collect_handlers(cls) -> None:
+        """Maps token types to ``visit_`` methods with the same names."""
+        handlers: Dict[int, TokenClassHandler] = {}
+        for name in _find_handler_names(cls):
+            token_type = _TOKEN_TYPES.get(name)
+            if token_type is not None:
+                handlers[token_type] = getattr(cls, 'visit_' + name)
+        cls._token_handlers = handlers
+
     @final
     @classmethod
     def from_checker(
@@ -204,6 +463,15 @@ class BaseTokenVisitor(BaseVisitor):
             file_tokens=checker.file_tokens,
         )
 
+    @final
+    def get_handlers(self) -> Dict[int, TokenHandler]:
+        """Returns bound handlers for all token types this visitor handles."""
+        return {
+            token_type: MethodType(token_handler, self)
+            for token_type, token_handler in self._token_handlers.items()
+        }
+
+    @final
     def visit(self, token: tokenize.TokenInfo) -> None:
         """
         Runs custom defined handlers in a visitor for each specific token type.
@@ -219,10 +487,9 @@ class BaseTokenVisitor(BaseVisitor):
             https://docs.python.org/3/library/tokenize.html
 
         """
-        token_type = tokenize.tok_name[token.exact_type].lower()
-        method = getattr(self, 'visit_' + token_type, None)
-        if method is not None:
-            method(token)
+        token_handler = self._token_handlers.get(token.exact_type)
+        if token_handler is not None:
+            token_handler(self, token)
 
     @final
     def run(self) -> None:
@@ -1,12 +1,16 @@
 # -*- coding: utf-8 -*-
 
-from typing import Callable, Iterable
+from typing import Callable, Iterable, Type, TypeVar
+
+from wemake_python_styleguide.visitors.base import BaseVisitor
+
+_VisitorClass = TypeVar('_VisitorClass', bound=Type[BaseVisitor])
 
 
 def alias(
     original: str,
     aliases: Iterable[str],
-) -> Callable[[type], type]:
+) -> Callable[[_VisitorClass], _VisitorClass]:
     """
     Decorator to alias handlers.
 
@@ -16,10 +20,14 @@ def alias(
 
     We can just create aliases like ``visit_Import = visit_ImportFrom``,
     but it looks verbose and ugly.
+
+    Handlers are collected when visitor class is created.
+    So, we collect them once again to respect the new aliases.
     """
-    def decorator(cls: type) -> type:
+    def decorator(cls: _VisitorClass) -> _VisitorClass:
         original_handler = getattr(cls, original)
         for alias in aliases:
             setattr(cls, alias, original_handler)
+        cls.collect_handlers()
         return cls
     return decorator
@@ -1,5 +1,7 @@
 # -*- coding: utf-8 -*-
 
+from typing import ClassVar
+
 from wemake_python_styleguide import constants
 from wemake_python_styleguide.logics.naming import access, logical
 from wemake_python_styleguide.types import final
@@ -12,13 +14,26 @@ from wemake_python_styleguide.violations.naming import (
     WrongModuleNamePatternViolation,
     WrongModuleNameViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseFilenameVisitor
+from wemake_python_styleguide.visitors.base import (
+    BaseFilenameVisitor,
+    ViolationClasses,
+)
 
 
 @final
 class WrongModuleNameVisitor(BaseFilenameVisitor):
     """Checks that modules have correct names."""
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        WrongModuleNameViolation,
+        WrongModuleMagicNameViolation,
+        PrivateNameViolation,
+        TooShortNameViolation,
+        WrongModuleNamePatternViolation,
+        ConsecutiveUnderscoresInNameViolation,
+        UnderscoredNumberNameViolation,
+    )
+
     def _check_module_name(self) -> None:
         if logical.is_wrong_name(self.stem, constants.MODULE_NAMES_BLACKLIST):
             self.add_violation(WrongModuleNameViolation())
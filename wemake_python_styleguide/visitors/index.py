@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+
+"""
+Per-file index of ``ast`` nodes, that is shared by all visitors.
+
+It is built once per file with a single traversal.
+Then visitors can use it instead of walking the tree once again.
+
+We also use it to link nodes with their parents.
+We do not set any attributes on nodes, we store links in the index.
+So, we do not depend on other plugins that might do it for us.
+
+Questions like "does this function contain ``yield``?" are answered
+from summaries built once per file, instead of walking subtrees again.
+
+.. currentmodule:: wemake_python_styleguide.visitors.index
+
+.. autoclass:: NodeIndex
+   :members:
+
+.. autoclass:: SubtreeIndex
+   :members:
+
+"""
+
+import ast
+from collections import defaultdict
+from typing import (
+    ClassVar,
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Set,
+    Type,
+)
+
+from wemake_python_styleguide.logics.functions import get_methods_types
+from wemake_python_styleguide.logics.nodes import walk_with_parents
+from wemake_python_styleguide.types import AnyNodes, final
+
+
+@final
+class SubtreeIndex(object):
+    """
+    Answers questions about the contents of subtrees.
+
+    Nodes that contain given types are found once for each set of types:
+    we go up from each node of these types to the first marked parent.
+    So, each node is marked only once and each question is a lookup.
+    """
+
+    def __init__(self, index: 'NodeIndex') -> None:
+        """Creates empty summaries of the given index."""
+        self._index = index
+        self._containers: Dict[
+            FrozenSet[Type[ast.AST]], Set[ast.AST],
+        ] = {}
+
+    def contains(
+        self,
+        node: ast.AST,
+        node_types: Iterable[Type[ast.AST]],
+    ) -> bool:
+        """Tells whether the node or any of its children has given types."""
+        node_types = frozenset(node_types)
+        containers = self._containers.get(node_types)
+        if containers is None:
+            containers = self._find_containers(node_types)
+            self._containers[node_types] = containers
+        return node in containers
+
+    def _find_containers(
+        self,
+        node_types: FrozenSet[Type[ast.AST]],
+    ) -> Set[ast.AST]:
+        containers: Set[ast.AST] = set()
+        for node_type in node_types:
+            for node in self._index.get(node_type):
+                parent: Optional[ast.AST] = node
+                while parent is not None and parent not in containers:
+                    containers.add(parent)
+                    parent = self._index.get_parent(parent)
+        return containers
+
+
+@final
+class NodeIndex(object):
+    """
+    Maps node types to the nodes of this type in source order.
+
+    Source order here is the order in which ``ast.NodeVisitor``
+    visits nodes: depth-first pre-order.
+
+    Attributes:
+        nodes: all nodes of the tree in source order.
+        subtrees: summaries of the subtrees of these nodes.
+
+    """
+
+    _context_nodes: ClassVar[AnyNodes] = (
+        ast.FunctionDef,
+        ast.AsyncFunctionDef,
+        ast.ClassDef,
+    )
+
+    def __init__(self, tree: ast.AST) -> None:
+        """Walks the tree and indexes all its nodes."""
+        self.nodes: List[ast.AST] = []
+        self._by_type: DefaultDict[
+            Type[ast.AST], List[ast.AST],
+        ] = defaultdict(list)
+        self._parents: Dict[ast.AST, Optional[ast.AST]] = {}
+        self._contexts: Dict[ast.AST, Optional[ast.AST]] = {}
+        self._function_types: Dict[ast.AST, str] = {}
+        self.subtrees = SubtreeIndex(self)
+
+        for node, parent in walk_with_parents(tree):
+            self.nodes.append(node)
+            self._by_type[node.__class__].append(node)
+            self._link(node, parent)
+
+    def _link(self, node: ast.AST, parent: Optional[ast.AST]) -> None:
+        self._parents[node] = parent
+        if isinstance(parent, self._context_nodes):
+            self._contexts[node] = parent
+        elif parent is not None:
+            self._contexts[node] = self._contexts.get(parent)
+
+        if isinstance(node, ast.ClassDef):
+            self._function_types.update(get_methods_types(node))
+
+    def get(self, node_type: Type[ast.AST]) -> Sequence[ast.AST]:
+        """Returns all nodes of the exact given type in source order."""
+        return self._by_type.get(node_type, [])
+
+    def contains_any(self, node_types: Iterable[Type[ast.AST]]) -> bool:
+        """Tells whether there's any node of the given exact types."""
+        return any(node_type in self._by_type for node_type in node_types)
+
+    def get_parent(self, node: ast.AST) -> Optional[ast.AST]:
+        """Returns direct parent of the node, ``None`` for the root node."""
+        return self._parents.get(node)
+
+    def get_context(self, node: ast.AST) -> Optional[ast.AST]:
+        """
+        Returns the closest function or class that contains this node.
+
+        Returns ``None`` for module level nodes.
+        """
+        return self._contexts.get(node)
+
+    def get_function_type(self, node: ast.AST) -> str:
+        """
+        Returns the type of a function definition.
+
+        It is ``function`` for regular functions.
+        For functions inside classes it is ``method``,
+        ``classmethod``, or ``staticmethod``.
+        """
+        return self._function_types.get(node, 'function')
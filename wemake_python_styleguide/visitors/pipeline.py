@@ -0,0 +1,219 @@
+# -*- coding: utf-8 -*-
+
+"""
+Pipelines run several visitors together, sharing a single traversal.
+
+Each visitor can be run on its own with ``run()`` method.
+But, running each visitor separately means that we have to walk over
+the whole ``ast`` tree once per visitor.
+That's the slowest part of the whole plugin.
+
+So, the checker uses pipelines instead.
+
+.. currentmodule:: wemake_python_styleguide.visitors.pipeline
+
+.. autofunction:: build_index
+
+.. autofunction:: run_visitor
+
+.. autoclass:: NodePipeline
+   :members:
+
+.. autoclass:: TokenPipeline
+   :members:
+
+"""
+
+import ast
+import tokenize
+from collections import defaultdict
+from typing import (
+    DefaultDict,
+    Dict,
+    FrozenSet,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+from wemake_python_styleguide.profiling.profile import FileProfile, span
+from wemake_python_styleguide.types import final
+from wemake_python_styleguide.visitors.base import (
+    BaseNodeVisitor,
+    BaseTokenVisitor,
+    BaseVisitor,
+    BoundHandler,
+    TokenHandler,
+)
+from wemake_python_styleguide.visitors.index import NodeIndex
+
+#: Operators mapped to their token types, it is missing in ``typeshed``.
+_EXACT_TOKEN_TYPES: Dict[str, int] = getattr(tokenize, 'EXACT_TOKEN_TYPES')
+
+#: Exact operator token types, their regular type is just ``OP``.
+_OPERATOR_TYPES: FrozenSet[int] = frozenset(_EXACT_TOKEN_TYPES.values())
+
+
+def build_index(
+    tree: ast.AST,
+    profile: Optional[FileProfile] = None,
+) -> NodeIndex:
+    """Builds the index of nodes shared by all ``ast`` based visitors."""
+    with span(profile, 'NodeIndex', 'index'):
+        return NodeIndex(tree)
+
+
+def run_visitor(
+    visitor: BaseVisitor,
+    profile: Optional[FileProfile] = None,
+) -> None:
+    """Runs a single visitor that is not a part of any pipeline."""
+    if profile is None:
+        visitor.run()
+    else:
+        profile.wrap_hook(visitor, visitor.run)()
+
+
+@final
+class NodePipeline(object):
+    """
+    Runs several ``ast`` based visitors with a single tree traversal.
+
+    The traversal is done once, when :class:`.NodeIndex` is built.
+    Each node is passed only to the visitors that have a handler for it.
+    Visitors that redefine ``visit()`` itself receive all nodes.
+
+    Visitors that have a handler for just a single node type
+    do not take part in the traversal at all.
+    They only iterate the nodes of this type from the index.
+
+    Handlers for a single node and post hooks are executed
+    in the same order the visitors were passed.
+    So, the result is the same as running all visitors one by one.
+
+    When the profile is passed, handlers and post hooks are wrapped
+    to record the time and the number of nodes of each visitor.
+    The traversal, each indexed visitor, and each post hook are traced.
+    """
+
+    def __init__(
+        self,
+        visitors: Sequence[BaseNodeVisitor],
+        profile: Optional[FileProfile] = None,
+    ) -> None:
+        """Creates new pipeline for the given visitor instances."""
+        self.visitors = visitors
+        self._profile = profile
+        self._handlers: Dict[Type[ast.AST], List[BoundHandler]] = {}
+        self._walking: List[BaseNodeVisitor] = []
+        self._indexed: List[Tuple[str, Type[ast.AST], BoundHandler]] = []
+
+        for visitor in visitors:
+            node_types = visitor.handlers.node_types
+            if node_types is not None and len(node_types) == 1:
+                node_type = next(iter(node_types))
+                node_handler = visitor.handlers.bind(visitor, node_type)
+                if node_handler is not None:  # pragma: no branch
+                    self._indexed.append((
+                        type(visitor).__qualname__,
+                        node_type,
+                        self._bind(visitor, node_handler),
+                    ))
+            else:
+                self._walking.append(visitor)
+
+    def _find_handlers(self, node_type: Type[ast.AST]) -> List[BoundHandler]:
+        handlers = []
+        for visitor in self._walking:
+            node_handler = visitor.handlers.bind(visitor, node_type)
+            if node_handler is not None:
+                handlers.append(self._bind(visitor, node_handler))
+
+        self._handlers[node_type] = handlers
+        return handlers
+
+    def _bind(
+        self,
+        visitor: BaseNodeVisitor,
+        node_handler: BoundHandler,
+    ) -> BoundHandler:
+        if self._profile is None:
+            return node_handler
+        return self._profile.wrap_handler(visitor, node_handler)
+
+    def _run_walking(self, index: NodeIndex) -> None:
+        for node in index.nodes:
+            handlers = self._handlers.get(node.__class__)
+            if handlers is None:
+                handlers = self._find_handlers(node.__class__)
+
+            for node_handler in handlers:
+                node_handler(node)
+
+    def _run_indexed(self, index: NodeIndex) -> None:
+        for name, node_type, node_handler in self._indexed:
+            with span(self._profile, name, 'indexed'):
+                for node in index.get(node_type):
+                    node_handler(node)
+
+    def run(self, index: NodeIndex) -> None:
+        """Visits all indexed ``ast`` nodes. Then executes all post hooks."""
+        with span(self._profile, 'NodePipeline', 'pipeline'):
+            self._run_walking(index)
+
+        self._run_indexed(index)
+        for visitor in self.visitors:
+            if self._profile is None:
+                visitor.finish()
+            else:
+                self._profile.wrap_hook(visitor, visitor.finish)()
+
+
+@final
+class TokenPipeline(object):
+    """
+    Runs several ``tokenize`` based visitors with a single loop over tokens.
+
+    Each token is passed only to the visitors that have a handler for it.
+    Tokens that no visitor is interested in are skipped
+    by checking their regular type, before computing ``.exact_type``.
+
+    When the profile is passed, handlers are wrapped
+    to record the time and the number of tokens of each visitor.
+    The loop itself is traced.
+    """
+
+    def __init__(
+        self,
+        visitors: Sequence[BaseTokenVisitor],
+        profile: Optional[FileProfile] = None,
+    ) -> None:
+        """Creates new pipeline for the given visitor instances."""
+        self.visitors = visitors
+        self._profile = profile
+        self._handlers: DefaultDict[
+            int, List[TokenHandler],
+        ] = defaultdict(list)
+
+        for visitor in visitors:
+            for token_type, token_handler in visitor.get_handlers().items():
+                if profile is not None:
+                    token_handler = profile.wrap_handler(visitor, token_handler)
+                self._handlers[token_type].append(token_handler)
+
+        self._token_types = frozenset(
+            tokenize.OP if token_type in _OPERATOR_TYPES else token_type
+            for token_type in self._handlers
+        )
+
+    def run(self, file_tokens: Sequence[tokenize.TokenInfo]) -> None:
+        """Visits all tokens that have at least one handler."""
+        with span(self._profile, 'TokenPipeline', 'pipeline'):
+            for token in file_tokens:
+                if token.type not in self._token_types:
+                    continue
+
+                for token_handler in self._handlers.get(token.exact_type, ()):
+                    token_handler(token)
@@ -24,13 +24,21 @@ from wemake_python_styleguide.violations.best_practices import (
     WrongDocCommentViolation,
     WrongMagicCommentViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseTokenVisitor
+from wemake_python_styleguide.visitors.base import (
+    BaseTokenVisitor,
+    ViolationClasses,
+)
 
 
 @final
 class WrongCommentVisitor(BaseTokenVisitor):
     """Checks comment tokens."""
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        WrongMagicCommentViolation,
+        WrongDocCommentViolation,
+    )
+
     noqa_check: ClassVar[Pattern] = re.compile(r'^noqa:?($|[A-Z\d\,\s]+)')
     type_check: ClassVar[Pattern] = re.compile(
         r'^type:\s?([\w\d\[\]\'\"\.]+)$',
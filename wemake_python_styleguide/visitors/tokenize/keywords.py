@@ -2,18 +2,26 @@
 
 import keyword
 import tokenize
+from typing import ClassVar
 
 from wemake_python_styleguide.types import final
 from wemake_python_styleguide.violations.consistency import (
     MissingSpaceBetweenKeywordAndParenViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseTokenVisitor
+from wemake_python_styleguide.visitors.base import (
+    BaseTokenVisitor,
+    ViolationClasses,
+)
 
 
 @final
 class WrongKeywordTokenVisitor(BaseTokenVisitor):
     """Visits keywords and finds violations related to their usage."""
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        MissingSpaceBetweenKeywordAndParenViolation,
+    )
+
     def _check_space_before_open_paren(self, token: tokenize.TokenInfo) -> None:
         if token.line[token.end[1]:].startswith('('):
             self.add_violation(
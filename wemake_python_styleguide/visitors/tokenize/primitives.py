@@ -10,13 +10,23 @@ from wemake_python_styleguide.violations.consistency import (
     UnderscoredNumberViolation,
     UnicodeStringViolation,
 )
-from wemake_python_styleguide.visitors.base import BaseTokenVisitor
+from wemake_python_styleguide.visitors.base import (
+    BaseTokenVisitor,
+    ViolationClasses,
+)
 
 
 @final
 class WrongPrimitivesVisitor(BaseTokenVisitor):
     """Visits primitive types to find incorrect usages."""
 
+    possible_violations: ClassVar[ViolationClasses] = (
+        UnicodeStringViolation,
+        UnderscoredNumberViolation,
+        PartialFloatViolation,
+        BadNumberSuffixViolation,
+    )
+
     _bad_number_suffixes: ClassVar[FrozenSet[str]] = frozenset((
         'X', 'O', 'B', 'E',
     ))